@@ -0,0 +1,302 @@
+"""
+Offline benchmark of the validation and conversion stages on synthetic GLB files.
+
+Every case is generated locally, so no network or Objaverse access is needed:
+
+- clean: a closed UV sphere.
+- self_intersecting: a sphere overlapped by a slightly tilted copy of itself, so
+  most faces cut through another face.
+- degenerate: a sphere with 1% of its faces collapsed to zero area.
+- multi_mesh: eight spheres placed by separate scene nodes.
+
+Each GLB also embeds a texture image referenced by one PBR material. The suite times
+`GLBMeshValidator.validate` (with the per-check breakdown), `extract_pbr_textures`,
+the OBJ export and the whole `validate_and_convert_glb` stage, and writes the medians
+to a JSON file so runs can be compared.
+
+Usage:
+    python benchmarks/benchmark_pipeline.py --faces 1000 4000 16000 64000 \
+        --repeat 3 --output benchmarks/results.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import statistics
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import main as pipeline
+from glb_checker.glb_asset import GLBAsset
+from glb_checker.glb_header import CHUNK_BIN, CHUNK_JSON, GLB_MAGIC
+from glb_checker.glb_validator import GLBMeshValidator
+from pbr_extraction.texture_extractor import extract_pbr_textures
+
+FACE_COUNTS = (1000, 4000, 16000, 64000)
+CASES = ("clean", "self_intersecting", "degenerate", "multi_mesh")
+IMAGE_BYTES = 1 << 20
+
+
+def sphere_count(target_faces):
+    """Returns the largest UV sphere segment count with at most `target_faces` faces."""
+    count = 4
+    while len(trimesh.creation.uv_sphere(count=[count + 1] * 2).faces) <= target_faces:
+        count += 1
+    return count
+
+
+def sphere_with_faces(target_faces):
+    """Returns the finest UV sphere with at most `target_faces` faces."""
+    count = sphere_count(target_faces)
+    return trimesh.creation.uv_sphere(count=[count, count])
+
+
+def self_intersecting_sphere(target_faces, overlap=1.0):
+    """
+    Returns a sphere whose upper `overlap` fraction is duplicated and tilted.
+
+    The copy is tilted by half a segment, so nearly every copied face cuts through the
+    original surface whatever the resolution. With the default full copy over 90% of
+    the faces collide, well above `GLBMeshValidator.SEVERITY_THRESHOLD`.
+    """
+    count = sphere_count(target_faces / (1 + overlap))
+    sphere = trimesh.creation.uv_sphere(count=[count, count])
+    heights = sphere.triangles_center[:, 2]
+    copy = sphere.submesh([heights >= np.quantile(heights, 1 - overlap)], append=True)
+    copy.apply_transform(
+        trimesh.transformations.rotation_matrix(0.5 * np.pi / count, [1, 0, 0])
+    )
+    return trimesh.util.concatenate([sphere, copy])
+
+
+def degenerate_sphere(target_faces, fraction=0.01):
+    """Returns a sphere with `fraction` of its faces collapsed onto a single point."""
+    sphere = sphere_with_faces(target_faces)
+    count = max(1, int(len(sphere.faces) * fraction))
+    # Each collapsed face gets three new vertices at the same position
+    collapsed = np.repeat(sphere.vertices[:count], 3, axis=0)
+    vertices = np.vstack([sphere.vertices, collapsed])
+    faces = sphere.faces.copy()
+    faces[:count] = len(sphere.vertices) + np.arange(3 * count).reshape(-1, 3)
+    return trimesh.Trimesh(vertices, faces, process=False)
+
+
+def multi_mesh_scene(target_faces, count=8):
+    """Returns a scene of `count` spheres, each placed by its own node."""
+    scene = trimesh.Scene()
+    for i in range(count):
+        scene.add_geometry(
+            sphere_with_faces(target_faces / count),
+            node_name=f"sphere_{i}",
+            transform=trimesh.transformations.translation_matrix([3.0 * i, 0, 0]),
+        )
+    return scene
+
+
+def build_case(case, target_faces):
+    if case == "clean":
+        return sphere_with_faces(target_faces)
+    if case == "self_intersecting":
+        return self_intersecting_sphere(target_faces)
+    if case == "degenerate":
+        return degenerate_sphere(target_faces)
+    if case == "multi_mesh":
+        return multi_mesh_scene(target_faces)
+    raise ValueError(f"Unknown benchmark case: {case}")
+
+
+def textured_glb(geometry, image_bytes=IMAGE_BYTES):
+    """
+    Exports geometry to GLB with an embedded image used by one PBR material.
+
+    The image bytes are random, since the pipeline copies embedded images without
+    decoding them.
+    """
+    data = trimesh.Scene(geometry).export(file_type="glb")
+    asset = GLBAsset("synthetic.glb", data=data)
+    header = asset.header
+    binary = bytes(asset.binary)
+    binary += b"\x00" * (-len(binary) % 4)
+
+    image = b"\x89PNG\r\n\x1a\n" + np.random.default_rng(0).bytes(image_bytes)
+    header.setdefault("bufferViews", []).append(
+        {"buffer": 0, "byteOffset": len(binary), "byteLength": len(image)}
+    )
+    header.setdefault("images", []).append(
+        {"bufferView": len(header["bufferViews"]) - 1, "mimeType": "image/png"}
+    )
+    header.setdefault("textures", []).append({"source": len(header["images"]) - 1})
+    texture = {"index": len(header["textures"]) - 1}
+    header["materials"] = [
+        {
+            "pbrMetallicRoughness": {
+                "baseColorTexture": texture,
+                "metallicFactor": 0.0,
+            },
+            "normalTexture": texture,
+        }
+    ]
+    for mesh in header.get("meshes", []):
+        for primitive in mesh["primitives"]:
+            primitive["material"] = 0
+
+    binary += image
+    binary += b"\x00" * (-len(binary) % 4)
+    header["buffers"] = [{"byteLength": len(binary)}]
+
+    json_chunk = json.dumps(header).encode()
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    return (
+        struct.pack("<III", GLB_MAGIC, 2, length)
+        + struct.pack("<II", len(json_chunk), CHUNK_JSON)
+        + json_chunk
+        + struct.pack("<II", len(binary), CHUNK_BIN)
+        + binary
+    )
+
+
+def summarize(durations):
+    return {
+        "median": statistics.median(durations),
+        "min": min(durations),
+        "max": max(durations),
+    }
+
+
+def timed_runs(function, repeat):
+    """Calls `function` `repeat` times; returns the durations and the last result."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        durations.append(time.perf_counter() - start)
+    return durations, result
+
+
+def benchmark_file(glb_path, work_dir, repeat):
+    """
+    Times every stage on one GLB file.
+
+    Each repetition starts from a fresh GLBAsset, so reading and decoding the file
+    are part of the measured time, as they are in the pipeline.
+    """
+    check_timings = []
+
+    def validate():
+        validator = GLBMeshValidator(GLBAsset(glb_path))
+        result = validator.validate()
+        check_timings.append(validator.timings)
+        return result
+
+    validate_durations, (is_valid, errors) = timed_runs(validate, repeat)
+    checks = {
+        name: statistics.median(timings[name] for timings in check_timings)
+        for name in check_timings[0]
+    }
+
+    extract_durations, materials = timed_runs(
+        lambda: extract_pbr_textures(
+            GLBAsset(glb_path), image_dir=work_dir / "textures"
+        ),
+        repeat,
+    )
+    export_durations, _ = timed_runs(
+        lambda: GLBAsset(glb_path).scene.export(work_dir / "mesh.obj"), repeat
+    )
+
+    def convert():
+        # Outputs are staged and renamed into <save_dir>/<index> on success
+        return pipeline.validate_and_convert_glb(
+            ("converted", glb_path.stem, glb_path, work_dir)
+        )
+
+    convert_durations, (_, _, converted, _) = timed_runs(convert, repeat)
+
+    return {
+        "valid": is_valid,
+        "errors": errors,
+        "converted": converted,
+        "validate": summarize(validate_durations),
+        "checks": checks,
+        "extract_pbr_textures": summarize(extract_durations),
+        "materials": len(materials),
+        "export_obj": summarize(export_durations),
+        "validate_and_convert_glb": summarize(convert_durations),
+    }
+
+
+def run_benchmarks(
+    face_counts=FACE_COUNTS, cases=CASES, repeat=3, image_bytes=IMAGE_BYTES
+):
+    """
+    Runs every case at every face count.
+
+    Returns:
+        dict: The environment and one result per (case, face count).
+    """
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for target_faces in face_counts:
+            for case in cases:
+                work_dir = Path(tmp) / f"{case}_{target_faces}"
+                work_dir.mkdir()
+                geometry = build_case(case, target_faces)
+                glb_path = work_dir / f"{case}.glb"
+                glb_path.write_bytes(textured_glb(geometry, image_bytes))
+
+                scene = GLBAsset(glb_path).scene
+                result = {
+                    "case": case,
+                    "target_faces": target_faces,
+                    "faces": sum(len(g.faces) for g in scene.geometry.values()),
+                    "file_bytes": glb_path.stat().st_size,
+                    **benchmark_file(glb_path, work_dir, repeat),
+                }
+                results.append(result)
+                print(
+                    f"{case:>18} {result['faces']:>7} faces: "
+                    f"validate {result['validate']['median']:.3f}s, "
+                    f"convert {result['validate_and_convert_glb']['median']:.3f}s"
+                )
+
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "numpy": np.__version__,
+        "trimesh": trimesh.__version__,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--faces", type=int, nargs="+", default=list(FACE_COUNTS))
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--image-bytes", type=int, default=IMAGE_BYTES)
+    parser.add_argument("--output", default="benchmarks/results.json")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    # Rejections are expected for most cases; keep the pipeline logs quiet
+    logging.basicConfig(level=logging.ERROR)
+    args = parse_args()
+    report = run_benchmarks(args.faces, args.cases, args.repeat, args.image_bytes)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=4)
+    print(f"Results written to {args.output}")
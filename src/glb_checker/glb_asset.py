@@ -0,0 +1,128 @@
+import hashlib
+import io
+import json
+import struct
+from pathlib import Path
+
+import trimesh
+
+from .glb_header import CHUNK_BIN, PREAMBLE_SIZE, parse_glb_preamble, read_glb_json
+from .scene_merge import merge_scene
+
+
+class GLBAsset:
+    """
+    A GLB file read from disk once and shared by every pipeline stage.
+
+    The file bytes are read a single time, and the BIN chunk and its
+    bufferViews are handed out as memoryview slices of the original bytes
+    rather than copies. The JSON chunk is parsed twice: once for `header`, and
+    once more by trimesh when it decodes the scene. The decoded trimesh scene
+    is built from the bytes in memory on first access and cached, so the
+    validator, the texture extractor and the OBJ exporter all share it.
+
+    Accessing only `header` reads just the JSON chunk from disk, so files
+    rejected from their header never have their BIN chunk read. A content hash
+    computed earlier, e.g. by the download, can be passed in so it is not
+    computed from the file again.
+    """
+
+    def __init__(self, path, data=None, content_hash=None):
+        self.path = Path(path)
+        self._data = data
+        self._header = None
+        self._binary = None
+        self._scene = None
+        self._merged = None
+        self._content_hash = content_hash
+
+    @property
+    def data(self):
+        """memoryview: The raw GLB file contents."""
+        if self._data is None:
+            self._data = self.path.read_bytes()
+        return memoryview(self._data)
+
+    @property
+    def content_hash(self):
+        """str: SHA-256 hex digest of the file contents."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.data).hexdigest()
+        return self._content_hash
+
+    @property
+    def has_content_hash(self):
+        """bool: Whether `content_hash` is known without reading the whole file."""
+        return self._content_hash is not None or self._data is not None
+
+    @property
+    def header(self):
+        """dict: The parsed glTF JSON chunk."""
+        if self._header is None:
+            if self._data is None:
+                self._header = read_glb_json(self.path)
+            else:
+                self._parse_chunks()
+        return self._header
+
+    @property
+    def binary(self):
+        """memoryview: The BIN chunk, empty if the file has none."""
+        if self._binary is None:
+            self._parse_chunks()
+        return self._binary
+
+    def buffer_view(self, index):
+        """
+        Returns the bytes of a bufferView as a zero-copy slice of the BIN chunk.
+
+        Args:
+            index (int): Index into the glTF `bufferViews` array.
+
+        Returns:
+            memoryview: The bufferView bytes.
+        """
+        view = self.header["bufferViews"][index]
+        start = view.get("byteOffset", 0)
+        return self.binary[start : start + view["byteLength"]]
+
+    @property
+    def scene(self):
+        """trimesh.Scene: The decoded geometry, loaded once from the bytes in memory."""
+        if self._scene is None:
+            self._scene = self._decode_scene()
+        return self._scene
+
+    @property
+    def merged(self):
+        """trimesh.Trimesh or None: The scene flattened into one mesh, built once."""
+        if self._merged is None:
+            self._merged = merge_scene(self.scene)
+        return self._merged
+
+    def _parse_chunks(self):
+        data = self.data
+        length, json_length = parse_glb_preamble(data[:PREAMBLE_SIZE])
+        json_end = PREAMBLE_SIZE + json_length
+
+        if self._header is None:
+            self._header = json.loads(str(data[PREAMBLE_SIZE:json_end], "utf-8"))
+        self._binary = data[0:0]
+
+        offset = json_end
+        end = min(length, len(data))
+        while offset + 8 <= end:
+            chunk_length, chunk_type = struct.unpack_from("<II", data, offset)
+            if chunk_type == CHUNK_BIN:
+                self._binary = data[offset + 8 : offset + 8 + chunk_length]
+                break
+            offset += 8 + chunk_length
+
+    def _decode_scene(self):
+        # Load from the bytes in memory, so the file is not read a second time.
+        # BytesIO shares an immutable bytes object instead of copying it. trimesh
+        # parses the JSON chunk again, which is cheap next to the geometry.
+        scene = trimesh.load(io.BytesIO(self.data.obj), file_type="glb")
+        if not isinstance(scene, trimesh.Scene):
+            scene = trimesh.Scene(scene)
+        return scene
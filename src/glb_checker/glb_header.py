@@ -0,0 +1,168 @@
+import json
+import struct
+
+GLB_MAGIC = 0x46546C67
+CHUNK_JSON = 0x4E4F534A
+CHUNK_BIN = 0x004E4942
+
+# Size of the 12-byte GLB header plus the 8-byte header of the JSON chunk
+PREAMBLE_SIZE = 20
+
+# Primitive modes from the glTF 2.0 specification
+MODE_TRIANGLES = 4
+MODE_TRIANGLE_STRIP = 5
+MODE_TRIANGLE_FAN = 6
+
+
+def referenced_meshes(header):
+    """
+    Returns the indices of the meshes instantiated by a node.
+
+    Args:
+        header (dict): The parsed glTF JSON.
+
+    Returns:
+        list: Sorted mesh indices. All meshes if the file declares no nodes.
+    """
+    nodes = header.get("nodes")
+    if not nodes:
+        return list(range(len(header.get("meshes", []))))
+    return sorted({node["mesh"] for node in nodes if "mesh" in node})
+
+
+def primitive_triangle_counts(header):
+    """
+    Computes the triangle count of every referenced mesh primitive from accessor counts.
+
+    No geometry is decoded: the counts come from the `indices` accessor, or the
+    `POSITION` accessor for non-indexed primitives. Point and line primitives count
+    as zero triangles.
+
+    Args:
+        header (dict): The parsed glTF JSON.
+
+    Returns:
+        list: The triangle count of each primitive.
+    """
+    accessors = header.get("accessors", [])
+    meshes = header.get("meshes", [])
+    counts = []
+    for mesh_index in referenced_meshes(header):
+        for primitive in meshes[mesh_index].get("primitives", []):
+            if "indices" in primitive:
+                count = accessors[primitive["indices"]]["count"]
+            elif "POSITION" in primitive.get("attributes", {}):
+                count = accessors[primitive["attributes"]["POSITION"]]["count"]
+            else:
+                count = 0
+
+            mode = primitive.get("mode", MODE_TRIANGLES)
+            if mode == MODE_TRIANGLES:
+                counts.append(count // 3)
+            elif mode in (MODE_TRIANGLE_STRIP, MODE_TRIANGLE_FAN):
+                counts.append(max(count - 2, 0))
+            else:
+                counts.append(0)
+    return counts
+
+
+def parse_glb_preamble(preamble):
+    """
+    Validates the GLB header and the JSON chunk header.
+
+    Args:
+        preamble (bytes-like): The first `PREAMBLE_SIZE` bytes of a GLB file.
+
+    Returns:
+        tuple: (total_length, json_length) in bytes, as declared by the file.
+    """
+    if len(preamble) < PREAMBLE_SIZE:
+        raise ValueError("File is too short to be a GLB.")
+
+    magic, version, length, json_length, chunk_type = struct.unpack_from(
+        "<IIIII", preamble, 0
+    )
+    if magic != GLB_MAGIC:
+        raise ValueError("Incorrect header on GLB file.")
+    if version != 2:
+        raise ValueError(f"Only glTF 2 is supported, not {version}.")
+    if chunk_type != CHUNK_JSON:
+        raise ValueError("GLB file does not start with a JSON chunk.")
+    return length, json_length
+
+
+def read_glb_json(path):
+    """
+    Reads and parses only the JSON chunk of a GLB file; the BIN chunk is never read.
+
+    Args:
+        path (str or Path): The path to the GLB file.
+
+    Returns:
+        dict: The parsed glTF JSON.
+    """
+    with open(path, "rb") as file:
+        _, json_length = parse_glb_preamble(file.read(PREAMBLE_SIZE))
+        chunk = file.read(json_length)
+    if len(chunk) != json_length:
+        raise ValueError("GLB JSON chunk is truncated.")
+    return json.loads(chunk)
+
+
+def summarize_glb_header(header):
+    """
+    Summarizes the structure of a glTF file from its JSON alone.
+
+    Args:
+        header (dict): The parsed glTF JSON.
+
+    Returns:
+        dict: A dictionary with the following key-value pairs:
+            - mesh_count: Number of meshes instantiated by a node.
+            - primitive_count: Number of primitives in those meshes.
+            - index_counts: Index accessor count of each primitive, None if not indexed.
+            - triangle_counts: Triangle count of each primitive.
+            - face_count: Total triangle count.
+            - material_count: Number of materials.
+            - texture_count: Number of textures.
+            - image_count: Number of images.
+            - has_textures: True if at least one texture references an image.
+    """
+    accessors = header.get("accessors", [])
+    meshes = header.get("meshes", [])
+    mesh_indices = referenced_meshes(header)
+    primitives = [
+        primitive
+        for mesh_index in mesh_indices
+        for primitive in meshes[mesh_index].get("primitives", [])
+    ]
+    triangle_counts = primitive_triangle_counts(header)
+    textures = header.get("textures", [])
+
+    return {
+        "mesh_count": len(mesh_indices),
+        "primitive_count": len(primitives),
+        "index_counts": [
+            accessors[primitive["indices"]]["count"] if "indices" in primitive else None
+            for primitive in primitives
+        ],
+        "triangle_counts": triangle_counts,
+        "face_count": sum(triangle_counts),
+        "material_count": len(header.get("materials", [])),
+        "texture_count": len(textures),
+        "image_count": len(header.get("images", [])),
+        "has_textures": any("source" in texture for texture in textures),
+    }
+
+
+def prescreen_glb(path):
+    """
+    Summarizes a GLB file by reading only its header and JSON chunk.
+
+    Args:
+        path (str or Path): The path to the GLB file.
+
+    Returns:
+        dict: See `summarize_glb_header`.
+    """
+    return summarize_glb_header(read_glb_json(path))
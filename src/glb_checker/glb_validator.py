@@ -1,32 +1,272 @@
 import trimesh
+import hashlib
+import json
 import logging
+import time
 import numpy as np
 from pathlib import Path
+from .glb_asset import GLBAsset
+from .glb_header import prescreen_glb, summarize_glb_header
+from .intersections import colliding_faces
+from .mesh_quality import face_quality, quality_summary
+from .scene_merge import merge_scene
+from .utils import file_sha256
 
 
 class GLBMeshValidator:
     MAX_FACES = 64000
     SEVERITY_THRESHOLD = 0.7
     OFFSET_SCALE_FACTOR = 5e-5
-
-    def __init__(self, mesh_path):
-        self.mesh_path = mesh_path
+    REQUIRE_TEXTURES = False
+    # Validate multi-object scenes as one mesh with node transforms applied, instead of
+    # rejecting them
+    MERGE_SCENES = False
+    # Face quality thresholds apply to the QUALITY_PERCENTILE worst faces, so a few
+    # outliers do not reject a mesh. None disables a threshold.
+    QUALITY_PERCENTILE = 95
+    EDGE_LENGTH_RANGE = None  # (min, max)
+    MAX_ASPECT_RATIO = None
+    MIN_ANGLE_DEGREES = None
+    # Ordered from cheapest to most expensive, so fail-fast validation rejects early
+    CHECKS = (
+        "check_empty_mesh",
+        "check_face_count",
+        "check_degenerate_faces",
+        "check_edge_lengths",
+        "check_aspect_ratio",
+        "check_normals_consistency",
+        "detect_severe_self_intersections",
+    )
+    # Raw measurements taken by each step before its thresholds are applied. They are
+    # stored with the validation cache, so new thresholds are re-decided from them in
+    # bulk without loading geometry, see `glb_checker.revalidation`.
+    MEASUREMENTS = {
+        "check_header_contents": ("declared_faces", "has_textures"),
+        "load_mesh": ("loaded",),
+        "check_empty_mesh": ("face_count",),
+        "check_face_count": ("face_count",),
+        "check_degenerate_faces": ("min_face_area",),
+        "check_edge_lengths": ("edge_length_low", "edge_length_high"),
+        "check_aspect_ratio": ("aspect_ratio_high", "min_angle_low"),
+        "check_normals_consistency": ("winding_consistent",),
+        "detect_severe_self_intersections": ("colliding_faces", "colliding_ratio"),
+    }
+    # Step -> version of the way it measures; 1 when absent. Bump it when a step's
+    # measurement changes, so values stored by the old code are measured again.
+    MEASUREMENT_VERSIONS = {}
+
+    def __init__(self, mesh_path, cache=None, fail_fast=True):
+        # A GLBAsset shares its already decoded scene instead of re-reading the file
+        self.asset = mesh_path if isinstance(mesh_path, GLBAsset) else None
+        self.mesh_path = self.asset.path if self.asset is not None else mesh_path
+        self.cache = cache
+        # Stop at the first failing check; disable to collect every error for diagnostics
+        self.fail_fast = fail_fast
         self.errors = []
+        # Set when a step raised instead of reaching a verdict, e.g. an unreadable file;
+        # such results are not cached and worth retrying
+        self.errored = False
+        # Seconds spent per step of the last validate() run, e.g. {"load_mesh": 0.12}
+        self.timings = {}
+        # Raw measurements of the last validate() run, e.g. {"face_count": 1280}
+        self.measurements = {}
+        self._header_summary = None
+        self._mesh = None
+        self._face_quality = None
+
+    def fingerprint(self):
+        """
+        Returns a digest of the validator configuration.
+
+        Any change to the thresholds, to the enabled checks or to the version of a
+        measurement changes the fingerprint, which invalidates results cached under the
+        previous configuration, so their measurements are taken again.
+        """
+        config = {
+            "MAX_FACES": self.MAX_FACES,
+            "SEVERITY_THRESHOLD": self.SEVERITY_THRESHOLD,
+            "OFFSET_SCALE_FACTOR": self.OFFSET_SCALE_FACTOR,
+            "REQUIRE_TEXTURES": self.REQUIRE_TEXTURES,
+            "MERGE_SCENES": self.MERGE_SCENES,
+            "QUALITY_PERCENTILE": self.QUALITY_PERCENTILE,
+            "EDGE_LENGTH_RANGE": self.EDGE_LENGTH_RANGE,
+            "MAX_ASPECT_RATIO": self.MAX_ASPECT_RATIO,
+            "MIN_ANGLE_DEGREES": self.MIN_ANGLE_DEGREES,
+            "CHECKS": list(self.CHECKS),
+            "MEASUREMENT_VERSIONS": self.MEASUREMENT_VERSIONS,
+            "fail_fast": self.fail_fast,
+        }
+        return hashlib.sha256(json.dumps(config, sort_keys=True).encode()).hexdigest()
+
+    def measurement_logic(self, name):
+        """
+        Returns a key of everything a stored measurement depends on besides thresholds.
+
+        The key holds the version of the step taking the measurement and the settings
+        that change what it measures, e.g. `OFFSET_SCALE_FACTOR` for the colliding face
+        ratio. A stored value under another key is stale.
+
+        Args:
+            name (str): A measurement name of `MEASUREMENTS`.
+        """
+        step = next(step for step, names in self.MEASUREMENTS.items() if name in names)
+        settings = {"step": step, "version": self.MEASUREMENT_VERSIONS.get(step, 1)}
+        if step != "check_header_contents":
+            settings["MERGE_SCENES"] = self.MERGE_SCENES
+        if step == "detect_severe_self_intersections":
+            settings["OFFSET_SCALE_FACTOR"] = self.OFFSET_SCALE_FACTOR
+        if step in ("check_edge_lengths", "check_aspect_ratio"):
+            settings["QUALITY_PERCENTILE"] = self.QUALITY_PERCENTILE
+        return json.dumps(settings, sort_keys=True)
+
+    def check_failures(self, step, values):
+        """
+        Applies the thresholds of a step to its raw measurements.
+
+        The comparisons work on scalars and on arrays alike, so measurements stored for
+        many meshes are re-decided in one vectorized pass by the same rules. NaN
+        measurements never fail.
+
+        Args:
+            step (str): A step of `MEASUREMENTS`.
+            values (dict): measurement name -> float or np.ndarray.
+
+        Returns:
+            bool or np.ndarray: True where the step fails.
+        """
+        if step == "check_header_contents":
+            fails = self.REQUIRE_TEXTURES & (values["has_textures"] == 0)
+            if self.fail_fast:
+                fails = fails | (values["declared_faces"] > self.MAX_FACES)
+            return fails
+        if step == "load_mesh":
+            return values["loaded"] == 0
+        if step == "check_empty_mesh":
+            return values["face_count"] == 0
+        if step == "check_face_count":
+            return values["face_count"] > self.MAX_FACES
+        if step == "check_degenerate_faces":
+            return values["min_face_area"] < 1e-10
+        if step == "check_edge_lengths":
+            if self.EDGE_LENGTH_RANGE is None:
+                return False
+            min_length, max_length = self.EDGE_LENGTH_RANGE
+            return (values["edge_length_low"] < min_length) | (
+                values["edge_length_high"] > max_length
+            )
+        if step == "check_aspect_ratio":
+            fails = False
+            if self.MAX_ASPECT_RATIO is not None:
+                fails = fails | (values["aspect_ratio_high"] > self.MAX_ASPECT_RATIO)
+            if self.MIN_ANGLE_DEGREES is not None:
+                fails = fails | (values["min_angle_low"] < self.MIN_ANGLE_DEGREES)
+            return fails
+        if step == "check_normals_consistency":
+            return values["winding_consistent"] == 0
+        if step == "detect_severe_self_intersections":
+            return values["colliding_ratio"] > self.SEVERITY_THRESHOLD
+        raise ValueError(f"Unknown validation step: {step}")
+
+    def check_error(self, step, values):
+        """
+        Returns the error message of a failed step from the measurements of one mesh.
+
+        Args:
+            step (str): A step of `MEASUREMENTS`.
+            values (dict): measurement name -> float.
+
+        Returns:
+            str: The error message.
+        """
+        if step == "check_header_contents":
+            if self.REQUIRE_TEXTURES and values["has_textures"] == 0:
+                return "Mesh has no textures."
+            return f"Too many faces ({int(values['declared_faces'])})."
+        if step == "load_mesh":
+            return "Mesh could not be loaded."
+        if step == "check_empty_mesh":
+            return "Mesh has no faces."
+        if step == "check_face_count":
+            return f"Too many faces ({int(values['face_count'])})."
+        if step == "check_degenerate_faces":
+            return "Mesh has degenerate faces."
+        if step == "check_edge_lengths":
+            if values["edge_length_low"] < self.EDGE_LENGTH_RANGE[0]:
+                return "Mesh has extremely short edges."
+            return "Mesh has extremely long edges."
+        if step == "check_aspect_ratio":
+            if (
+                self.MAX_ASPECT_RATIO is not None
+                and values["aspect_ratio_high"] > self.MAX_ASPECT_RATIO
+            ):
+                return "Mesh contains faces with high aspect ratios (thin or stretched)."
+            return "Mesh contains faces with very small angles."
+        if step == "check_normals_consistency":
+            return "Mesh has inconsistent face normal orientations."
+        if step == "detect_severe_self_intersections":
+            return (
+                "Severe self-intersections detected: "
+                f"{int(values['colliding_faces'])} faces."
+            )
+        raise ValueError(f"Unknown validation step: {step}")
+
+    def _decide(self, step, **values):
+        """Records the measurements of a step and applies its thresholds."""
+        self.measurements.update(values)
+        if self.check_failures(step, values):
+            self.errors.append(self.check_error(step, values))
+            return False
+        return True
+
+    def stored_measurements(self):
+        """Returns the measurements of the last run as {name: (logic key, value)}."""
+        return {
+            name: (self.measurement_logic(name), value)
+            for name, value in self.measurements.items()
+        }
+
+    def content_hash(self):
+        """Returns the SHA-256 of the mesh file contents."""
+        if self.asset is not None:
+            return self.asset.content_hash
+        return file_sha256(self.mesh_path)
 
     def load_mesh(self):
         """
-        Loads a mesh from the specified path.
+        Loads a mesh from the specified path, or takes it from the shared GLBAsset.
 
         Checks for the following issues:
 
         - Multiple objects in a scene (e.g., a GLTF file with more than one mesh)
         - Invalid mesh type
 
+        For GLB files the scene structure is checked from the JSON header first, so
+        empty and multi-object scenes are rejected without decoding any geometry.
+
+        With `MERGE_SCENES`, a scene is instead flattened into one mesh with its node
+        transforms applied, see `glb_checker.scene_merge.merge_scene`.
+
         Returns the loaded mesh if no issues are found.
         Returns None if any issues are found.
         """
+        summary = self.header_summary()
+        if summary is not None and not self.check_header_structure(summary):
+            return None
+
         try:
-            mesh = trimesh.load(self.mesh_path)
+            if self.asset is not None:
+                mesh = self.asset.scene
+            else:
+                mesh = trimesh.load(self.mesh_path)
+
+            if isinstance(mesh, trimesh.Scene) and self.MERGE_SCENES:
+                if self.asset is not None:
+                    merged = self.asset.merged
+                else:
+                    merged = merge_scene(mesh)
+                if merged is None:
+                    self.errors.append("Scene contains no meshes.")
+                return merged
 
             # Check for multiple objects in a scene (e.g., a GLTF file with more than one mesh)
             if isinstance(mesh, trimesh.Scene):
@@ -49,6 +289,7 @@ class GLBMeshValidator:
             return mesh
         except Exception as e:
             self.errors.append(f"Error loading mesh: {str(e)}")
+            self.errored = True
             return None
 
     def _extract_first_mesh_from_scene(self, scene):
@@ -73,44 +314,175 @@ class GLBMeshValidator:
         """
         Validates a mesh object against a set of criteria.
 
+        Checks run lazily in `CHECKS` order. By default validation stops at the first
+        failing check, and a GLB declaring more than `MAX_FACES` triangles in its JSON
+        header is rejected before any geometry is decoded. With `fail_fast=False` every
+        check runs and all errors are collected.
+
+        With a ValidationCache, a result stored for the same file contents and validator
+        fingerprint is returned without loading the mesh. Results of a run that errored,
+        see `errored`, are not stored. Files rejected from their JSON header are decided
+        before the cache lookup, which needs the hash of the whole file; their result is
+        only stored when that hash is known without reading the file, see
+        `GLBAsset.has_content_hash`.
+
         Returns:
             tuple: A tuple containing two elements:
                 - success (bool): True if the mesh is valid, False otherwise.
                 - error_messages (list): A list of error messages if the mesh is invalid.
         """
-        mesh = self.load_mesh()
+        if self.cache is None:
+            return self._run_checks()
+
+        if self.rejected_by_header():
+            is_valid, errors = self._run_checks()
+            if self.asset is not None and self.asset.has_content_hash:
+                self._store((self.content_hash(), self.fingerprint()), is_valid, errors)
+            return is_valid, errors
+
+        key = (self.content_hash(), self.fingerprint())
+        cached = self.cache.get(*key)
+        if cached is not None:
+            is_valid, self.errors = cached
+            return is_valid, self.errors
+
+        is_valid, errors = self._run_checks()
+        self._store(key, is_valid, errors)
+        return is_valid, errors
+
+    def _store(self, key, is_valid, errors):
+        if not self.errored:
+            self.cache.put(*key, is_valid, errors)
+            self.cache.put_measurements(key[0], self.stored_measurements())
+
+    def _timed(self, name, function, *args):
+        start = time.perf_counter()
+        try:
+            return function(*args)
+        finally:
+            self.timings[name] = time.perf_counter() - start
+
+    def _run_checks(self):
+        is_valid = True
+        summary = self._timed("header_summary", self.header_summary)
+        if summary is not None:
+            is_valid = self._timed(
+                "check_header_contents", self.check_header_contents, summary
+            )
+            if not is_valid and self.fail_fast:
+                return False, self.errors
+
+        mesh = self._timed("load_mesh", self.load_mesh)
+        self.measurements["loaded"] = float(bool(mesh))
         if not mesh:
             return False, self.errors
+        self._mesh = mesh
 
-        checks = [
-            self.check_face_count(mesh),
-            self.check_empty_mesh(mesh),
-            self.check_degenerate_faces(mesh),
-            self.detect_severe_self_intersections(mesh),
-            # self.check_edge_lengths(mesh),
-            # self.check_aspect_ratio(mesh),
-            self.check_normals_consistency(mesh),
-        ]
-        return all(checks), self.errors
+        for check in self.CHECKS:
+            if not self._timed(check, getattr(self, check), mesh):
+                is_valid = False
+                if self.fail_fast:
+                    break
+        return is_valid, self.errors
 
-    def check_face_count(self, mesh):
-        if len(mesh.faces) > self.MAX_FACES:
-            self.errors.append(f"Too many faces ({len(mesh.faces)}).")
+    def header_summary(self):
+        """
+        Summarizes a GLB file from its JSON chunk, without reading the BIN chunk.
+
+        Returns:
+            dict or None: See `glb_header.summarize_glb_header`. None for other file
+            types and for malformed headers, which are then reported by the full load.
+        """
+        if self._header_summary is None:
+            try:
+                if self.asset is not None:
+                    self._header_summary = summarize_glb_header(self.asset.header)
+                elif str(self.mesh_path).lower().endswith(".glb"):
+                    self._header_summary = prescreen_glb(self.mesh_path)
+            except Exception:
+                return None
+        return self._header_summary
+
+    def check_header_structure(self, summary):
+        """
+        Rejects empty and, unless `MERGE_SCENES` is set, multi-object scenes from the
+        header summary.
+
+        Returns:
+            bool: True if the file declares exactly one mesh primitive (at least one with
+            `MERGE_SCENES`), False otherwise.
+        """
+        error = self._header_structure_error(summary)
+        if error is not None:
+            self.errors.append(error)
             return False
         return True
 
-    def check_empty_mesh(self, mesh):
-        if len(mesh.faces) == 0:
-            self.errors.append("Mesh has no faces.")
+    def _header_structure_error(self, summary):
+        if summary["primitive_count"] == 0:
+            return "Scene contains no meshes."
+        if summary["primitive_count"] > 1 and not self.MERGE_SCENES:
+            return (
+                f"Scene contains multiple objects: {summary['primitive_count']} objects found."
+            )
+        return None
+
+    def rejected_by_header(self):
+        """
+        Returns whether `validate()` rejects the file from its JSON header alone.
+
+        Nothing is recorded, so callers can use it to skip work that decodes geometry
+        before validating, e.g. fingerprinting.
+
+        Returns:
+            bool: True if validation stops before any geometry is decoded.
+        """
+        summary = self.header_summary()
+        if summary is None:
             return False
-        return True
+        if self._header_structure_error(summary) is not None:
+            return True
+        # In collect-all mode the mesh is loaded after a failed header check
+        header_values = {
+            "declared_faces": float(summary["face_count"]),
+            "has_textures": float(summary["has_textures"]),
+        }
+        return self.fail_fast and bool(
+            self.check_failures("check_header_contents", header_values)
+        )
+
+    def is_cached(self):
+        """Returns whether `validate()` would return a cached result."""
+        return self.cache is not None and self.cache.contains(
+            self.content_hash(), self.fingerprint()
+        )
+
+    def check_header_contents(self, summary):
+        """
+        Checks the declared textures and, in fail-fast mode, the declared face count.
+
+        In collect-all mode the face count is left to `check_face_count`, so it is
+        reported once.
+
+        Returns:
+            bool: True if the header passes, False otherwise.
+        """
+        return self._decide(
+            "check_header_contents",
+            declared_faces=float(summary["face_count"]),
+            has_textures=float(summary["has_textures"]),
+        )
+
+    def check_face_count(self, mesh):
+        return self._decide("check_face_count", face_count=float(len(mesh.faces)))
+
+    def check_empty_mesh(self, mesh):
+        return self._decide("check_empty_mesh", face_count=float(len(mesh.faces)))
 
     def check_degenerate_faces(self, mesh):
         areas = mesh.area_faces
-        if np.any(areas < 1e-10):
-            self.errors.append("Mesh has degenerate faces.")
-            return False
-        return True
+        min_area = float(areas.min()) if len(areas) else np.nan
+        return self._decide("check_degenerate_faces", min_face_area=min_area)
 
     def detect_severe_self_intersections(self, mesh):
         """
@@ -118,6 +490,8 @@ class GLBMeshValidator:
 
         This function offsets each face by a small amount and checks for collisions with the rest of the mesh. If the number of colliding faces exceeds a certain threshold, the mesh is considered to have severe self-intersections.
 
+        All faces are perturbed and tested in one batch, see `glb_checker.intersections.colliding_faces`.
+
         Args:
             mesh (trimesh.Trimesh): The mesh to check for self-intersections.
 
@@ -125,48 +499,62 @@ class GLBMeshValidator:
             bool: True if the mesh has no severe self-intersections, False otherwise.
         """
         try:
-            bvh = trimesh.collision.CollisionManager()
-            bvh.add_object("mesh", mesh)
-            severe_intersections = []
+            colliding = colliding_faces(
+                mesh.vertices,
+                mesh.faces,
+                self.OFFSET_SCALE_FACTOR,
+                convex=mesh.is_convex,
+            )
+            severe_intersections = int(np.count_nonzero(colliding))
+            ratio = severe_intersections / len(mesh.faces)
+        except Exception as e:
+            self.errors.append(f"Error detecting self-intersections: {e}")
+            self.errored = True
+            return False
 
-            for i, face in enumerate(mesh.faces):
-                face_vertices = np.array(mesh.vertices[face])
-                if face_vertices.shape != (3, 3):
-                    self.errors.append(
-                        f"Skipping face {i} due to incorrect shape: {face_vertices.shape}"
-                    )
-                    continue
+        return self._decide(
+            "detect_severe_self_intersections",
+            colliding_faces=float(severe_intersections),
+            colliding_ratio=ratio,
+        )
 
-                offset = (
-                    np.mean(face_vertices, axis=0, keepdims=True)
-                    * self.OFFSET_SCALE_FACTOR
-                )
-                perturbed_face = face_vertices + offset
+    def face_quality(self, mesh):
+        """
+        Returns the per-face quality measures of a mesh, computed once per validator.
 
-                try:
-                    collisions = bvh.in_collision_single(
-                        trimesh.Trimesh(vertices=perturbed_face, faces=[[0, 1, 2]])
-                    )
-                    if collisions:
-                        severe_intersections.append(i)
-                except Exception as e:
-                    self.errors.append(f"Error processing face {i}: {e}")
-                    continue
-
-            if len(severe_intersections) / len(mesh.faces) > self.SEVERITY_THRESHOLD:
-                self.errors.append(
-                    f"Severe self-intersections detected: {len(severe_intersections)} faces."
-                )
-                return False
+        See `glb_checker.mesh_quality.face_quality`.
+        """
+        if self._face_quality is None:
+            self._face_quality = face_quality(mesh.triangles)
+        return self._face_quality
 
-            return True
-        except Exception as e:
-            self.errors.append(f"Error detecting self-intersections: {e}")
-            return False
+    def quality_summary(self):
+        """
+        Returns the compact face quality statistics of the validated mesh.
+
+        After a cached validation result the mesh is loaded first.
+
+        Returns:
+            dict or None: See `glb_checker.mesh_quality.quality_summary`. None if the
+            mesh could not be loaded.
+        """
+        if self._mesh is None:
+            self._mesh = self.load_mesh()
+            if not self._mesh:
+                return None
+        return quality_summary(self.face_quality(self._mesh))
+
+    def _quality_percentiles(self, values):
+        """Returns the (100 - QUALITY_PERCENTILE)-th and QUALITY_PERCENTILE-th percentiles."""
+        percentiles = [100 - self.QUALITY_PERCENTILE, self.QUALITY_PERCENTILE]
+        return np.percentile(values, percentiles, method="nearest")
 
     def check_edge_lengths(self, mesh):
         """
-        Checks that the edge lengths in the mesh are within a reasonable range.
+        Checks that the edge lengths in the mesh are within `EDGE_LENGTH_RANGE`.
+
+        The shortest and the longest (100 - QUALITY_PERCENTILE)% of the edges are
+        ignored.
 
         Args:
             mesh (trimesh.Trimesh): The mesh to check.
@@ -174,24 +562,21 @@ class GLBMeshValidator:
         Returns:
             bool: True if the mesh has edge lengths within a reasonable range, False otherwise.
         """
-        edges = mesh.edges_unique_length
-        min_length, max_length = np.min(edges), np.max(edges)
-
-        if min_length < 1e-6:
-            self.errors.append("Mesh has extremely short edges.")
-            return False
-        if max_length > 10:
-            self.errors.append("Mesh has extremely long edges.")
-            return False
-        return True
+        low = high = np.nan
+        if len(mesh.faces):
+            lengths = self.face_quality(mesh)["edge_lengths"]
+            low, high = self._quality_percentiles(lengths.ravel())
+        return self._decide(
+            "check_edge_lengths", edge_length_low=float(low), edge_length_high=float(high)
+        )
 
     def check_aspect_ratio(self, mesh):
         """
-        Checks that the aspect ratio of the mesh's faces is reasonable.
+        Checks that the mesh's faces are not thin or stretched.
 
-        A high aspect ratio indicates that a face is thin or stretched, which
-        can be problematic for some downstream applications. This check
-        ensures that the aspect ratio of all faces is above a certain threshold.
+        The per-face aspect ratio (1 for an equilateral triangle) must stay below
+        `MAX_ASPECT_RATIO`, and the smallest angle above `MIN_ANGLE_DEGREES`, for all but
+        the worst (100 - QUALITY_PERCENTILE)% of the faces.
 
         Args:
             mesh (trimesh.Trimesh): The mesh to check.
@@ -199,13 +584,16 @@ class GLBMeshValidator:
         Returns:
             bool: True if the mesh has reasonable aspect ratios, False otherwise.
         """
-        aspect_ratios = mesh.area_faces / (mesh.edges_unique_length.max() ** 2)
-        if np.any(aspect_ratios < 1e-3):
-            self.errors.append(
-                "Mesh contains faces with high aspect ratios (thin or stretched)."
-            )
-            return False
-        return True
+        aspect_ratio = min_angle = np.nan
+        if len(mesh.faces):
+            quality = self.face_quality(mesh)
+            _, aspect_ratio = self._quality_percentiles(quality["aspect_ratio"])
+            min_angle, _ = self._quality_percentiles(quality["min_angle"])
+        return self._decide(
+            "check_aspect_ratio",
+            aspect_ratio_high=float(aspect_ratio),
+            min_angle_low=float(min_angle),
+        )
 
     def check_normals_consistency(self, mesh):
         """
@@ -217,7 +605,7 @@ class GLBMeshValidator:
         Returns:
             bool: True if the mesh has consistently oriented face normals, False otherwise.
         """
-        if not mesh.is_winding_consistent:
-            self.errors.append("Mesh has inconsistent face normal orientations.")
-            return False
-        return True
+        return self._decide(
+            "check_normals_consistency",
+            winding_consistent=float(mesh.is_winding_consistent),
+        )
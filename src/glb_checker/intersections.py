@@ -0,0 +1,253 @@
+import numpy as np
+
+# Upper bound on candidate triangle pairs tested in one vectorized batch.
+MAX_PAIRS_PER_BATCH = 65536
+
+
+def perturbed_triangles(vertices, faces, offset_scale):
+    """
+    Builds the offset copy of every face used by the self-intersection check.
+
+    Each triangle is shifted by its own centroid scaled by `offset_scale`, the
+    same perturbation GLBMeshValidator historically applied face by face.
+
+    Args:
+        vertices (np.ndarray): (n, 3) vertex positions.
+        faces (np.ndarray): (m, 3) vertex indices.
+        offset_scale (float): Scale applied to the centroid offset.
+
+    Returns:
+        np.ndarray: (m, 3, 3) perturbed triangles.
+    """
+    triangles = np.asarray(vertices, dtype=np.float64)[np.asarray(faces)]
+    return triangles + triangles.mean(axis=1, keepdims=True) * offset_scale
+
+
+def _expand_ranges(lo, hi):
+    """Returns (owner, value) for every integer in the half-open ranges [lo, hi)."""
+    counts = hi - lo
+    owner = np.repeat(np.arange(len(lo)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return owner, np.repeat(lo, counts) + offsets
+
+
+def _cell_entries(box_min, box_max, cell_size, origin):
+    """Lists the (triangle, cell) entries of every AABB on a uniform grid."""
+    first = np.floor((box_min - origin) / cell_size).astype(np.int64)
+    last = np.floor((box_max - origin) / cell_size).astype(np.int64)
+    span = last - first + 1
+    owner, local = _expand_ranges(
+        np.zeros(len(span), dtype=np.int64), np.prod(span, axis=1)
+    )
+    span = span[owner]
+    cells = first[owner] + np.stack(
+        [local % span[:, 0], (local // span[:, 0]) % span[:, 1], local // (span[:, 0] * span[:, 1])],
+        axis=1,
+    )
+    return owner, cells
+
+
+def _cell_keys(cells, dims):
+    return (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+
+
+def candidate_pairs(query, target, max_pairs=MAX_PAIRS_PER_BATCH):
+    """
+    Uniform-grid broad phase over two triangle sets.
+
+    Every triangle AABB is registered in the grid cells it overlaps, and the
+    cell keys of both sets are joined with a single sort. A pair is reported
+    only from the cell holding the minimum corner of the two boxes'
+    intersection, so each AABB-overlapping pair is yielded exactly once.
+
+    Args:
+        query (np.ndarray): (m, 3, 3) query triangles.
+        target (np.ndarray): (k, 3, 3) target triangles.
+        max_pairs (int): Upper bound on candidates materialized per batch.
+
+    Yields:
+        tuple: (query_indices, target_indices) of AABB-overlapping pairs.
+    """
+    if len(query) == 0 or len(target) == 0:
+        return
+
+    q_min, q_max = query.min(axis=1), query.max(axis=1)
+    t_min, t_max = target.min(axis=1), target.max(axis=1)
+
+    origin = np.minimum(q_min.min(axis=0), t_min.min(axis=0))
+    extent = np.maximum(q_max.max(axis=0), t_max.max(axis=0)) - origin
+    cell_size = max(float(np.mean(np.max(t_max - t_min, axis=1))), 1e-12)
+    # Oversized triangles would register in too many cells; coarsen the grid
+    # until the entry count stays proportional to the triangle count.
+    budget = 8 * (len(query) + len(target))
+    while True:
+        cells_per_box = np.prod(
+            np.floor((t_max - origin) / cell_size) - np.floor((t_min - origin) / cell_size) + 1,
+            axis=1,
+        )
+        if cells_per_box.sum() <= budget:
+            break
+        cell_size *= 2.0
+    dims = np.floor(extent / cell_size).astype(np.int64) + 1
+
+    t_owner, t_cells = _cell_entries(t_min, t_max, cell_size, origin)
+    t_keys = _cell_keys(t_cells, dims)
+    order = np.argsort(t_keys, kind="stable")
+    t_owner, t_keys = t_owner[order], t_keys[order]
+
+    q_owner, q_cells = _cell_entries(q_min, q_max, cell_size, origin)
+    q_keys = _cell_keys(q_cells, dims)
+    lo = np.searchsorted(t_keys, q_keys, side="left")
+    hi = np.searchsorted(t_keys, q_keys, side="right")
+    cumulative = np.cumsum(hi - lo)
+
+    start = 0
+    while start < len(q_keys):
+        base = cumulative[start - 1] if start else 0
+        stop = int(np.searchsorted(cumulative, base + max_pairs, side="right"))
+        stop = max(stop, start + 1)
+
+        entry, position = _expand_ranges(lo[start:stop], hi[start:stop])
+        entry += start
+        q_idx, t_idx = q_owner[entry], t_owner[position]
+
+        overlap = np.all(
+            (t_min[t_idx] <= q_max[q_idx]) & (t_max[t_idx] >= q_min[q_idx]), axis=1
+        )
+        q_idx, t_idx, entry = q_idx[overlap], t_idx[overlap], entry[overlap]
+
+        corner = np.maximum(q_min[q_idx], t_min[t_idx])
+        corner_cell = np.floor((corner - origin) / cell_size).astype(np.int64)
+        owned = np.all(corner_cell == q_cells[entry], axis=1)
+        yield q_idx[owned], t_idx[owned]
+        start = stop
+
+
+def _separated(axes, a, b):
+    """Returns True where any of `axes` separates the paired triangles."""
+    proj_a = np.einsum("kxd,kvd->kxv", axes, a)
+    proj_b = np.einsum("kxd,kvd->kxv", axes, b)
+    gap = (proj_a.max(axis=2) < proj_b.min(axis=2)) | (
+        proj_b.max(axis=2) < proj_a.min(axis=2)
+    )
+    return gap.any(axis=1)
+
+
+def triangles_intersect(a, b):
+    """
+    Vectorized separating-axis triangle/triangle intersection test.
+
+    Touching triangles count as intersecting. Coplanar pairs are handled by the
+    in-plane edge normals, and degenerate axes never separate.
+
+    Args:
+        a (np.ndarray): (k, 3, 3) first triangles.
+        b (np.ndarray): (k, 3, 3) second triangles, paired row by row with `a`.
+
+    Returns:
+        np.ndarray: (k,) boolean mask of intersecting pairs.
+    """
+    result = np.zeros(len(a), dtype=bool)
+    if len(a) == 0:
+        return result
+
+    edges_a = np.roll(a, -1, axis=1) - a
+    edges_b = np.roll(b, -1, axis=1) - b
+    normal_a = np.cross(edges_a[:, 0], edges_a[:, 1])
+    normal_b = np.cross(edges_b[:, 0], edges_b[:, 1])
+
+    # Face normals reject almost every AABB false positive, test them first.
+    alive = ~_separated(np.stack([normal_a, normal_b], axis=1), a, b)
+    if not alive.any():
+        return result
+
+    a, b = a[alive], b[alive]
+    edges_a, edges_b = edges_a[alive], edges_b[alive]
+    normal_a, normal_b = normal_a[alive], normal_b[alive]
+
+    axes = np.concatenate(
+        [
+            np.cross(edges_a[:, :, None, :], edges_b[:, None, :, :]).reshape(-1, 9, 3),
+            np.cross(normal_a[:, None, :], edges_a),
+            np.cross(normal_b[:, None, :], edges_b),
+        ],
+        axis=1,
+    )
+
+    # Near-parallel edge pairs produce axes dominated by rounding noise.
+    scale = np.einsum("kd,kd->k", normal_a, normal_a) + np.einsum(
+        "kd,kd->k", normal_b, normal_b
+    )
+    tiny = np.einsum("kxd,kxd->kx", axes, axes) <= 1e-20 * scale[:, None]
+    axes[tiny] = 0.0
+
+    result[alive] = ~_separated(axes, a, b)
+    return result
+
+
+def colliding_faces(vertices, faces, offset_scale, convex=False):
+    """
+    Flags the faces whose perturbed copy collides with the original mesh.
+
+    Convex meshes are collided as solids, matching how trimesh hands them to
+    FCL: a perturbed face that moved inward collides even without touching
+    the surface.
+
+    Args:
+        vertices (np.ndarray): (n, 3) vertex positions.
+        faces (np.ndarray): (m, 3) vertex indices.
+        offset_scale (float): Centroid offset scale, see `perturbed_triangles`.
+        convex (bool): Whether the mesh is a closed convex solid.
+
+    Returns:
+        np.ndarray: (m,) boolean mask of colliding faces.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.asarray(faces)
+    target = vertices[faces]
+    query = perturbed_triangles(vertices, faces, offset_scale)
+
+    hits = np.zeros(len(faces), dtype=bool)
+    if convex and len(faces):
+        normals = np.cross(target[:, 1] - target[:, 0], target[:, 2] - target[:, 0])
+        # Signed volume orients the normals outward regardless of winding.
+        volume = np.einsum("kd,kd->", normals, target[:, 0])
+        offsets = target.mean(axis=1) * offset_scale
+        hits |= np.einsum("kd,kd->k", normals, offsets) * np.sign(volume) < 0
+
+    for q_idx, t_idx in candidate_pairs(query, target):
+        # Faces already known to collide need no further narrow-phase work.
+        pending = ~hits[q_idx]
+        q_idx, t_idx = q_idx[pending], t_idx[pending]
+        intersecting = triangles_intersect(query[q_idx], target[t_idx])
+        hits[q_idx[intersecting]] = True
+    return hits
+
+
+def colliding_faces_fcl(vertices, faces, offset_scale):
+    """
+    Reference per-face implementation using FCL through trimesh.
+
+    Kept for parity testing of `colliding_faces`; it is orders of magnitude
+    slower and requires python-fcl.
+
+    Args:
+        vertices (np.ndarray): (n, 3) vertex positions.
+        faces (np.ndarray): (m, 3) vertex indices.
+        offset_scale (float): Centroid offset scale, see `perturbed_triangles`.
+
+    Returns:
+        np.ndarray: (m,) boolean mask of colliding faces.
+    """
+    import trimesh
+
+    manager = trimesh.collision.CollisionManager()
+    manager.add_object("mesh", trimesh.Trimesh(vertices=vertices, faces=faces))
+
+    query = perturbed_triangles(vertices, faces, offset_scale)
+    hits = np.zeros(len(query), dtype=bool)
+    for i, triangle in enumerate(query):
+        hits[i] = manager.in_collision_single(
+            trimesh.Trimesh(vertices=triangle, faces=[[0, 1, 2]], process=False)
+        )
+    return hits
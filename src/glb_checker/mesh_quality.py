@@ -0,0 +1,78 @@
+import numpy as np
+
+SUMMARY_PERCENTILES = (1, 5, 50, 95, 99)
+
+
+def face_quality(triangles):
+    """
+    Computes per-face quality measures in one vectorized pass.
+
+    Args:
+        triangles (np.ndarray): (n, 3, 3) triangle vertices, e.g. `mesh.triangles`.
+
+    Returns:
+        dict: A dictionary with the following key-value pairs:
+            - edge_lengths: (n, 3) lengths of the edges v0-v1, v1-v2 and v2-v0.
+            - area: (n,) face areas.
+            - aspect_ratio: (n,) longest edge times perimeter over 4*sqrt(3)*area. It is
+              1 for an equilateral triangle, grows for thin faces and is inf for
+              degenerate ones.
+            - min_angle: (n,) smallest interior angle in degrees, 0 for degenerate faces.
+    """
+    triangles = np.asarray(triangles, dtype=np.float64)
+    # edges[:, i] runs from vertex i to vertex i + 1
+    edges = np.roll(triangles, -1, axis=1) - triangles
+    lengths = np.linalg.norm(edges, axis=2)
+    double_area = np.linalg.norm(np.cross(edges[:, 0], edges[:, 1]), axis=1)
+    area = 0.5 * double_area
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        aspect_ratio = (
+            lengths.max(axis=1) * lengths.sum(axis=1) / (4 * np.sqrt(3) * area)
+        )
+    aspect_ratio[area == 0] = np.inf
+
+    # The angle at vertex i lies between edges i and i - 1; atan2 of |cross| and dot
+    # stays accurate for the needle-thin faces where the law of cosines breaks down
+    dot = -np.einsum("nij,nij->ni", edges, np.roll(edges, 1, axis=1))
+    angles = np.degrees(np.arctan2(double_area[:, None], dot))
+
+    return {
+        "edge_lengths": lengths,
+        "area": area,
+        "aspect_ratio": aspect_ratio,
+        "min_angle": angles.min(axis=1),
+    }
+
+
+def _distribution(values, percentiles):
+    points = np.percentile(values, percentiles, method="nearest")
+    summary = {"min": values.min(), "max": values.max()}
+    summary.update((f"p{p}", point) for p, point in zip(percentiles, points))
+    # Infinite aspect ratios of degenerate faces are stored as None to keep the JSON valid
+    return {
+        name: float(value) if np.isfinite(value) else None
+        for name, value in summary.items()
+    }
+
+
+def quality_summary(quality, percentiles=SUMMARY_PERCENTILES):
+    """
+    Summarizes per-face quality into a compact per-mesh record.
+
+    Args:
+        quality (dict): The output of `face_quality`.
+        percentiles (tuple): The percentiles reported for every measure.
+
+    Returns:
+        dict: face count, total area, and min/max plus the given percentiles of the
+        edge lengths, face areas, aspect ratios and minimum angles. JSON-serializable.
+    """
+    area = quality["area"]
+    summary = {"faces": len(area), "total_area": float(area.sum())}
+    if len(area) == 0:
+        return summary
+    summary["edge_length"] = _distribution(quality["edge_lengths"].ravel(), percentiles)
+    for name in ("area", "aspect_ratio", "min_angle"):
+        summary[name] = _distribution(quality[name], percentiles)
+    return summary
@@ -0,0 +1,90 @@
+import numpy as np
+
+
+def measurement_arrays(validator, cache, content_hashes):
+    """
+    Loads the stored measurements of many files as one array per measurement.
+
+    Only values taken under the validator's current logic keys count, so a value
+    measured by an older check version or other measuring settings is treated as
+    missing.
+
+    Args:
+        validator (GLBMeshValidator): The validator whose settings apply.
+        cache (ValidationCache): The cache holding the measurements.
+        content_hashes (list): The content hashes of the files.
+
+    Returns:
+        tuple: (values, present), both dicts keyed by measurement name. `values` holds
+        float arrays aligned with `content_hashes` (NaN where missing or undefined);
+        `present` holds boolean arrays of where a current value is stored.
+    """
+    names = {name for names in validator.MEASUREMENTS.values() for name in names}
+    values, present = {}, {}
+    for name in sorted(names):
+        stored = cache.get_measurements(name, validator.measurement_logic(name))
+        present[name] = np.fromiter(
+            (h in stored for h in content_hashes), dtype=bool, count=len(content_hashes)
+        )
+        values[name] = np.fromiter(
+            (stored.get(h, np.nan) for h in content_hashes),
+            dtype=np.float64,
+            count=len(content_hashes),
+        )
+    return values, present
+
+
+def redecide(validator, values, present, load_errors=None):
+    """
+    Re-decides pass/fail for many meshes from their stored measurements.
+
+    Steps are applied in validation order with the validator's own comparisons, one
+    vectorized pass per step, and the fail-fast rule is honored: with `fail_fast` a
+    mesh is decided by its first failing step, so only the measurements up to that step
+    are needed. A mesh that lacks a measurement it needs is left for a geometry rerun.
+
+    Args:
+        validator (GLBMeshValidator): The validator whose thresholds apply.
+        values (dict): measurement name -> float array, see `measurement_arrays`.
+        present (dict): measurement name -> boolean array of stored values.
+        load_errors (callable, optional): Maps a mesh position to the error messages of
+            its failed load, e.g. from the last cached result. Defaults to a generic
+            message.
+
+    Returns:
+        tuple: (is_valid, needs_geometry, errors). `is_valid` and `needs_geometry` are
+        boolean arrays; `errors` holds a list of messages per mesh. `is_valid` is False
+        where `needs_geometry` is True.
+    """
+    count = len(next(iter(values.values())))
+    is_valid = np.ones(count, dtype=bool)
+    needs_geometry = np.zeros(count, dtype=bool)
+    # Meshes whose outcome can still change at a later step
+    open_ = np.ones(count, dtype=bool)
+    errors = [[] for _ in range(count)]
+
+    for step in ("check_header_contents", "load_mesh", *validator.CHECKS):
+        names = validator.MEASUREMENTS[step]
+        have = np.logical_and.reduce([present[name] for name in names])
+        # Files without a readable header skip the header step instead of missing it
+        if step != "check_header_contents":
+            needs_geometry |= open_ & ~have
+            open_ &= have
+
+        step_values = {name: values[name] for name in names}
+        fails = open_ & have & np.broadcast_to(
+            validator.check_failures(step, step_values), (count,)
+        )
+        for i in np.flatnonzero(fails):
+            if step == "load_mesh" and load_errors is not None:
+                errors[i].extend(load_errors(i) or [validator.check_error(step, {})])
+            else:
+                row = {name: column[i] for name, column in step_values.items()}
+                errors[i].append(validator.check_error(step, row))
+        is_valid &= ~fails
+        # Validation always ends at a failed load
+        if validator.fail_fast or step == "load_mesh":
+            open_ &= ~fails
+
+    is_valid &= ~needs_geometry
+    return is_valid, needs_geometry, errors
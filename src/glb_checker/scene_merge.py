@@ -0,0 +1,89 @@
+import numpy as np
+import trimesh
+
+
+def scene_instances(scene):
+    """
+    Groups the mesh instances of a scene graph by geometry.
+
+    Args:
+        scene (trimesh.Scene): The scene to flatten.
+
+    Returns:
+        list: (trimesh.Trimesh, transforms) pairs, where `transforms` is a (k, 4, 4)
+        array of the world transforms of the k nodes instancing that geometry.
+        Non-triangle geometry (points, paths) and empty meshes are left out.
+    """
+    instances = {}
+    for node in scene.graph.nodes_geometry:
+        transform, name = scene.graph[node]
+        geometry = scene.geometry.get(name)
+        if isinstance(geometry, trimesh.Trimesh) and len(geometry.faces):
+            instances.setdefault(name, []).append(transform)
+    return [
+        (scene.geometry[name], np.asarray(transforms))
+        for name, transforms in instances.items()
+    ]
+
+
+def _uv(mesh):
+    uv = getattr(mesh.visual, "uv", None)
+    return None if uv is None or len(uv) != len(mesh.vertices) else uv
+
+
+def merge_scene(scene):
+    """
+    Flattens a scene graph into a single mesh.
+
+    Every node's world transform is applied to its geometry, and all instances are
+    written into arrays allocated once for the final vertex and face counts. The
+    instances of one geometry are transformed together in one vectorized step, so
+    scenes with thousands of nodes sharing a few meshes stay fast. Faces of
+    mirrored instances are flipped to keep their outward orientation.
+
+    UV coordinates are kept when every geometry has them. Materials are not merged.
+
+    Args:
+        scene (trimesh.Scene): The scene to merge.
+
+    Returns:
+        trimesh.Trimesh or None: The merged mesh, or None if the scene has no triangles.
+    """
+    instances = scene_instances(scene)
+    if not instances:
+        return None
+
+    vertex_count = sum(len(mesh.vertices) * len(t) for mesh, t in instances)
+    face_count = sum(len(mesh.faces) * len(t) for mesh, t in instances)
+    with_uv = all(_uv(mesh) is not None for mesh, _ in instances)
+
+    vertices = np.empty((vertex_count, 3), dtype=np.float64)
+    faces = np.empty((face_count, 3), dtype=np.int64)
+    uv = np.empty((vertex_count, 2), dtype=np.float64) if with_uv else None
+
+    vertex_start = face_start = 0
+    for mesh, transforms in instances:
+        k, n, m = len(transforms), len(mesh.vertices), len(mesh.faces)
+        vertex_end = vertex_start + k * n
+        face_end = face_start + k * m
+
+        # (k, n, 3): every instance's rotation/scale plus translation at once
+        vertices[vertex_start:vertex_end] = (
+            np.einsum("kij,nj->kni", transforms[:, :3, :3], mesh.vertices)
+            + transforms[:, None, :3, 3]
+        ).reshape(-1, 3)
+
+        mirrored = np.linalg.det(transforms[:, :3, :3]) < 0
+        offsets = vertex_start + n * np.arange(k)
+        faces[face_start:face_end] = (
+            np.where(mirrored[:, None, None], mesh.faces[:, ::-1], mesh.faces)
+            + offsets[:, None, None]
+        ).reshape(-1, 3)
+
+        if with_uv:
+            uv[vertex_start:vertex_end] = np.tile(_uv(mesh), (k, 1))
+
+        vertex_start, face_start = vertex_end, face_end
+
+    visual = trimesh.visual.TextureVisuals(uv=uv) if with_uv else None
+    return trimesh.Trimesh(vertices, faces, visual=visual, process=False)
@@ -1,4 +1,6 @@
+import hashlib
 import json
+import logging
 
 
 def save_json(file_path, data):
@@ -11,3 +13,95 @@ def load_json(file_path):
     """Load data from a JSON file."""
     with open(file_path, "r") as file:
         return json.load(file)
+
+
+def append_json_line(file_path, data):
+    """Append data to a JSON Lines file as one line."""
+    with open(file_path, "a") as file:
+        file.write(json.dumps(data) + "\n")
+
+
+def load_json_lines(file_path):
+    """
+    Load every line of a JSON Lines file.
+
+    Lines that are not valid JSON, e.g. cut off by an interrupted append, are skipped.
+    """
+    data = []
+    skipped = 0
+    with open(file_path, "r") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                data.append(json.loads(line))
+            except json.JSONDecodeError:
+                skipped += 1
+    if skipped:
+        logging.warning(f"Skipped {skipped} malformed lines of {file_path}")
+    return data
+
+
+def read_complete_lines(path):
+    """
+    Yield the complete lines of a file appended to line by line.
+
+    A last line without a newline was cut off by an interrupted append and is skipped.
+    """
+    with open(path, "r") as file:
+        for line in file:
+            if not line.endswith("\n"):
+                logging.warning(f"Skipping a partial last line of {path}")
+                break
+            if line.strip():
+                yield line
+
+
+def _line_start(file, position, chunk_size):
+    """Return the offset of the line holding the byte before `position`."""
+    while position > 0:
+        start = max(0, position - chunk_size)
+        file.seek(start)
+        newline = file.read(position - start).rfind(b"\n")
+        if newline >= 0:
+            return start + newline + 1
+        position = start
+    return 0
+
+
+def repair_partial_line(path, chunk_size=1 << 16):
+    """Truncate a partial last line, so appended lines start on a line of their own."""
+    with open(path, "rb+") as file:
+        end = file.seek(0, 2)
+        position = _line_start(file, end, chunk_size)
+        if position < end:
+            file.truncate(position)
+
+
+def truncate_trailing_lines(path, keep, chunk_size=1 << 16):
+    """
+    Truncate the last lines of a file until one satisfies `keep(line)`.
+
+    Lines are read from the end, so only the removed lines and the kept one are read.
+    The file must end with a complete line, see `repair_partial_line`.
+    """
+    with open(path, "rb+") as file:
+        end = file.seek(0, 2)
+        position = end
+        while position > 0:
+            start = _line_start(file, position - 1, chunk_size)
+            file.seek(start)
+            if keep(file.read(position - start).decode()):
+                break
+            position = start
+        if position < end:
+            file.truncate(position)
+
+
+def file_sha256(file_path, chunk_size=1 << 20):
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
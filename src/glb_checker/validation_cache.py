@@ -0,0 +1,284 @@
+import json
+import os
+from multiprocessing import util
+
+from pipeline.sqlite_store import SQLiteStore
+
+
+class ValidationCache(SQLiteStore):
+    """
+    Size-bounded on-disk cache of GLBMeshValidator results.
+
+    Results are keyed by the GLB content hash plus the validator fingerprint, so
+    duplicate uploads share one entry and changing a threshold or the enabled checks
+    never returns a stale result. Once `max_entries` is exceeded, the least recently
+    used entries are evicted. Hit and miss counters and the number of entries are
+    stored alongside the entries, so they add up across worker processes and an insert
+    never has to count the table.
+
+    Lookups only read. Their recency updates and counters are kept per thread and
+    written in one transaction every `FLUSH_EVERY` lookups, with the next `put`, when
+    the counters are read and when the process exits, so concurrent workers do not
+    queue for the write lock on every hit.
+
+    The raw measurements behind each result are stored per content hash too, tagged
+    with the logic key they were taken under, see `GLBMeshValidator.measurement_logic`.
+    They are evicted with the last result of their file, which is then measured again
+    by the next validation.
+    """
+
+    # Lookups whose recency updates and counters are written at once
+    FLUSH_EVERY = 100
+
+    # Logical clock for LRU order; the last_used index makes MAX() a single lookup
+    _CLOCK = "(SELECT COALESCE(MAX(last_used), 0) + 1 FROM results)"
+
+    def __init__(self, path, max_entries=1000000):
+        super().__init__(path)
+        self.max_entries = max_entries
+        with self.connection as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS results (
+                    content_hash TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    is_valid INTEGER NOT NULL,
+                    errors TEXT NOT NULL,
+                    last_used INTEGER NOT NULL,
+                    PRIMARY KEY (content_hash, fingerprint)
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS measurements (
+                    content_hash TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    logic TEXT NOT NULL,
+                    value REAL,
+                    PRIMARY KEY (content_hash, name)
+                )
+                """
+            )
+            # Caches created before the counter existed are counted once
+            connection.execute(
+                "INSERT OR IGNORE INTO stats (name, value) "
+                "SELECT 'entries', COUNT(*) FROM results"
+            )
+
+    def _count(self, connection, name, amount=1):
+        connection.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def _pending(self):
+        """Returns the unwritten lookups of the calling process and thread."""
+        local = self._local
+        if getattr(local, "pending_pid", None) != os.getpid():
+            local.pending = {"used": set(), "hits": 0, "misses": 0}
+            local.pending_pid = os.getpid()
+            # Written by whichever thread runs the exit handlers
+            util.Finalize(None, self._write_pending, args=(local.pending,), exitpriority=10)
+        return local.pending
+
+    def _write_pending(self, pending, connection=None):
+        if not (pending["used"] or pending["hits"] or pending["misses"]):
+            return
+        with connection or self.connection as connection:
+            connection.executemany(
+                f"UPDATE results SET last_used = {self._CLOCK} "
+                "WHERE content_hash = ? AND fingerprint = ?",
+                pending["used"],
+            )
+            for name in ("hits", "misses"):
+                if pending[name]:
+                    self._count(connection, name, pending[name])
+        pending["used"].clear()
+        pending["hits"] = pending["misses"] = 0
+
+    def flush(self):
+        """Writes the recency updates and counters of this thread's lookups."""
+        self._write_pending(self._pending())
+
+    def get(self, content_hash, fingerprint):
+        """
+        Looks up a validation result.
+
+        Args:
+            content_hash (str): The content hash of the GLB file.
+            fingerprint (str): The validator fingerprint.
+
+        Returns:
+            tuple or None: (is_valid, errors) on a hit, None on a miss.
+        """
+        row = self.connection.execute(
+            "SELECT is_valid, errors FROM results WHERE content_hash = ? AND fingerprint = ?",
+            (content_hash, fingerprint),
+        ).fetchone()
+        pending = self._pending()
+        if row is None:
+            pending["misses"] += 1
+        else:
+            pending["hits"] += 1
+            pending["used"].add((content_hash, fingerprint))
+        if pending["hits"] + pending["misses"] >= self.FLUSH_EVERY:
+            self._write_pending(pending)
+        return None if row is None else (bool(row[0]), json.loads(row[1]))
+
+    def contains(self, content_hash, fingerprint):
+        """Returns whether a result is stored, without counting a hit or a miss."""
+        row = self.connection.execute(
+            "SELECT 1 FROM results WHERE content_hash = ? AND fingerprint = ?",
+            (content_hash, fingerprint),
+        ).fetchone()
+        return row is not None
+
+    def put(self, content_hash, fingerprint, is_valid, errors):
+        """
+        Stores a validation result, evicting the least recently used entries if needed.
+
+        Args:
+            content_hash (str): The content hash of the GLB file.
+            fingerprint (str): The validator fingerprint.
+            is_valid (bool): The validation outcome.
+            errors (list): The validation error messages.
+        """
+        self.put_many([(content_hash, fingerprint, is_valid, errors)])
+
+    def put_many(self, results):
+        """
+        Stores many validation results in one transaction, see `put`.
+
+        Args:
+            results (iterable): (content_hash, fingerprint, is_valid, errors) tuples.
+        """
+        rows = [
+            (int(is_valid), json.dumps(errors), content_hash, fingerprint)
+            for content_hash, fingerprint, is_valid, errors in results
+        ]
+        with self.connection as connection:
+            # Earlier lookups first, so the new results are the most recently used
+            self._write_pending(self._pending(), connection)
+            cursor = connection.executemany(
+                "INSERT OR IGNORE INTO results "
+                "(is_valid, errors, content_hash, fingerprint, last_used) "
+                "VALUES (?, ?, ?, ?, 0)",
+                rows,
+            )
+            inserted = cursor.rowcount
+            # New and replaced entries alike become the most recently used
+            connection.executemany(
+                "UPDATE results SET is_valid = ?, errors = ?, "
+                f"last_used = {self._CLOCK} "
+                "WHERE content_hash = ? AND fingerprint = ?",
+                rows,
+            )
+            if inserted == 0:
+                return
+            self._count(connection, "entries", inserted)
+
+            excess = self._entries(connection) - self.max_entries
+            if excess > 0:
+                evicted = connection.execute(
+                    "SELECT rowid, content_hash FROM results ORDER BY last_used LIMIT ?",
+                    (excess,),
+                ).fetchall()
+                connection.executemany(
+                    "DELETE FROM results WHERE rowid = ?",
+                    [(rowid,) for rowid, _ in evicted],
+                )
+                self._count(connection, "entries", -len(evicted))
+                # Measurements go with the last result of their file
+                connection.executemany(
+                    "DELETE FROM measurements WHERE content_hash = ? AND NOT EXISTS "
+                    "(SELECT 1 FROM results WHERE content_hash = ?)",
+                    [(content_hash, content_hash) for content_hash in {h for _, h in evicted}],
+                )
+
+    def put_measurements(self, content_hash, measurements):
+        """
+        Stores the raw measurements of a mesh, replacing older values of the same names.
+
+        Args:
+            content_hash (str): The content hash of the GLB file.
+            measurements (dict): name -> (logic key, value). NaN values are stored as NULL.
+        """
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO measurements VALUES (?, ?, ?, ?)",
+                [
+                    (content_hash, name, logic, None if value != value else value)
+                    for name, (logic, value) in measurements.items()
+                ],
+            )
+
+    def get_measurements(self, name, logic):
+        """
+        Returns every stored value of one measurement taken under a logic key.
+
+        Args:
+            name (str): The measurement name.
+            logic (str): The logic key the value must have been taken under.
+
+        Returns:
+            dict: content hash -> value, with NaN for NULL.
+        """
+        cursor = self.connection.execute(
+            "SELECT content_hash, value FROM measurements WHERE name = ? AND logic = ?",
+            (name, logic),
+        )
+        return {
+            content_hash: float("nan") if value is None else value
+            for content_hash, value in cursor
+        }
+
+    def latest_errors(self, content_hash):
+        """
+        Returns the errors of the most recently used result for a file, whatever the
+        validator fingerprint.
+
+        Args:
+            content_hash (str): The content hash of the GLB file.
+
+        Returns:
+            list or None: The error messages, or None if no result is stored.
+        """
+        row = self.connection.execute(
+            "SELECT errors FROM results WHERE content_hash = ? "
+            "ORDER BY last_used DESC LIMIT 1",
+            (content_hash,),
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    @staticmethod
+    def _entries(connection):
+        return connection.execute(
+            "SELECT value FROM stats WHERE name = 'entries'"
+        ).fetchone()[0]
+
+    def __len__(self):
+        self.flush()
+        return self._entries(self.connection)
+
+    def stats(self):
+        """
+        Returns the hit and miss counters.
+
+        Returns:
+            dict: {"hits": int, "misses": int, "entries": int}.
+        """
+        self.flush()
+        counters = dict(self.connection.execute("SELECT name, value FROM stats"))
+        return {
+            "hits": counters.get("hits", 0),
+            "misses": counters.get("misses", 0),
+            "entries": counters["entries"],
+        }
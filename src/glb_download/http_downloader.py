@@ -0,0 +1,122 @@
+import logging
+import threading
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class HTTPDownloader:
+    """
+    In-process HTTP downloader with persistent connections and resume support.
+
+    Every thread gets its own `requests.Session`, so connections (and their TLS
+    sessions) to the same host are kept alive and reused across files instead of
+    being opened per download. Partially written files are resumed with an HTTP
+    Range request, like `wget -c`. A partial file the server reports as complete is
+    only kept if its size matches the resource, and downloaded again otherwise.
+    """
+
+    def __init__(self, retry_attempts=3, timeout=60, chunk_size=1 << 20, backoff=1.0):
+        self.retry_attempts = retry_attempts
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.backoff = backoff
+        self._local = threading.local()
+
+    def configure(self, retry_attempts=None, timeout=None):
+        """Updates the retry and timeout settings, e.g. from `config/config.json`."""
+        if retry_attempts is not None:
+            self.retry_attempts = retry_attempts
+        if timeout is not None:
+            self.timeout = timeout
+
+    @property
+    def session(self):
+        """requests.Session: The keep-alive session of the calling thread."""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            self._local.session = session
+        return session
+
+    def download(self, url, output_path):
+        """
+        Downloads a URL to a file, resuming and retrying on failure.
+
+        Args:
+            url (str): The URL to download.
+            output_path (Path): The destination file. An existing partial file is resumed.
+
+        Raises:
+            requests.RequestException: If the download still fails after `retry_attempts` attempts.
+        """
+        output_path = Path(output_path)
+        attempts = max(1, self.retry_attempts)
+        for attempt in range(1, attempts + 1):
+            try:
+                self._download_once(url, output_path)
+                return
+            except (requests.RequestException, OSError) as e:
+                if attempt == attempts or not self._is_retryable(e):
+                    raise
+                logging.warning(
+                    f"Download of {url} failed (attempt {attempt}/{attempts}): {e}"
+                )
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _is_retryable(error):
+        """Client errors such as 404 will not succeed on a retry, unlike 408/429 and 5xx."""
+        response = getattr(error, "response", None)
+        if response is None:
+            return True
+        status = response.status_code
+        return not (400 <= status < 500) or status in (408, 429)
+
+    def _resource_size(self, url, headers):
+        """
+        Returns the size of a resource after a 416 response, or None if it is unknown.
+
+        The size is read from the `Content-Range: bytes */<size>` header of the response,
+        or else from the `Content-Length` of a HEAD request.
+        """
+        content_range = headers.get("Content-Range", "")
+        if content_range.startswith("bytes */"):
+            size = content_range[len("bytes */") :]
+            if size.isdigit():
+                return int(size)
+        with self.session.head(url, timeout=self.timeout, allow_redirects=True) as head:
+            size = head.headers.get("Content-Length", "")
+            if head.ok and size.isdigit():
+                return int(size)
+        return None
+
+    def _download_once(self, url, output_path):
+        offset = output_path.stat().st_size if output_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+
+        with self.session.get(
+            url, headers=headers, stream=True, timeout=self.timeout
+        ) as response:
+            if not (offset and response.status_code == 416):
+                response.raise_for_status()
+                # A server ignoring the Range header sends the full body again
+                mode = "ab" if response.status_code == 206 else "wb"
+                with open(output_path, mode) as file:
+                    for chunk in response.iter_content(chunk_size=self.chunk_size):
+                        file.write(chunk)
+                return
+
+        # The partial file should already hold the whole resource; one of another
+        # size, e.g. of a resource changed since, is discarded and downloaded again
+        size = self._resource_size(url, response.headers)
+        if size != offset:
+            logging.warning(
+                f"Discarding {output_path} of {offset} bytes, the resource has {size} bytes"
+            )
+            output_path.unlink()
+            self._download_once(url, output_path)
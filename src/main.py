@@ -1,16 +1,70 @@
+import argparse
+import multiprocessing
 import os
 import time
 import logging
 import shutil
-import subprocess
+import socket
+import queue
+from contextlib import ExitStack
 from pathlib import Path
-import trimesh
-from multiprocessing import Pool, cpu_count
-from glb_checker.glb_validator import GLBMeshValidator
-from glb_checker.utils import load_json, save_json
-from pbr_extraction.texture_extractor import extract_pbr_textures
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+from glb_checker.validation_cache import ValidationCache
+from glb_checker.utils import (
+    append_json_line,
+    file_sha256,
+    load_json,
+    load_json_lines,
+    save_json,
+)
+from glb_download.http_downloader import HTTPDownloader
+from pipeline.file_lock import file_lock
+from pipeline.id_selection import select_work, shard_of
+from pipeline.manifest import JobManifest
+from pipeline.metrics import RunMetrics, start_worker_profiling, timed
+from pipeline.staged_output import StagedOutput
+from pipeline.worker_limits import WorkerWatchdog, run_limited
 import objaverse
 
+# trimesh, NumPy and the stages built on them take most of the startup time. They are
+# imported by the functions that use them, so importing this module for downloads or
+# a merge stays light; validation workers import them once in init_validation_worker.
+OBJAVERSE_GLB_URL = (
+    "https://huggingface.co/datasets/allenai/objaverse/resolve/main/glbs/{objaverse_id}"
+)
+LOST_TASK_ERROR = "Validation worker died (out of memory, crashed or timed out)"
+# How often waits on the validation pool check for lost tasks, in seconds
+POLL_SECONDS = 1.0
+
+# Shared by all download threads; keeps connections to the host alive between files
+downloader = HTTPDownloader()
+
+# Set by main(); validation workers get them from init_validation_worker and open
+# their own connections
+manifest = None
+metrics = None
+validation_cache = None
+dedup_index = None
+extract_texture_images = False
+mesh_export_format = "obj"
+merge_scenes = False
+validator_settings = {}
+download_cache_dir = None
+task_timeout = None
+WORKER_SETTINGS = (
+    "manifest",
+    "metrics",
+    "validation_cache",
+    "dedup_index",
+    "extract_texture_images",
+    "mesh_export_format",
+    "merge_scenes",
+    "validator_settings",
+    "download_cache_dir",
+    "task_timeout",
+)
+
 
 def setup_logging():
     logging.basicConfig(
@@ -20,47 +74,140 @@ def setup_logging():
     )
 
 
+def record_stage(
+    index, objaverse_id, stage, success, error="", content_hash=None, retry=False
+):
+    """
+    Records a stage outcome in the job manifest, if one is configured.
+
+    Failures with `retry` set did not reach a verdict and are repeated by the next run.
+    """
+    if manifest is not None:
+        manifest.record(index, objaverse_id, stage, success, error, content_hash, retry)
+
+
+def record_timings(index, timings, num_bytes=None):
+    """Records stage durations in the run metrics, if they are configured."""
+    if metrics is not None:
+        metrics.record(index, timings, num_bytes)
+
+
+def load_validation_stage():
+    """Imports the modules of the validation stage."""
+    import glb_checker.glb_validator  # noqa: F401
+    import mesh_export.binary_mesh  # noqa: F401
+    import pbr_extraction.texture_extractor  # noqa: F401
+    import pipeline.dedup  # noqa: F401
+
+
+def worker_settings():
+    """Returns the settings of this run that validation workers need, by name."""
+    return {name: globals()[name] for name in WORKER_SETTINGS}
+
+
+def validation_context():
+    """
+    Returns the multiprocessing context validation pools are created from.
+
+    Workers are started by a fork server instead of being forked from this process.
+    The pool starts new workers whenever one is recycled or killed, while download
+    threads are writing to SQLite and hashing files, and a fork taken while another
+    thread holds a lock can deadlock the child. Workers therefore inherit nothing, and
+    get the settings of the run from `init_validation_worker`.
+    """
+    return multiprocessing.get_context("forkserver")
+
+
+def init_validation_worker(settings=None, profile_dir=None, trace_memory=False):
+    """
+    Pool initializer of the validation workers.
+
+    Applies the settings of the run, see `worker_settings`, and imports the validation
+    stage before the first task, so no task pays for it. It then optionally starts
+    profiling the worker, see `start_worker_profiling`.
+    """
+    if settings:
+        globals().update(settings)
+    load_validation_stage()
+    if profile_dir:
+        start_worker_profiling(profile_dir, trace_memory)
+
+
+def cached_download_path(save_dir, objaverse_id):
+    """
+    Returns where the source GLB of an object is kept in the shared download cache.
+
+    Files are keyed by their Objaverse file name, which holds the UID, so an object
+    listed by both gobjaverse and the Objaverse framework is downloaded once. The cache
+    is `download_cache_dir`, or `<save_dir>/downloads` if none is set.
+    """
+    cache_dir = Path(download_cache_dir or Path(save_dir) / "downloads")
+    return cache_dir / Path(objaverse_id).name
+
+
 def download_glb_file(args):
     """
-    Downloads a GLB file from the Objaverse dataset and saves it to a specified directory.
+    Downloads a GLB file from the Objaverse dataset into the shared download cache.
+
+    A file already in the cache is not downloaded again. Downloads are written to a
+    `.part` file that is renamed once complete, so a file in the cache is always whole,
+    and the `.part` file of a failed download is kept for the next attempt to resume.
+    Writers of the same file, in other threads, processes or nodes, take turns through
+    a `.lock` file, so the `.part` file is never written twice at once; a writer that
+    waited finds the finished file and does not download it again.
 
     Args:
         args (tuple): A tuple containing three elements:
             - index (str): The index identifier for the GLB file.
             - objaverse_id (str): The Objaverse ID for the GLB file.
-            - save_dir (str): The directory where the file should be saved.
+            - save_dir (str): The pipeline output directory.
 
     Returns:
         tuple: A tuple containing the following elements:
             - index (str): The index identifier for the GLB file.
             - objaverse_id (str): The Objaverse ID for the GLB file.
-            - output_path (Path or None): The path to the downloaded file, or None if download failed.
+            - output_path (Path or None): The path to the cached file, or None if download failed.
             - success (bool): True if the download was successful, False otherwise.
             - error_message (str): An empty string if successful, or the error message if failed.
     """
 
     index, objaverse_id, save_dir = args
-    output_dir = Path(save_dir) / index.replace("/", "_")
-    output_path = output_dir / Path(objaverse_id).name
-    url = f"https://huggingface.co/datasets/allenai/objaverse/resolve/main/glbs/{objaverse_id}"
-
-    output_dir.mkdir(parents=True, exist_ok=True)
-    result = subprocess.run(
-        ["wget", "-q", "-c", url, "-O", str(output_path)],
-        capture_output=True,
-        text=True,
-    )
+    output_path = cached_download_path(save_dir, objaverse_id)
+    partial_path = output_path.with_name(output_path.name + ".part")
+    url = OBJAVERSE_GLB_URL.format(objaverse_id=objaverse_id)
 
-    if result.returncode == 0:
+    timings = {}
+    try:
+        if output_path.exists():
+            logging.info(f"Using the cached download of {objaverse_id}.")
+        else:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_path = output_path.with_name(output_path.name + ".lock")
+            with file_lock(lock_path):
+                # Another writer may have finished the file while this one waited
+                if not output_path.exists():
+                    with timed(timings, "download"):
+                        downloader.download(url, partial_path)
+                    os.replace(partial_path, output_path)
+                    record_timings(
+                        index, timings, {"download": output_path.stat().st_size}
+                    )
+                # Only removed once the file exists, so a writer that opens a new lock
+                # file afterwards finds the download done
+                lock_path.unlink(missing_ok=True)
+        content_hash = file_sha256(output_path) if manifest is not None else None
+        record_stage(index, objaverse_id, "downloaded", True, content_hash=content_hash)
         return index, objaverse_id, output_path, True, ""
-    else:
-        shutil.rmtree(output_dir, ignore_errors=True)
-        return index, objaverse_id, None, False, result.stderr
+    except Exception as e:
+        record_timings(index, timings)
+        record_stage(index, objaverse_id, "downloaded", False, str(e))
+        return index, objaverse_id, None, False, str(e)
 
 
 def validate_and_convert_glb(args):
     """
-    Validates a GLB file and converts it to OBJ format.
+    Validates a GLB file and converts it to OBJ format, or to the binary mesh format
+    when `mesh_export_format` is "binary".
 
     Args:
         args (tuple): A tuple containing four elements:
@@ -76,81 +223,598 @@ def validate_and_convert_glb(args):
             - success (bool): True if the file was successfully validated and converted, False otherwise.
             - error_message (str): An empty string if successful, or the error message if failed.
     """
+    timings = {}
+    try:
+        return _validate_and_convert_glb(args, timings)
+    finally:
+        record_timings(args[0], timings)
+
+
+def configured_validator(mesh_path, cache=None):
+    """Returns a GLBMeshValidator with the validator settings of this run."""
+    from glb_checker.glb_validator import GLBMeshValidator
+
+    validator = GLBMeshValidator(mesh_path, cache=cache)
+    validator.MERGE_SCENES = merge_scenes
+    for name, value in validator_settings.items():
+        setattr(validator, name, value)
+    return validator
+
+
+def mesh_fingerprint(asset, validator):
+    """
+    Returns the geometric fingerprint of a GLB asset, for the deduplication index.
+
+    Files the validator rejects from their JSON header, files with a cached validation
+    result and files that fail to decode get None, so fingerprinting never decodes
+    geometry that validation would not have decoded.
+    """
+    from pipeline.dedup import geometric_fingerprint
+
+    if validator.rejected_by_header() or validator.is_cached():
+        return None
+    try:
+        return geometric_fingerprint(asset.scene)
+    except Exception:
+        return None
+
+
+def remember_result(fingerprint, settings, index, is_valid, reasons):
+    """Records a validation verdict in the deduplication index, if one is configured."""
+    if dedup_index is not None and fingerprint is not None:
+        dedup_index.put(fingerprint, settings, index, is_valid, reasons)
+
+
+def _validate_and_convert_glb(args, timings):
+    from glb_checker.glb_asset import GLBAsset
+    from mesh_export.binary_mesh import FILE_EXTENSION, export_binary_mesh
+    from pbr_extraction.texture_extractor import extract_pbr_textures
+
+    # Stage durations are added to `timings` as they complete
     index, objaverse_id, file_path, save_dir = args
     output_dir = Path(save_dir) / index.replace("/", "_")
-    if file_path and file_path.exists():
-        validator = GLBMeshValidator(str(file_path))
-        is_valid, reasons = validator.validate()
+    if not (file_path and file_path.exists()):
+        return index, objaverse_id, False, "File does not exist"
+
+    # Read and parse the file once, shared by validation, extraction and export.
+    # Files rejected from their JSON header never have their BIN chunk read; the
+    # cache key reuses the hash the download recorded instead of reading the file.
+    row = manifest.get(index) if manifest is not None else None
+    asset = GLBAsset(file_path, content_hash=row and row["content_hash"])
+    validator = configured_validator(asset, cache=validation_cache)
+
+    # Objects with the same geometry as an earlier one reuse its verdict. Textures
+    # and the mesh are still extracted from the object's own file, since duplicates
+    # may differ in their materials.
+    fingerprint = None
+    duplicate = None
+    settings = validator.fingerprint()
+    if dedup_index is not None:
+        with timed(timings, "fingerprint"):
+            fingerprint = mesh_fingerprint(asset, validator)
+            duplicate = fingerprint and dedup_index.get(fingerprint, settings)
+
+    if duplicate:
+        earlier_index, is_valid, reasons = duplicate
+        logging.info(f"{index} duplicates {earlier_index}, reusing its verdict.")
+    else:
+        with timed(timings, "validate"):
+            is_valid, reasons = validator.validate()
+        timings.update(
+            (f"check:{name}", seconds) for name, seconds in validator.timings.items()
+        )
+    record_stage(
+        index, objaverse_id, "validated", is_valid, reasons, retry=validator.errored
+    )
 
-        if is_valid:
-            logging.info(f"Valid GLB: {file_path}, exporting to OBJ...")
+    if not is_valid:
+        logging.warning(f"Invalid GLB: {file_path}. Reasons: {reasons}")
+        # An error is retried by the next run rather than taken as a verdict
+        if not validator.errored:
+            # Outputs of an earlier result under other settings no longer apply
+            shutil.rmtree(output_dir, ignore_errors=True)
+            remember_result(fingerprint, settings, index, False, reasons)
+        return index, objaverse_id, False, reasons
 
+    logging.info(f"Valid GLB: {file_path}, exporting to {mesh_export_format}...")
+    # Outputs are staged and only moved into `output_dir` once every stage succeeded;
+    # the source GLB stays in the download cache whatever the outcome
+    with StagedOutput(output_dir) as staging:
+        try:
             # Extract PBR textures and save to JSON
-            pbr_textures_info = extract_pbr_textures(file_path)
-            save_json(f"{output_dir}/pbr_textures.json", pbr_textures_info)
+            image_dir = staging.path / "textures" if extract_texture_images else None
+            with timed(timings, "extract_textures"):
+                pbr_textures_info = extract_pbr_textures(asset, image_dir=image_dir)
+                save_json(staging.path / "pbr_textures.json", pbr_textures_info)
+
+            with timed(timings, "quality_summary"):
+                quality = validator.quality_summary()
+                save_json(staging.path / "mesh_quality.json", quality)
+
+            # A merged scene is exported as the single mesh that was validated
+            mesh = asset.merged if merge_scenes else asset.scene
+            with timed(timings, "export"):
+                if mesh_export_format == "binary":
+                    export_binary_mesh(
+                        mesh, staging.path / (file_path.stem + FILE_EXTENSION)
+                    )
+                else:
+                    mesh.export(staging.path / (file_path.stem + ".obj"))
+            staging.commit()
+        except Exception as e:
+            logging.error(f"Error converting {file_path} to {mesh_export_format}: {e}")
+            record_stage(index, objaverse_id, "exported", False, str(e))
+            return index, objaverse_id, False, str(e)
+
+    record_stage(index, objaverse_id, "textures_extracted", True)
+    record_stage(index, objaverse_id, "exported", True)
+    remember_result(fingerprint, settings, index, True, [])
+    return index, objaverse_id, True, ""
+
+
+def is_transient(error):
+    """
+    Returns whether a validation task that raised `error` is retried by the next run.
+
+    A task past the worker memory cap fails the same way on every attempt, so it is
+    recorded as a verdict instead of spending the cap again on every rerun.
+    """
+    return not isinstance(error, MemoryError)
+
+
+def submit_validation(validation_pool, validation_args, **callbacks):
+    """Queues `validate_and_convert_glb` in the pool, limited to `task_timeout`."""
+    index = validation_args[0]
+    return validation_pool.apply_async(
+        run_limited,
+        (validate_and_convert_glb, index, (validation_args,), task_timeout),
+        **callbacks,
+    )
+
+
+def stream_download_and_validate(
+    download_args,
+    save_dir,
+    download_workers,
+    validation_workers,
+    max_pending,
+    validation_pool=None,
+    watchdog=None,
+):
+    """
+    Downloads and validates GLB files as a stream instead of two barriers.
+
+    Downloads run on a thread pool sharing the keep-alive connections of `downloader`,
+    and each finished download is handed straight to the validation pool, so network-bound
+    and CPU-bound work overlap. At most `max_pending` objects are in flight at any time,
+    which keeps memory flat no matter how many download arguments are supplied.
+
+    Args:
+        download_args (iterable): (index, objaverse_id, save_dir) tuples, consumed lazily.
+        save_dir (str): The directory where the processed files should be saved.
+        download_workers (int): Number of concurrent download threads.
+        validation_workers (int): Number of validation worker processes.
+        max_pending (int): Maximum number of objects downloading or validating at once.
+        validation_pool (multiprocessing.Pool, optional): An existing pool to validate in.
+            A pool of `validation_workers` processes is created if none is given.
+        watchdog (WorkerWatchdog, optional): The watchdog of `validation_pool`. Objects
+            whose validation worker died are then reported as failed instead of being
+            waited for forever.
+
+    Yields:
+        tuple: (index, objaverse_id, success, error_message) for every object, in completion order.
+            Failed downloads are reported with their download error.
+    """
+    completed = queue.Queue()
+
+    def on_done(stage, args):
+        return lambda result: completed.put((stage, args, result))
+
+    def on_error(args):
+        return lambda error: completed.put(("error", args, error))
+
+    args_iter = iter(download_args)
+    in_flight = 0
+    # index -> validation args of the objects queued for validation
+    validating = {}
+
+    with ExitStack() as stack:
+        if validation_pool is None:
+            validation_pool = stack.enter_context(
+                validation_context().Pool(
+                    processes=validation_workers,
+                    initializer=init_validation_worker,
+                    initargs=(worker_settings(),),
+                )
+            )
+        download_pool = stack.enter_context(ThreadPool(processes=download_workers))
+        while True:
+            while in_flight < max_pending:
+                args = next(args_iter, None)
+                if args is None:
+                    break
+                download_pool.apply_async(
+                    download_glb_file,
+                    (args,),
+                    callback=on_done("downloaded", args),
+                    error_callback=on_error(args),
+                )
+                in_flight += 1
+
+            if in_flight == 0:
+                break
+
+            try:
+                stage, args, result = completed.get(
+                    timeout=POLL_SECONDS if watchdog is not None else None
+                )
+            except queue.Empty:
+                for index in watchdog.lost_tasks():
+                    args = validating.pop(index, None)
+                    if args is None:
+                        continue
+                    record_stage(
+                        index, args[1], "validated", False, LOST_TASK_ERROR, retry=True
+                    )
+                    in_flight -= 1
+                    yield index, args[1], False, LOST_TASK_ERROR
+                continue
+
+            if len(args) == 4:
+                # A validation result; ignored if the object was already reported lost
+                if validating.pop(args[0], None) is None:
+                    continue
+                if watchdog is not None:
+                    watchdog.done(args[0])
+
+            if stage == "downloaded":
+                index, objaverse_id, path, success, error_message = result
+                if success:
+                    validation_args = (index, objaverse_id, path, save_dir)
+                    validating[index] = validation_args
+                    submit_validation(
+                        validation_pool,
+                        validation_args,
+                        callback=on_done("validated", validation_args),
+                        error_callback=on_error(validation_args),
+                    )
+                    continue
+                result = (index, objaverse_id, False, error_message)
+            elif stage == "error":
+                error = result
+                result = (args[0], args[1], False, str(error))
+                if len(args) == 4:
+                    record_stage(
+                        args[0],
+                        args[1],
+                        "validated",
+                        False,
+                        str(error),
+                        retry=is_transient(error),
+                    )
+
+            in_flight -= 1
+            yield result
+
+
+def has_textures(annotation):
+    """Returns whether any archive of an Objaverse annotation has a texture."""
+    if not annotation:
+        return False
+    return any(
+        archive.get("textureCount", 0) and archive["textureCount"] > 0
+        for archive in annotation.get("archives", {}).values()
+    )
+
+
+def select_textured_uids(uids, num_models, cache_path, batch_size=1000):
+    """
+    Selects the first `num_models` Objaverse UIDs that have textures.
+
+    Annotations are loaded a batch of UIDs at a time and only until enough textured
+    models are found, instead of for the whole catalog. The outcome of every checked
+    UID is cached on disk, so later runs only load annotations of unchecked UIDs. Each
+    batch appends one line to the cache, so writing it does not grow with its size.
+
+    Args:
+        uids (list): The candidate UIDs, in selection order.
+        num_models (int or None): The number of UIDs to select. None selects all textured UIDs.
+        cache_path (str or Path): JSON Lines file mapping checked UIDs to whether they
+            have textures.
+        batch_size (int, optional): Number of UIDs whose annotations are loaded at once.
+
+    Returns:
+        list: The selected UIDs.
+    """
+    cache_path = Path(cache_path)
+    textured = {}
+    if cache_path.exists():
+        for checked in load_json_lines(cache_path):
+            textured.update(checked)
+    num_models = len(uids) if num_models is None else num_models
+
+    selected = []
+    position = 0
+    while len(selected) < num_models and position < len(uids):
+        batch = uids[position : position + batch_size]
+        position += len(batch)
+        unchecked = [uid for uid in batch if uid not in textured]
+        if unchecked:
+            annotations = objaverse.load_annotations(unchecked)
+            checked = {uid: has_textures(annotations.get(uid)) for uid in unchecked}
+            append_json_line(cache_path, checked)
+            textured.update(checked)
+        selected.extend(uid for uid in batch if textured[uid])
+    return selected[:num_models]
+
+
+def stream_objaverse_models(
+    uids,
+    save_dir,
+    validation_pool,
+    batch_size=100,
+    download_processes=None,
+    watchdog=None,
+):
+    """
+    Downloads Objaverse models in batches and validates them in an existing pool.
+
+    Every batch is downloaded with a single `objaverse.load_objects` call, which uses the
+    library's own download processes, and each model is then queued for validation while
+    the next batch downloads. Downloaded files are moved into the shared download cache,
+    see `cached_download_path`, and models already there are not downloaded again.
+
+    Args:
+        uids (list): The Objaverse UIDs to process.
+        save_dir (str): The directory where the processed files should be saved.
+        validation_pool (multiprocessing.Pool): The pool to validate in.
+        batch_size (int, optional): Number of UIDs downloaded per `load_objects` call.
+        download_processes (int, optional): Download processes per batch. Defaults to cpu_count().
+        watchdog (WorkerWatchdog, optional): The watchdog of `validation_pool`, see
+            `stream_download_and_validate`.
+
+    Yields:
+        tuple: (uid, uid, success, error_message) for every UID. Failed downloads are
+            reported with their download error.
+    """
+    pending = []
+    # Lost tasks are reported once by the watchdog, whichever result is awaited
+    lost = set()
+
+    def finished(result):
+        uid, async_result = result
+        if watchdog is not None:
+            while not async_result.ready() and uid not in lost:
+                async_result.wait(POLL_SECONDS)
+                lost.update(watchdog.lost_tasks())
+            if not async_result.ready():
+                lost.discard(uid)
+                record_stage(uid, uid, "validated", False, LOST_TASK_ERROR, retry=True)
+                return uid, uid, False, LOST_TASK_ERROR
+            watchdog.done(uid)
+        try:
+            return async_result.get()
+        except Exception as e:
+            record_stage(uid, uid, "validated", False, str(e), retry=is_transient(e))
+            return uid, uid, False, str(e)
 
+    for start in range(0, len(uids), batch_size):
+        batch = uids[start : start + batch_size]
+        cached = {
+            uid: path
+            for uid in batch
+            if (path := cached_download_path(save_dir, f"{uid}.glb")).exists()
+        }
+        missing = [uid for uid in batch if uid not in cached]
+        timings = {}
+        downloaded, batch_error = {}, "Object not returned by objaverse.load_objects"
+        if missing:
             try:
-                mesh = trimesh.load(file_path)
-                output_obj_path = output_dir / (file_path.stem + ".obj")
-                mesh.export(output_obj_path)
-                return index, objaverse_id, True, ""
+                with timed(timings, "download"):
+                    downloaded = objaverse.load_objects(
+                        uids=missing,
+                        download_processes=download_processes or cpu_count(),
+                    )
             except Exception as e:
-                logging.error(f"Error converting {file_path} to OBJ: {e}")
-                shutil.rmtree(output_dir)
-                return index, objaverse_id, False, str(e)
-        else:
-            logging.warning(
-                f"Invalid GLB: {file_path}, deleting folder... Reasons: {reasons}"
-            )
-            shutil.rmtree(output_dir)
-            return index, objaverse_id, False, reasons
-    return index, objaverse_id, False, "File does not exist"
+                batch_error = str(e)
+            # A batch downloads in parallel; each object is charged an equal share
+            download_seconds = timings.get("download", 0.0) / len(missing)
+
+        for uid in batch:
+            if uid in cached:
+                glb_path = cached[uid]
+            elif uid in downloaded:
+                glb_path = cached_download_path(save_dir, downloaded[uid])
+                glb_path.parent.mkdir(parents=True, exist_ok=True)
+                # A move across filesystems copies; only a whole file enters the cache.
+                # The temporary name is this writer's own, unlike the resumable `.part`
+                # file of `download_glb_file`
+                partial_path = glb_path.with_name(
+                    f"{glb_path.name}.{socket.gethostname()}-{os.getpid()}.part"
+                )
+                shutil.move(downloaded[uid], partial_path)
+                os.replace(partial_path, glb_path)
+                record_timings(
+                    uid,
+                    {"download": download_seconds},
+                    {"download": glb_path.stat().st_size},
+                )
+            else:
+                record_stage(uid, uid, "downloaded", False, batch_error)
+                yield uid, uid, False, batch_error
+                continue
+
+            content_hash = file_sha256(glb_path) if manifest is not None else None
+            record_stage(uid, uid, "downloaded", True, content_hash=content_hash)
+            validation_args = (uid, uid, glb_path, save_dir)
+            pending.append((uid, submit_validation(validation_pool, validation_args)))
 
+        while pending and pending[0][1].ready():
+            yield finished(pending.pop(0))
 
-def download_and_filter_models(num_models=100, save_dir="datasets"):
+    for result in pending:
+        yield finished(result)
+
+
+def node_path(path, shard_index, num_shards):
+    """
+    Returns the per-node variant of an output path.
+
+    When the ID space is split across nodes, every node writes its own manifest,
+    validation cache and packed shards (SQLite is not safe to share between hosts
+    on a network filesystem), e.g. `manifest.node-2-of-8.sqlite`. A single node
+    uses the configured path unchanged.
     """
-    Downloads and filters models from the Objaverse dataset based on the availability of texture information.
+    path = Path(path)
+    if num_shards == 1:
+        return path
+    return path.with_name(f"{path.stem}.node-{shard_index}-of-{num_shards}{path.suffix}")
+
+
+def merge_node_outputs(config, num_shards):
+    """
+    Merges the manifests and packed shards written by `num_shards` nodes.
+
+    The per-node outputs are merged into the configured `manifest_path` and
+    `shard_dir`, and the combined stage counts are logged.
 
     Args:
-        num_models (int, optional): The number of models to download and filter. Defaults to 100.
-        save_dir (str, optional): The directory where the downloaded and filtered models should be saved. Defaults to "datasets".
+        config (dict): The pipeline configuration.
+        num_shards (int): The number of nodes the run was split across.
 
     Returns:
-        dict: A dictionary where the keys are the UIDs of the downloaded models and the values are dictionaries containing the local paths of the downloaded files.
+        dict: The combined manifest stage counts.
+
+    Raises:
+        ValueError: If `num_shards` is 1, as a single node writes to the configured
+            paths directly and there is nothing to merge.
     """
-    all_uids = objaverse.load_uids()  # Download all models
-    selected_uids = all_uids
+    if num_shards == 1:
+        raise ValueError("Nothing to merge from a single node; pass --num-shards.")
+    save_dir = config["download_dir"]
+    manifest_path = config.get("manifest_path", f"{save_dir}/manifest.sqlite")
+    merged_manifest = JobManifest(manifest_path)
+    for shard_index in range(num_shards):
+        path = node_path(manifest_path, shard_index, num_shards)
+        if path.exists():
+            rows = merged_manifest.merge(path)
+            logging.info(f"Merged {rows} manifest rows from {path}.")
+        else:
+            logging.warning(f"No manifest found for node {shard_index}: {path}")
 
-    annotations = objaverse.load_annotations(selected_uids)
+    if config.get("shard_dir"):
+        from mesh_export.shard_packer import merge_shards
 
-    textured_uids = [
-        uid
-        for uid in selected_uids
-        if any(
-            archive.get("textureCount", 0) and archive["textureCount"] > 0
-            for archive in annotations[uid]["archives"].values()
+        merged = merge_shards(
+            (node_path(config["shard_dir"], k, num_shards) for k in range(num_shards)),
+            config["shard_dir"],
         )
-    ]
+        logging.info(f"Merged {merged} packed meshes into {config['shard_dir']}.")
 
-    downloaded_objects = {}
-    for uid in textured_uids:
-        model_download_path = Path(save_dir) / uid
-        model_download_path.mkdir(parents=True, exist_ok=True)
+    counts = merged_manifest.counts()
+    logging.info(f"Merged manifest stage counts: {counts}")
+    return counts
 
-        logging.info(f"Downloading model {uid} to {model_download_path}...")
-        downloaded_objects[uid] = objaverse.load_objects(
-            uids=[uid],
-            download_processes=os.cpu_count(),
-        )
 
-        for object_uid, local_path in downloaded_objects[uid].items():
-            new_path = model_download_path / Path(local_path).name
-            shutil.move(local_path, new_path)
+def revalidate(save_dir):
+    """
+    Re-decides every validated object under the current validator settings.
+
+    Pass/fail is decided in bulk from the measurements stored in the validation cache,
+    without loading any geometry, see `glb_checker.revalidation`. The new decisions are
+    cached, so the next run reuses them:
 
-    return downloaded_objects
+    - Objects that are no longer valid lose their outputs and are recorded as rejected.
+    - Objects that became valid are reset in the manifest, so the next run exports them.
+    - Objects whose measurements are missing or stale, e.g. after a change to a check or
+      to `OFFSET_SCALE_FACTOR`, are reset too, so the next run validates their geometry
+      again in its limited worker pool.
 
+    Args:
+        save_dir (str): The pipeline output directory with one folder per index.
 
-def main():
+    Returns:
+        dict: The number of re-decided, pending, newly valid and newly invalid objects.
+    """
+    import numpy as np
+
+    from glb_checker.revalidation import measurement_arrays, redecide
+
+    objects = manifest.validated_objects()
+    content_hashes = [content_hash for _, _, content_hash, _ in objects]
+    validator = configured_validator(None)
+    values, present = measurement_arrays(validator, validation_cache, content_hashes)
+    is_valid, needs_geometry, errors = redecide(
+        validator,
+        values,
+        present,
+        load_errors=lambda i: validation_cache.latest_errors(content_hashes[i]),
+    )
+
+    # The new decisions are written in a few bulk transactions
+    fingerprint = validator.fingerprint()
+    decided = np.flatnonzero(~needs_geometry)
+    was_valid = np.array([valid for *_, valid in objects], dtype=bool)
+    now_invalid = np.flatnonzero(~needs_geometry & ~is_valid & was_valid)
+    now_valid = np.flatnonzero(~needs_geometry & is_valid & ~was_valid)
+
+    validation_cache.put_many(
+        (content_hashes[i], fingerprint, bool(is_valid[i]), errors[i]) for i in decided
+    )
+    manifest.record_many(
+        "validated",
+        (
+            (objects[i][0], objects[i][1], False, errors[i])
+            for i in decided
+            if not is_valid[i]
+        ),
+    )
+    for i in now_invalid:
+        shutil.rmtree(Path(save_dir) / objects[i][0].replace("/", "_"), ignore_errors=True)
+    manifest.reset(
+        [objects[i][0] for i in now_invalid], ("textures_extracted", "exported")
+    )
+    manifest.reset(
+        [objects[i][0] for i in (*np.flatnonzero(needs_geometry), *now_valid)]
+    )
+    return {
+        "redecided": len(decided),
+        "pending": int(needs_geometry.sum()),
+        "now_valid": len(now_valid),
+        "now_invalid": len(now_invalid),
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the GLB processing pipeline.")
+    parser.add_argument(
+        "--config", default="config/config.json", help="Path to the pipeline settings."
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        help="Process only this shard of the ID space (overrides shard_index).",
+    )
+    parser.add_argument(
+        "--num-shards",
+        type=int,
+        help="Number of shards the ID space is split into (overrides num_shards).",
+    )
+    parser.add_argument(
+        "--merge",
+        action="store_true",
+        help="Merge the outputs of --num-shards nodes instead of running the pipeline.",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-decide validated objects from stored measurements under the current "
+        "validator settings instead of running the pipeline.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(args=None):
     """
     Executes the GLB processing pipeline.
 
@@ -159,58 +823,212 @@ def main():
     and the Objaverse framework, and calculates the number of valid GLB files processed from each source. Finally, it logs
     the results including the count of valid GLB files and the elapsed time.
 
+    Several nodes can split the work by running with the same `--num-shards` and distinct
+    `--shard-index` values; `--merge` then combines their outputs.
+
     Args:
-        None
+        args (argparse.Namespace, optional): Parsed command line arguments. Defaults to none given.
 
     Returns:
         None
     """
+    if args is None:
+        args = parse_args([])
 
     setup_logging()
-    logging.info("Starting the GLB processing pipeline...")
 
-    save_dir = "datasets"
+    global manifest, metrics, validation_cache, dedup_index
+    global extract_texture_images, mesh_export_format, merge_scenes, validator_settings
+    global task_timeout, download_cache_dir
+
+    config = load_json(args.config)
+    save_dir = config["download_dir"]
+    shard_index = (
+        args.shard_index if args.shard_index is not None else config.get("shard_index", 0)
+    )
+    num_shards = args.num_shards or config.get("num_shards", 1)
+
+    if args.merge:
+        merge_node_outputs(config, num_shards)
+        return
+
+    logging.info(
+        f"Starting the GLB processing pipeline (shard {shard_index} of {num_shards})..."
+    )
+    downloader.configure(
+        retry_attempts=config.get("retry_attempts"), timeout=config.get("timeout")
+    )
     os.makedirs(save_dir, exist_ok=True)
+    extract_texture_images = config.get("extract_texture_images", False)
+    mesh_export_format = config.get("mesh_export_format", "obj")
+    merge_scenes = config.get("merge_scenes", False)
+    # GLBMeshValidator class attributes to override, e.g. quality thresholds
+    validator_settings = config.get("validator", {})
+    # Source GLBs are kept here whatever their validation result, so reruns reuse them
+    download_cache_dir = config.get("download_cache_dir")
+
+    # Objects exported or rejected by a previous run are skipped
+    manifest = JobManifest(
+        node_path(
+            config.get("manifest_path", f"{save_dir}/manifest.sqlite"),
+            shard_index,
+            num_shards,
+        )
+    )
+    validation_cache = ValidationCache(
+        node_path(
+            config.get("validation_cache_path", f"{save_dir}/validation_cache.sqlite"),
+            shard_index,
+            num_shards,
+        ),
+        max_entries=config.get("validation_cache_max_entries", 1000000),
+    )
+
+    if args.revalidate:
+        counts = revalidate(save_dir)
+        logging.info(f"Re-validation finished: {counts}")
+        return
+
+    finished_ids = manifest.finished_ids()
+    logging.info(f"Skipping {len(finished_ids)} objects finished by a previous run.")
+
+    # Objects sharing their geometry with an earlier one reuse its result
+    if config.get("dedup_index_path"):
+        from pipeline.dedup import DedupIndex
 
-    non_monotonous_ids = list(load_json("datasets/non-monotonous_images_all.json"))
-    index_to_objaverse = load_json("datasets/gobjaverse_index_to_objaverse.json")
+        dedup_index = DedupIndex(
+            node_path(config["dedup_index_path"], shard_index, num_shards)
+        )
 
-    save_json("all_ids.json", non_monotonous_ids)  # Store all IDs
+    # Stage timings of every worker land in one store, summarized at the end of the run
+    metrics = RunMetrics(
+        node_path(
+            config.get("metrics_path", f"{save_dir}/metrics.sqlite"),
+            shard_index,
+            num_shards,
+        )
+    )
 
     start_time = time.time()
 
-    download_args = [
+    # Both ID files are streamed; this node only takes its shard of the ID space
+    download_args = (
         (index, objaverse_id, save_dir)
-        for index, objaverse_id in index_to_objaverse.items()
-        if index in non_monotonous_ids  # Process all models
+        for index, objaverse_id in select_work(
+            "datasets/gobjaverse_index_to_objaverse.json",
+            "datasets/non-monotonous_images_all.json",
+            skip_ids=finished_ids,
+            shard_index=shard_index,
+            num_shards=num_shards,
+        )
+    )
+
+    # Textured Objaverse models of this shard, selected from cached annotations
+    shard_uids = [
+        uid for uid in objaverse.load_uids() if shard_of(uid, num_shards) == shard_index
+    ]
+    textured_uids_cache = node_path(
+        config.get("textured_uids_cache", f"{save_dir}/objaverse_textured_uids.jsonl"),
+        shard_index,
+        num_shards,
+    )
+    objaverse_uids = [
+        uid
+        for uid in select_textured_uids(
+            shard_uids, config.get("max_models"), textured_uids_cache
+        )
+        if uid not in finished_ids
     ]
 
-    with Pool(processes=cpu_count()) as pool:
-        download_results = pool.map(download_glb_file, download_args)
+    valid_gobjaverse_count = 0
+    valid_objaverse_count = 0
+    validation_workers = config.get("validation_workers") or cpu_count()
 
-        valid_glb_files = [
-            (index, objaverse_id, path, save_dir)
-            for index, objaverse_id, path, success, _ in download_results
-            if success
-        ]
+    # A task past its memory cap or timeout fails alone; workers stuck in native code
+    # for twice the timeout are killed, and workers are recycled every
+    # `worker_max_tasks` tasks
+    task_timeout = config.get("task_timeout")
+    memory_limit_mb = config.get("worker_memory_limit_mb")
 
-        validation_results = pool.map(validate_and_convert_glb, valid_glb_files)
+    # Workers get the settings of the run, import the validation stage up front and,
+    # if configured, profile it
+    warm_up = {
+        "initializer": init_validation_worker,
+        "initargs": (
+            worker_settings(),
+            config.get("profile_dir"),
+            config.get("trace_memory", False),
+        ),
+    }
+    context = validation_context()
+    watchdog = WorkerWatchdog(
+        hard_timeout=2 * task_timeout if task_timeout else None, context=context
+    )
+    pool_options = watchdog.pool_options(
+        memory_limit_mb and memory_limit_mb * 2**20, **warm_up
+    )
+    with context.Pool(
+        processes=validation_workers,
+        maxtasksperchild=config.get("worker_max_tasks"),
+        **pool_options,
+    ) as validation_pool:
+        for _, _, success, _ in stream_download_and_validate(
+            download_args,
+            save_dir,
+            download_workers=config.get("download_workers") or cpu_count(),
+            validation_workers=None,
+            max_pending=config.get("max_pending", 256),
+            validation_pool=validation_pool,
+            watchdog=watchdog,
+        ):
+            if success:
+                valid_gobjaverse_count += 1
 
-        objaverse_models = download_and_filter_models(num_models=30, save_dir=save_dir)
-        valid_objaverse_models = []
-        for uid, local_path in objaverse_models.items():
-            model_dir = Path(save_dir) / uid
-            glb_path = list(model_dir.glob("*.glb"))[0]
-            _, _, success, _ = validate_and_convert_glb((uid, uid, glb_path, save_dir))
+        for _, _, success, _ in stream_objaverse_models(
+            objaverse_uids,
+            save_dir,
+            validation_pool,
+            batch_size=config.get("objaverse_batch_size", 100),
+            watchdog=watchdog,
+        ):
             if success:
-                valid_objaverse_models.append(uid)
+                valid_objaverse_count += 1
 
-    valid_gobjaverse_count = sum(
-        1 for _, _, success, _ in validation_results if success
-    )
-    valid_objaverse_count = len(valid_objaverse_models)
+        # Let the workers exit normally, so their profiles are written
+        validation_pool.close()
+        validation_pool.join()
+
+    # Concatenate every exported mesh and its PBR metadata into large shards
+    if config.get("shard_dir"):
+        from mesh_export.shard_packer import MAX_SHARD_BYTES, pack_dataset
+
+        shard_dir = node_path(config["shard_dir"], shard_index, num_shards)
+        packed = pack_dataset(
+            save_dir,
+            shard_dir,
+            manifest.exported_ids(),
+            max_shard_bytes=config.get("max_shard_bytes", MAX_SHARD_BYTES),
+        )
+        logging.info(f"Packed {packed} exported meshes into {shard_dir}.")
 
     elapsed_time = int(time.time() - start_time)
+    report = metrics.report(
+        time.time() - start_time, slowest=config.get("report_slowest", 20)
+    )
+    report_path = node_path(
+        config.get("report_path", f"{save_dir}/run_report.json"), shard_index, num_shards
+    )
+    save_json(report_path, report)
+    for stage, summary in report["stages"].items():
+        logging.info(
+            f"{stage}: {summary['count']} objects, p50 {summary['p50']:.3f}s, "
+            f"p95 {summary['p95']:.3f}s, max {summary['max']:.3f}s"
+        )
+    logging.info(
+        f"Downloaded {report['bytes_downloaded'] / 1e6:.1f} MB "
+        f"({report['download_mb_per_second']:.2f} MB/s). Run report: {report_path}"
+    )
+
     hours, remainder = divmod(elapsed_time, 3600)
     minutes, seconds = divmod(remainder, 60)
 
@@ -218,8 +1036,10 @@ def main():
         f"Download process completed. Valid GLBs from gobjaverse_index_to_objaverse.json: {valid_gobjaverse_count}"
     )
     logging.info(f"Valid GLBs from Objaverse framework: {valid_objaverse_count}")
+    logging.info(f"Manifest stage counts: {manifest.counts()}")
+    logging.info(f"Validation cache: {validation_cache.stats()}")
     logging.info(f"Elapsed time: {hours:02d}h {minutes:02d}min {seconds:02d}s")
 
 
 if __name__ == "__main__":
-    main()
+    main(parse_args())
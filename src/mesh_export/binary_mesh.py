@@ -0,0 +1,117 @@
+import json
+import struct
+from pathlib import Path
+
+import numpy as np
+
+MAGIC = b"BINMESH1"
+ALIGNMENT = 64
+FILE_EXTENSION = ".mesh"
+
+
+def _aligned(offset):
+    return offset + (-offset % ALIGNMENT)
+
+
+def write_binary_mesh(path, arrays):
+    """
+    Writes named arrays to a flat, memory-mappable file.
+
+    Layout: the 8-byte magic, a little-endian uint64 with the JSON table length, the
+    JSON table describing every array (dtype, shape and byte offset from the start of
+    the data section), then the data section holding the raw C-ordered array bytes.
+    The data section and every array start on a 64-byte boundary.
+
+    Args:
+        path (str or Path): The destination file.
+        arrays (dict): name -> np.ndarray.
+    """
+    arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+
+    table = {}
+    offset = 0
+    for name, array in arrays.items():
+        table[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    encoded = json.dumps({"arrays": table}).encode()
+    data_start = _aligned(len(MAGIC) + 8 + len(encoded))
+
+    with open(path, "wb") as file:
+        file.write(MAGIC)
+        file.write(struct.pack("<Q", len(encoded)))
+        file.write(encoded)
+        for name, array in arrays.items():
+            file.write(b"\x00" * (data_start + table[name]["offset"] - file.tell()))
+            array.tofile(file)
+
+
+def read_binary_mesh(path):
+    """
+    Memory-maps the arrays of a file written by `write_binary_mesh`.
+
+    No array data is read until it is accessed.
+
+    Args:
+        path (str or Path): The file to read.
+
+    Returns:
+        dict: name -> read-only np.memmap.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a binary mesh file.")
+        (table_length,) = struct.unpack("<Q", file.read(8))
+        table = json.loads(file.read(table_length))["arrays"]
+    data_start = _aligned(len(MAGIC) + 8 + table_length)
+
+    arrays = {}
+    for name, entry in table.items():
+        shape = tuple(entry["shape"])
+        if 0 in shape:
+            # mmap cannot map an empty range
+            arrays[name] = np.empty(shape, dtype=entry["dtype"])
+            continue
+        arrays[name] = np.memmap(
+            path,
+            mode="r",
+            dtype=entry["dtype"],
+            offset=data_start + entry["offset"],
+            shape=shape,
+        )
+    return arrays
+
+
+def mesh_arrays(mesh):
+    """
+    Collects the arrays stored for a mesh.
+
+    Args:
+        mesh (trimesh.Trimesh or trimesh.Scene): The mesh. Scenes are flattened with
+            their node transforms applied, as the OBJ exporter does.
+
+    Returns:
+        dict: `vertices`, `faces`, `normals` and, for textured meshes, `uvs`.
+    """
+    if hasattr(mesh, "to_mesh"):
+        mesh = mesh.to_mesh()
+
+    arrays = {
+        "vertices": mesh.vertices.astype(np.float32),
+        "faces": mesh.faces.astype(np.uint32),
+        "normals": mesh.vertex_normals.astype(np.float32),
+    }
+    uv = getattr(mesh.visual, "uv", None)
+    if uv is not None and len(uv) == len(mesh.vertices):
+        arrays["uvs"] = np.asarray(uv, dtype=np.float32)
+    return arrays
+
+
+def export_binary_mesh(mesh, path):
+    """
+    Exports a mesh to the binary mesh format.
+
+    Args:
+        mesh (trimesh.Trimesh or trimesh.Scene): The mesh to export.
+        path (str or Path): The destination file.
+    """
+    write_binary_mesh(Path(path), mesh_arrays(mesh))
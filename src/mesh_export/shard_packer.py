@@ -0,0 +1,273 @@
+import json
+import logging
+from pathlib import Path
+
+import numpy as np
+
+from glb_checker.utils import load_json, read_complete_lines, repair_partial_line
+from .binary_mesh import ALIGNMENT, FILE_EXTENSION, mesh_arrays, read_binary_mesh
+
+INDEX_FILE = "index.jsonl"
+MAX_SHARD_BYTES = 1 << 30
+
+
+def shard_name(shard):
+    return f"shard_{shard:05d}.bin"
+
+
+def read_index(output_dir):
+    """
+    Returns the entries of a shard directory's index, empty if it has none.
+
+    A last entry cut off by an interrupted append is skipped; its object is packed
+    again by the next run.
+    """
+    index_path = Path(output_dir) / INDEX_FILE
+    if not index_path.exists():
+        return []
+    return [json.loads(line) for line in read_complete_lines(index_path)]
+
+
+def open_index(output_dir):
+    """Opens a shard directory's index for appending, dropping a partial last entry."""
+    index_path = Path(output_dir) / INDEX_FILE
+    if index_path.exists():
+        repair_partial_line(index_path)
+    return open(index_path, "a")
+
+
+class ShardWriter:
+    """
+    Appends meshes and their metadata to large shard files.
+
+    Array bytes are concatenated into `shard_XXXXX.bin` files of at most
+    `max_shard_bytes` (a single larger mesh gets a shard of its own). Every packed
+    object adds one line to `index.jsonl` holding its shard, the dtype, shape and
+    byte offset of each array, and its metadata. Reopening an existing directory
+    continues the last shard, so packing can be run incrementally.
+    """
+
+    def __init__(self, output_dir, max_shard_bytes=MAX_SHARD_BYTES):
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.max_shard_bytes = max_shard_bytes
+        self.packed_ids = set()
+        self.shard = 0
+
+        for entry in read_index(self.output_dir):
+            self.packed_ids.add(entry["index_id"])
+            self.shard = max(self.shard, entry["shard"])
+
+        self._index = open_index(self.output_dir)
+        self._data = open(self.output_dir / shard_name(self.shard), "ab")
+
+    def add(self, index_id, arrays, metadata=None):
+        """
+        Appends one object to the current shard.
+
+        Args:
+            index_id (str): The index identifier of the object.
+            arrays (dict): name -> np.ndarray, e.g. from `binary_mesh.mesh_arrays`.
+            metadata (optional): JSON-serializable metadata, e.g. the PBR materials.
+        """
+        arrays = {name: np.ascontiguousarray(array) for name, array in arrays.items()}
+        size = sum(array.nbytes for array in arrays.values())
+        position = self._data.tell()
+        if size and position and position + size > self.max_shard_bytes:
+            self._data.close()
+            self.shard += 1
+            self._data = open(self.output_dir / shard_name(self.shard), "ab")
+
+        table = {}
+        for name, array in arrays.items():
+            self._data.write(b"\x00" * (-self._data.tell() % ALIGNMENT))
+            table[name] = {
+                "dtype": array.dtype.str,
+                "shape": list(array.shape),
+                "offset": self._data.tell(),
+            }
+            array.tofile(self._data)
+        self._data.flush()
+
+        entry = {
+            "index_id": index_id,
+            "shard": self.shard,
+            "arrays": table,
+            "metadata": metadata,
+        }
+        self._index.write(json.dumps(entry) + "\n")
+        self._index.flush()
+        self.packed_ids.add(index_id)
+
+    def close(self):
+        self._data.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class ShardReader:
+    """
+    Random access to packed meshes by index id.
+
+    The index is loaded into a dictionary and every shard is memory-mapped once on
+    first use, so reading one mesh costs a dictionary lookup plus the pages of its
+    own arrays, regardless of the size of the shard.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self._entries = {entry["index_id"]: entry for entry in read_index(output_dir)}
+        self._shards = {}
+
+    def _shard(self, shard):
+        if shard not in self._shards:
+            self._shards[shard] = np.memmap(
+                self.output_dir / shard_name(shard), mode="r", dtype=np.uint8
+            )
+        return self._shards[shard]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, index_id):
+        return index_id in self._entries
+
+    def keys(self):
+        return self._entries.keys()
+
+    def metadata(self, index_id):
+        """Returns the metadata packed with an object."""
+        return self._entries[index_id]["metadata"]
+
+    def __getitem__(self, index_id):
+        """
+        Returns the arrays of a packed object as read-only views into its shard.
+
+        Args:
+            index_id (str): The index identifier of the object.
+
+        Returns:
+            dict: name -> np.ndarray.
+        """
+        entry = self._entries[index_id]
+        arrays = {}
+        for name, spec in entry["arrays"].items():
+            dtype = np.dtype(spec["dtype"])
+            shape = tuple(spec["shape"])
+            count = int(np.prod(shape))
+            if count == 0:
+                arrays[name] = np.empty(shape, dtype=dtype)
+                continue
+            data = self._shard(entry["shard"])
+            start = spec["offset"]
+            arrays[name] = (
+                data[start : start + count * dtype.itemsize].view(dtype).reshape(shape)
+            )
+        return arrays
+
+
+def load_exported_mesh(object_dir):
+    """
+    Loads the arrays of an object exported by `validate_and_convert_glb`.
+
+    Args:
+        object_dir (Path): The object's output directory.
+
+    Returns:
+        dict or None: The mesh arrays, or None if the directory has no exported mesh.
+    """
+    # Imported here, so merging shards does not load trimesh
+    import trimesh
+
+    for path in object_dir.glob(f"*{FILE_EXTENSION}"):
+        return read_binary_mesh(path)
+    for path in object_dir.glob("*.obj"):
+        return mesh_arrays(trimesh.load(path))
+    return None
+
+
+def pack_dataset(save_dir, output_dir, index_ids, max_shard_bytes=MAX_SHARD_BYTES):
+    """
+    Packs exported meshes and their PBR metadata into shards.
+
+    Args:
+        save_dir (str or Path): The pipeline output directory with one folder per index.
+        output_dir (str or Path): The directory holding the shards and `index.jsonl`.
+        index_ids (iterable): The index identifiers to pack. Already packed ones are skipped.
+        max_shard_bytes (int): The target size of a shard file.
+
+    Returns:
+        int: The number of objects packed by this call.
+    """
+    packed = 0
+    with ShardWriter(output_dir, max_shard_bytes=max_shard_bytes) as writer:
+        for index_id in index_ids:
+            if index_id in writer.packed_ids:
+                continue
+            object_dir = Path(save_dir) / index_id.replace("/", "_")
+            try:
+                arrays = load_exported_mesh(object_dir)
+                if arrays is None:
+                    continue
+                pbr_path = object_dir / "pbr_textures.json"
+                metadata = load_json(pbr_path) if pbr_path.exists() else None
+                writer.add(index_id, arrays, metadata)
+                packed += 1
+            except Exception as e:
+                logging.error(f"Error packing {index_id}: {e}")
+    return packed
+
+
+def merge_shards(source_dirs, output_dir):
+    """
+    Moves the shards of several directories, e.g. one per node, into one directory.
+
+    Shard files are renamed rather than copied, so the source directories must be on
+    the same filesystem as `output_dir`. Objects already in `output_dir` are kept and
+    their duplicates in the sources are dropped. Emptied source directories are removed.
+    A source that is `output_dir` itself is skipped, so its shards are never moved away.
+
+    Args:
+        source_dirs (iterable): The shard directories to merge.
+        output_dir (str or Path): The merged shard directory.
+
+    Returns:
+        int: The number of objects merged.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    existing = read_index(output_dir)
+    packed_ids = {entry["index_id"] for entry in existing}
+    next_shard = max((entry["shard"] for entry in existing), default=-1) + 1
+
+    merged = 0
+    with open_index(output_dir) as index:
+        for source in map(Path, source_dirs):
+            if source.resolve() == output_dir.resolve():
+                logging.warning(f"Not merging {source} into itself.")
+                continue
+            entries = read_index(source)
+            renamed = {}
+            for shard in sorted({entry["shard"] for entry in entries}):
+                (source / shard_name(shard)).replace(output_dir / shard_name(next_shard))
+                renamed[shard] = next_shard
+                next_shard += 1
+            for entry in entries:
+                if entry["index_id"] in packed_ids:
+                    continue
+                entry["shard"] = renamed[entry["shard"]]
+                index.write(json.dumps(entry) + "\n")
+                packed_ids.add(entry["index_id"])
+                merged += 1
+            index.flush()
+
+            for path in [*source.glob("shard_*.bin"), source / INDEX_FILE]:
+                path.unlink(missing_ok=True)
+            if source.exists() and not any(source.iterdir()):
+                source.rmdir()
+    return merged
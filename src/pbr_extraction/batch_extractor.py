@@ -0,0 +1,152 @@
+import json
+import logging
+from multiprocessing import Pool, cpu_count
+from pathlib import Path
+
+from glb_checker.utils import (
+    read_complete_lines,
+    repair_partial_line,
+    truncate_trailing_lines,
+)
+
+from .texture_extractor import extract_pbr_textures
+
+
+def _extract_object(args):
+    object_id, glb_path, image_root = args
+    image_dir = Path(image_root) / object_id.replace("/", "_") if image_root else None
+    try:
+        return object_id, extract_pbr_textures(glb_path, image_dir=image_dir), ""
+    except Exception as e:
+        return object_id, [], str(e)
+
+
+def done_ids_path(records_path):
+    """Returns the sidecar file listing the objects a shard is complete for."""
+    records_path = Path(records_path)
+    return records_path.with_name(records_path.name + ".done")
+
+
+def existing_object_ids(records_path):
+    """
+    Returns the object ids a JSON Lines shard is complete for.
+
+    An object is marked done in the `.done` sidecar once all of its records, possibly
+    none, were written, so objects without materials are not extracted again either.
+    For shards written before the sidecar existed, the ids of their records are used.
+
+    Args:
+        records_path (str or Path): The shard written by `extract_pbr_textures_batch`.
+
+    Returns:
+        set: The object ids, empty if the shard does not exist yet.
+    """
+    done_path = done_ids_path(records_path)
+    if done_path.exists():
+        return {line.strip() for line in read_complete_lines(done_path)}
+    if not Path(records_path).exists():
+        return set()
+    return {json.loads(line)["object_id"] for line in read_complete_lines(records_path)}
+
+
+def extract_pbr_textures_batch(
+    glb_paths, records_path, processes=None, image_root=None, skip_existing=True
+):
+    """
+    Extracts PBR material data from many GLB files in parallel into one shard.
+
+    Every material becomes one JSON Lines record holding the `object_id` and
+    `material_index` key columns followed by the fields of `extract_pbr_textures`.
+    Records are appended, so a shard can be grown incrementally across runs; every
+    extracted object is then listed in the `.done` sidecar, see `existing_object_ids`.
+    A partial line left by an interrupted run is removed before appending, and so are
+    the records of an object the run did not get to mark done, which is extracted again.
+
+    Args:
+        glb_paths (dict or iterable): object id -> GLB path, or (object_id, path) pairs.
+        records_path (str or Path): The JSON Lines shard to append to.
+        processes (int, optional): Number of worker processes. Defaults to cpu_count().
+        image_root (str or Path, optional): If set, embedded images are written to
+            `<image_root>/<object_id>/`.
+        skip_existing (bool): Skip objects that already have records in the shard.
+
+    Returns:
+        dict: A dictionary with the following key-value pairs:
+            - objects: Number of objects extracted in this call.
+            - records: Number of material records appended.
+            - errors: object id -> error message of objects that failed.
+    """
+    items = glb_paths.items() if isinstance(glb_paths, dict) else glb_paths
+    done = existing_object_ids(records_path) if skip_existing else set()
+    tasks = (
+        (object_id, str(path), image_root)
+        for object_id, path in items
+        if object_id not in done
+    )
+
+    summary = {"objects": 0, "records": 0, "errors": {}}
+    records_path = Path(records_path)
+    done_path = done_ids_path(records_path)
+    records_path.parent.mkdir(parents=True, exist_ok=True)
+    for path in (records_path, done_path):
+        if path.exists():
+            repair_partial_line(path)
+    if not done_path.exists():
+        # Start the sidecar of a shard written before it existed
+        legacy_ids = sorted(existing_object_ids(records_path))
+        done_path.write_text("".join(f"{object_id}\n" for object_id in legacy_ids))
+    elif records_path.exists():
+        # Objects are marked done in the order their records were written, so only
+        # the records at the end of the shard can belong to an unfinished object
+        finished = existing_object_ids(records_path)
+        truncate_trailing_lines(
+            records_path, lambda line: json.loads(line)["object_id"] in finished
+        )
+
+    with Pool(processes=processes or cpu_count()) as pool, open(
+        records_path, "a"
+    ) as file, open(done_path, "a") as done_file:
+        for object_id, materials, error in pool.imap_unordered(
+            _extract_object, tasks, chunksize=16
+        ):
+            if error:
+                logging.error(f"Error extracting PBR textures of {object_id}: {error}")
+                summary["errors"][object_id] = error
+                continue
+            lines = []
+            for material_index, material in enumerate(materials):
+                record = {
+                    "object_id": object_id,
+                    "material_index": material_index,
+                    **material,
+                }
+                lines.append(json.dumps(record) + "\n")
+            file.write("".join(lines))
+            # The object is only marked done once its records are on disk
+            file.flush()
+            done_file.write(f"{object_id}\n")
+            done_file.flush()
+            summary["objects"] += 1
+            summary["records"] += len(materials)
+    return summary
+
+
+def load_pbr_records(records_path, columns=None):
+    """
+    Loads a JSON Lines shard into columns.
+
+    Args:
+        records_path (str or Path): The shard written by `extract_pbr_textures_batch`.
+        columns (list, optional): The columns to load. Defaults to every column found.
+
+    Returns:
+        dict: column name -> list of values, one per record. Values missing from a
+        record are None.
+    """
+    records = [json.loads(line) for line in read_complete_lines(records_path)]
+
+    if columns is None:
+        columns = []
+        for record in records:
+            columns.extend(key for key in record if key not in columns)
+    return {column: [record.get(column) for record in records] for column in columns}
@@ -1,61 +1,115 @@
-from pygltflib import GLTF2
+from pathlib import Path
 
+from glb_checker.glb_asset import GLBAsset
 
-def extract_pbr_textures(glb_file):
+IMAGE_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/webp": ".webp",
+    "image/ktx2": ".ktx2",
+}
+
+
+def _texture_source(gltf, texture_info):
+    """Returns the image source index of a textureInfo, or "No Texture"."""
+    if not texture_info:
+        return "No Texture"
+    return gltf.get("textures", [])[texture_info["index"]].get("source")
+
+
+def write_texture_image(asset, source, image_dir, written):
+    """
+    Writes an embedded image to disk straight from the GLB BIN chunk.
+
+    The image bytes are a memoryview slice of the already loaded file, written
+    without decoding or copying. Images are written once per bufferView, so an
+    image shared between materials or textures is only stored once.
+
+    Args:
+        asset (GLBAsset): The loaded GLB file.
+        source (int): Index into the glTF `images` array.
+        image_dir (Path): The directory where images are written.
+        written (dict): bufferView index -> file name of images written so far.
+
+    Returns:
+        str or None: The image file name, or None if the image is not stored in the BIN chunk.
+    """
+    image = asset.header.get("images", [])[source]
+    view_index = image.get("bufferView")
+    if view_index is None:
+        return None
+
+    if view_index not in written:
+        extension = IMAGE_EXTENSIONS.get(image.get("mimeType"), ".bin")
+        file_name = f"image_{source}{extension}"
+        image_dir.mkdir(parents=True, exist_ok=True)
+        with open(image_dir / file_name, "wb") as file:
+            file.write(asset.buffer_view(view_index))
+        written[view_index] = file_name
+    return written[view_index]
+
+
+def extract_pbr_textures(glb_file, image_dir=None):
     """
     Extracts PBR material data from a GLB file.
 
     Args:
-        glb_file: The path to the GLB file.
+        glb_file: The path to the GLB file, or an already loaded GLBAsset.
+        image_dir: Optional directory where the embedded texture images are written.
 
     Returns:
         A list of dictionaries containing the PBR material data for each material in the GLB file.
         Each dictionary has the following key-value pairs:
             - base_color_texture: The texture index of the base color texture.
+            - base_color_factor: The RGBA base color factor.
             - metallic_roughness_texture: The texture index of the metallic roughness texture.
             - roughness_factor: The roughness factor value.
             - metallic_factor: The metallic factor value.
             - normal_texture: The texture index of the normal map texture.
+            - occlusion_texture: The texture index of the occlusion texture.
+            - emissive_texture: The texture index of the emissive texture.
+            - emissive_factor: The RGB emissive factor.
+        With `image_dir`, every texture with an embedded image also gets a matching
+        `*_image` key (e.g. `base_color_image`) holding the image file name inside `image_dir`.
     """
-    gltf = GLTF2.load(glb_file)
+    asset = glb_file if isinstance(glb_file, GLBAsset) else GLBAsset(glb_file)
+    gltf = asset.header
+    written = {}
 
     materials_info = []
 
-    for material in gltf.materials:
+    for material in gltf.get("materials", []):
         material_data = {}
+        texture_infos = {}
 
         # PBR Metallic Roughness
-        if hasattr(material.pbrMetallicRoughness, "baseColorTexture"):
-            base_color_texture = material.pbrMetallicRoughness.baseColorTexture
-            material_data["base_color_texture"] = (
-                gltf.textures[base_color_texture.index].source
-                if base_color_texture
-                else "No Texture"
+        pbr = material.get("pbrMetallicRoughness")
+        if pbr is not None:
+            texture_infos["base_color_texture"] = pbr.get("baseColorTexture")
+            texture_infos["metallic_roughness_texture"] = pbr.get(
+                "metallicRoughnessTexture"
             )
-
-        if hasattr(material.pbrMetallicRoughness, "metallicRoughnessTexture"):
-            metallic_roughness_texture = material.pbrMetallicRoughness.metallicRoughnessTexture
-            material_data["metallic_roughness_texture"] = (
-                gltf.textures[metallic_roughness_texture.index].source
-                if metallic_roughness_texture
-                else "No Texture"
+            material_data["base_color_factor"] = pbr.get(
+                "baseColorFactor", [1.0, 1.0, 1.0, 1.0]
             )
 
-        # Roughness & Metallic Values
-        if hasattr(material.pbrMetallicRoughness, "roughnessFactor"):
-            material_data["roughness_factor"] = material.pbrMetallicRoughness.roughnessFactor
+            # Roughness & Metallic Values
+            material_data["roughness_factor"] = pbr.get("roughnessFactor", 1.0)
+            material_data["metallic_factor"] = pbr.get("metallicFactor", 1.0)
 
-        if hasattr(material.pbrMetallicRoughness, "metallicFactor"):
-            material_data["metallic_factor"] = material.pbrMetallicRoughness.metallicFactor
+        # Normal, occlusion and emissive maps
+        texture_infos["normal_texture"] = material.get("normalTexture")
+        texture_infos["occlusion_texture"] = material.get("occlusionTexture")
+        texture_infos["emissive_texture"] = material.get("emissiveTexture")
+        material_data["emissive_factor"] = material.get("emissiveFactor", [0.0, 0.0, 0.0])
 
-        # Normal map
-        if hasattr(material, "normalTexture"):
-            normal_texture = material.normalTexture
-            material_data["normal_texture"] = (
-                gltf.textures[normal_texture.index].source
-                if normal_texture
-                else "No Texture"
-            )
+        for name, texture_info in texture_infos.items():
+            source = _texture_source(gltf, texture_info)
+            material_data[name] = source
+            if image_dir is not None and isinstance(source, int):
+                file_name = write_texture_image(asset, source, Path(image_dir), written)
+                if file_name is not None:
+                    material_data[f"{name[: -len('_texture')]}_image"] = file_name
 
         materials_info.append(material_data)
 
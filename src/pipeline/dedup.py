@@ -0,0 +1,135 @@
+import hashlib
+import json
+
+import numpy as np
+import trimesh
+
+from glb_checker.scene_merge import scene_instances
+from .sqlite_store import SQLiteStore
+
+GRID_SIZE = 8
+BBOX_DECIMALS = 3
+
+
+def geometric_fingerprint(geometry, grid_size=GRID_SIZE, decimals=BBOX_DECIMALS):
+    """
+    Computes a cheap fingerprint of the world-space geometry of a mesh or scene.
+
+    The fingerprint hashes the vertex and face counts, the bounding box rounded to
+    `decimals` places and a spatial signature: the fraction of vertices in each cell of
+    a `grid_size`^3 grid over the bounding box, quantized to 8 bits. It ignores vertex
+    and face order, node names, materials and float noise far below the rounding, so
+    the same asset re-exported under another id gets the same fingerprint.
+
+    Args:
+        geometry (trimesh.Scene or trimesh.Trimesh): The geometry to fingerprint.
+        grid_size (int): Cells per axis of the spatial signature.
+        decimals (int): Decimal places kept of the bounding box.
+
+    Returns:
+        str or None: A hex digest, or None if there are no triangles.
+    """
+    if isinstance(geometry, trimesh.Trimesh):
+        instances = [(geometry, np.eye(4)[None])] if len(geometry.faces) else []
+    else:
+        instances = scene_instances(geometry)
+    if not instances:
+        return None
+
+    vertices = np.concatenate(
+        [
+            (
+                np.einsum("kij,nj->kni", transforms[:, :3, :3], mesh.vertices)
+                + transforms[:, None, :3, 3]
+            ).reshape(-1, 3)
+            for mesh, transforms in instances
+        ]
+    )
+    face_count = sum(len(mesh.faces) * len(t) for mesh, t in instances)
+
+    low, high = vertices.min(axis=0), vertices.max(axis=0)
+    extent = np.where(high > low, high - low, 1.0)
+    cells = ((vertices - low) / extent * grid_size).astype(np.int64)
+    cells = np.clip(cells, 0, grid_size - 1)
+    histogram = np.bincount(
+        np.ravel_multi_index(cells.T, (grid_size,) * 3), minlength=grid_size**3
+    )
+    signature = np.round(histogram / len(vertices) * 255).astype(np.uint8)
+
+    # Adding 0.0 turns -0.0 into 0.0, so both round to the same text
+    bbox = np.round(np.concatenate([low, high]), decimals) + 0.0
+    digest = hashlib.sha256(
+        json.dumps([len(vertices), face_count, bbox.tolist()]).encode()
+    )
+    digest.update(signature.tobytes())
+    return digest.hexdigest()
+
+
+class DedupIndex(SQLiteStore):
+    """
+    On-disk SQLite index of validation verdicts by geometric fingerprint.
+
+    Each entry maps a fingerprint and a settings key (the validator fingerprint) to the
+    first object validated with them: its index id and validation outcome. Later
+    objects with the same geometry reuse that verdict instead of being validated
+    again. Only the verdict is shared: duplicates may differ in their materials, so
+    their textures and meshes are still extracted from their own files. The first
+    entry for a fingerprint is kept.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        with self.connection as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS verdicts (
+                    fingerprint TEXT NOT NULL,
+                    settings TEXT NOT NULL,
+                    index_id TEXT NOT NULL,
+                    is_valid INTEGER NOT NULL,
+                    errors TEXT NOT NULL,
+                    PRIMARY KEY (fingerprint, settings)
+                )
+                """
+            )
+
+    def get(self, fingerprint, settings):
+        """
+        Looks up the object validated first with a fingerprint.
+
+        Args:
+            fingerprint (str): The geometric fingerprint.
+            settings (str): The settings key the verdict was produced under.
+
+        Returns:
+            tuple or None: (index_id, is_valid, errors) on a hit, None on a miss.
+        """
+        row = self.connection.execute(
+            "SELECT index_id, is_valid, errors FROM verdicts "
+            "WHERE fingerprint = ? AND settings = ?",
+            (fingerprint, settings),
+        ).fetchone()
+        if row is None:
+            return None
+        index, is_valid, errors = row
+        return index, bool(is_valid), json.loads(errors)
+
+    def put(self, fingerprint, settings, index, is_valid, errors):
+        """
+        Records a validation verdict, unless its fingerprint is already known.
+
+        Args:
+            fingerprint (str): The geometric fingerprint.
+            settings (str): The settings key the verdict was produced under.
+            index (str): The index identifier of the object.
+            is_valid (bool): The validation outcome.
+            errors (list): The validation error messages.
+        """
+        with self.connection as connection:
+            connection.execute(
+                "INSERT OR IGNORE INTO verdicts VALUES (?, ?, ?, ?, ?)",
+                (fingerprint, settings, index, int(is_valid), json.dumps(errors)),
+            )
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM verdicts").fetchone()[0]
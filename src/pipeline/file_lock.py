@@ -0,0 +1,20 @@
+import fcntl
+from contextlib import contextmanager
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Holds an exclusive lock on a lock file while the `with` block runs.
+
+    The lock is an `flock` on `path`, which is created if missing. It excludes other
+    threads and processes, and other nodes too on a network filesystem that supports
+    locking, e.g. NFS, where Linux maps `flock` to a POSIX lock. The lock is released
+    when the block is left, also if the process is killed.
+
+    Args:
+        path (str or Path): The lock file.
+    """
+    with open(path, "a") as file:
+        fcntl.flock(file, fcntl.LOCK_EX)
+        yield
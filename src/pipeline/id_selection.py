@@ -0,0 +1,158 @@
+import json
+import re
+import zlib
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+
+class _JSONStream:
+    """Decodes the top-level JSON values of a file a chunk at a time."""
+
+    def __init__(self, file, chunk_size):
+        self.file = file
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+
+    def _fill(self):
+        chunk = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.position :] + chunk
+        self.position = 0
+        return bool(chunk)
+
+    def peek(self):
+        """Skips whitespace and returns the next character."""
+        while True:
+            match = _NON_WHITESPACE.search(self.buffer, self.position)
+            if match:
+                self.position = match.start()
+                return self.buffer[self.position]
+            self.position = len(self.buffer)
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON input.")
+
+    def expect(self, characters):
+        """Consumes the next character, which must be one of `characters`."""
+        character = self.peek()
+        if character not in characters:
+            raise ValueError(f"Expected one of {characters!r}, got {character!r}.")
+        self.position += 1
+        return character
+
+    def value(self):
+        """Decodes the next value, reading more of the file until it is complete."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buffer) and self._fill():
+                continue
+            self.position = end
+            return value
+
+
+def _iter_container(path, opening, closing, chunk_size):
+    with open(path, "r", encoding="utf-8") as file:
+        stream = _JSONStream(file, chunk_size)
+        stream.expect(opening)
+        if stream.peek() == closing:
+            return
+        while True:
+            if opening == "{":
+                key = stream.value()
+                stream.expect(":")
+                yield key, stream.value()
+            else:
+                yield stream.value()
+            if stream.expect("," + closing) == closing:
+                return
+
+
+def iter_json_array(path, chunk_size=1 << 16):
+    """
+    Yields the elements of a JSON file holding a top-level array.
+
+    Only one chunk of the file and the current element are held in memory.
+
+    Args:
+        path (str or Path): The JSON file.
+        chunk_size (int): Number of characters read at a time.
+
+    Yields:
+        The decoded array elements, in file order.
+    """
+    return _iter_container(path, "[", "]", chunk_size)
+
+
+def iter_json_items(path, chunk_size=1 << 16):
+    """
+    Yields the (key, value) pairs of a JSON file holding a top-level object.
+
+    Args:
+        path (str or Path): The JSON file.
+        chunk_size (int): Number of characters read at a time.
+
+    Yields:
+        tuple: (key, value) pairs, in file order.
+    """
+    return _iter_container(path, "{", "}", chunk_size)
+
+
+def shard_of(identifier, num_shards):
+    """
+    Returns the shard an identifier belongs to.
+
+    Uses CRC-32 rather than `hash()`, which is salted per process, so every node
+    assigns every identifier to the same shard.
+
+    Args:
+        identifier (str): The index identifier or Objaverse UID.
+        num_shards (int): The total number of shards.
+
+    Returns:
+        int: The shard index in [0, num_shards).
+    """
+    return zlib.crc32(identifier.encode("utf-8")) % num_shards
+
+
+def select_work(
+    index_to_objaverse_path,
+    selected_ids_path,
+    skip_ids=frozenset(),
+    shard_index=0,
+    num_shards=1,
+):
+    """
+    Yields the objects to process, streaming both ID files.
+
+    The selected index ids of this shard are loaded into a set, then the index to
+    Objaverse mapping is streamed and filtered with constant-time lookups, so the
+    first object is yielded without the mapping ever being held in memory.
+
+    Args:
+        index_to_objaverse_path (str or Path): JSON object mapping index ids to Objaverse ids.
+        selected_ids_path (str or Path): JSON array of the index ids to process.
+        skip_ids (set): Index ids to leave out, e.g. those finished by a previous run.
+        shard_index (int): The shard to select, in [0, num_shards).
+        num_shards (int): The number of shards the ID space is split into.
+
+    Yields:
+        tuple: (index, objaverse_id) pairs, in mapping order.
+    """
+    if not 0 <= shard_index < num_shards:
+        raise ValueError(f"Shard index {shard_index} not in [0, {num_shards}).")
+
+    selected = {
+        index
+        for index in iter_json_array(selected_ids_path)
+        if shard_of(index, num_shards) == shard_index and index not in skip_ids
+    }
+    for index, objaverse_id in iter_json_items(index_to_objaverse_path):
+        if index in selected:
+            yield index, objaverse_id
@@ -0,0 +1,242 @@
+import time
+
+from .sqlite_store import SQLiteStore
+
+STAGES = ("downloaded", "validated", "textures_extracted", "exported")
+# Status of a stage that failed without reaching a verdict, e.g. on a crash
+ERRORED = -1
+
+
+class JobManifest(SQLiteStore):
+    """
+    On-disk SQLite manifest recording the outcome of every pipeline stage per object.
+
+    Rows are keyed by the gobjaverse index (or Objaverse UID) and store the Objaverse ID,
+    the content hash of the downloaded GLB, one status column per stage (NULL when the
+    stage has not run, 1 on success, 0 on failure, `ERRORED` when it failed without a
+    verdict and is worth retrying) and the last error message.
+    """
+
+    def __init__(self, path):
+        super().__init__(path)
+        with self.connection as connection:
+            connection.execute(
+                f"""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    index_id TEXT PRIMARY KEY,
+                    objaverse_id TEXT NOT NULL,
+                    content_hash TEXT,
+                    {", ".join(f"{stage} INTEGER" for stage in STAGES)},
+                    error TEXT,
+                    updated_at REAL
+                )
+                """
+            )
+
+    def record(
+        self,
+        index,
+        objaverse_id,
+        stage,
+        success,
+        error="",
+        content_hash=None,
+        retry=False,
+    ):
+        """
+        Records the outcome of a stage for an object.
+
+        A successful download with a new content hash clears the later stages, since
+        they were computed from different bytes.
+
+        Args:
+            index (str): The index identifier of the object.
+            objaverse_id (str): The Objaverse ID of the object.
+            stage (str): One of `STAGES`.
+            success (bool): Whether the stage succeeded.
+            error (str or list): The error message(s) if the stage failed.
+            content_hash (str, optional): The content hash of the downloaded GLB.
+            retry (bool): Whether a failure is transient, e.g. a crashed worker or an
+                unreadable file, rather than a verdict. The stage is recorded as
+                `ERRORED`, so the next run repeats it.
+        """
+        self.record_many(
+            stage, [(index, objaverse_id, success, error)], content_hash, retry
+        )
+
+    def record_many(self, stage, outcomes, content_hash=None, retry=False):
+        """
+        Records the outcome of a stage for many objects in one transaction.
+
+        Args:
+            stage (str): One of `STAGES`.
+            outcomes (iterable): (index, objaverse_id, success, error) tuples.
+            content_hash (str, optional): The content hash of the downloaded GLB, for a
+                single object.
+            retry (bool): Whether failures are transient, see `record`.
+        """
+        if stage not in STAGES:
+            raise ValueError(f"Unknown stage: {stage}")
+
+        reset = ""
+        if stage == "downloaded":
+            reset = "".join(
+                f", {name} = CASE WHEN excluded.content_hash IS NOT jobs.content_hash "
+                f"THEN NULL ELSE jobs.{name} END"
+                for name in STAGES[1:]
+            )
+
+        now = time.time()
+        rows = []
+        for index, objaverse_id, success, error in outcomes:
+            if isinstance(error, (list, tuple)):
+                error = "; ".join(str(e) for e in error)
+            rows.append(
+                (
+                    index,
+                    objaverse_id,
+                    content_hash,
+                    1 if success else ERRORED if retry else 0,
+                    None if success else str(error),
+                    now,
+                )
+            )
+
+        with self.connection as connection:
+            connection.executemany(
+                f"""
+                INSERT INTO jobs (index_id, objaverse_id, content_hash, {stage}, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(index_id) DO UPDATE SET
+                    objaverse_id = excluded.objaverse_id,
+                    content_hash = COALESCE(excluded.content_hash, jobs.content_hash),
+                    {stage} = excluded.{stage},
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                    {reset}
+                """,
+                rows,
+            )
+
+    def merge(self, path):
+        """
+        Merges the rows of another manifest, e.g. one written by another node.
+
+        For an object present in both manifests, the most recently updated row wins.
+
+        Args:
+            path (str or Path): The manifest to merge in.
+
+        Returns:
+            int: The number of rows inserted or updated.
+        """
+        columns = ["index_id", "objaverse_id", "content_hash", *STAGES, "error", "updated_at"]
+        updates = ", ".join(f"{column} = excluded.{column}" for column in columns[1:])
+        connection = self.connection
+        connection.execute("ATTACH DATABASE ? AS other", (str(path),))
+        try:
+            with connection:
+                cursor = connection.execute(
+                    f"""
+                    INSERT INTO jobs ({", ".join(columns)})
+                    SELECT {", ".join(columns)} FROM other.jobs WHERE true
+                    ON CONFLICT(index_id) DO UPDATE SET {updates}
+                    WHERE excluded.updated_at > jobs.updated_at
+                    """
+                )
+                return cursor.rowcount
+        finally:
+            connection.execute("DETACH DATABASE other")
+
+    def get(self, index):
+        """
+        Returns the manifest row of an object.
+
+        Args:
+            index (str): The index identifier of the object.
+
+        Returns:
+            dict or None: The row as a dictionary, or None if the object was never recorded.
+        """
+        cursor = self.connection.execute("SELECT * FROM jobs WHERE index_id = ?", (index,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        return dict(zip([column[0] for column in cursor.description], row))
+
+    def finished_ids(self):
+        """
+        Returns the objects that need no further work.
+
+        An object is finished once it was exported, or once validation rejected it. Failed
+        downloads and exports, stages that errored without a verdict and objects never
+        recorded are retried on the next run.
+
+        Returns:
+            set: The finished index identifiers.
+        """
+        cursor = self.connection.execute(
+            "SELECT index_id FROM jobs WHERE exported = 1 OR validated = 0"
+        )
+        return {row[0] for row in cursor}
+
+    def validated_objects(self):
+        """
+        Returns the objects with a validation verdict and a known content hash.
+
+        Returns:
+            list: (index_id, objaverse_id, content_hash, validated) tuples in index order.
+        """
+        cursor = self.connection.execute(
+            "SELECT index_id, objaverse_id, content_hash, validated FROM jobs "
+            "WHERE validated >= 0 AND content_hash IS NOT NULL ORDER BY index_id"
+        )
+        return [
+            (index, objaverse_id, content_hash, bool(validated))
+            for index, objaverse_id, content_hash, validated in cursor
+        ]
+
+    def reset(self, index_ids, stages=STAGES[1:]):
+        """
+        Clears the outcome of some stages, so the next run repeats them.
+
+        Args:
+            index_ids (iterable): The index identifiers of the objects.
+            stages (tuple): The stages to clear. Defaults to every stage after download.
+        """
+        assignments = ", ".join(f"{stage} = NULL" for stage in stages)
+        with self.connection as connection:
+            connection.executemany(
+                f"UPDATE jobs SET {assignments}, updated_at = ? WHERE index_id = ?",
+                [(time.time(), index) for index in index_ids],
+            )
+
+    def exported_ids(self):
+        """
+        Returns the objects whose mesh was exported, in index order.
+
+        Returns:
+            list: The exported index identifiers.
+        """
+        cursor = self.connection.execute(
+            "SELECT index_id FROM jobs WHERE exported = 1 ORDER BY index_id"
+        )
+        return [row[0] for row in cursor]
+
+    def counts(self):
+        """
+        Returns the number of successful and failed objects per stage.
+
+        Failures include stages that errored without a verdict.
+
+        Returns:
+            dict: {stage: {"succeeded": int, "failed": int}}.
+        """
+        columns = ", ".join(
+            f"SUM({stage} = 1), SUM({stage} <= 0)" for stage in STAGES
+        )
+        row = self.connection.execute(f"SELECT {columns} FROM jobs").fetchone()
+        return {
+            stage: {"succeeded": row[2 * i] or 0, "failed": row[2 * i + 1] or 0}
+            for i, stage in enumerate(STAGES)
+        }
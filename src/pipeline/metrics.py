@@ -0,0 +1,172 @@
+import cProfile
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from multiprocessing import util
+from pathlib import Path
+
+from .sqlite_store import SQLiteStore
+
+
+@contextmanager
+def timed(timings, stage):
+    """Stores the duration of the enclosed block in `timings[stage]`, in seconds."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[stage] = time.perf_counter() - start
+
+
+class RunMetrics(SQLiteStore):
+    """
+    On-disk SQLite store of per-object stage timings, shared by all worker processes.
+
+    Every timed step of every object becomes one row holding the run id, the index id,
+    the stage name, the duration in seconds and the bytes it processed. Validator checks
+    are stored as stages named `check:<name>`. Rows of all processes land in the same
+    file, so `report()` aggregates across the whole run.
+    """
+
+    def __init__(self, path, run_id=None):
+        super().__init__(path)
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        with self.connection as connection:
+            connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS timings (
+                    run_id TEXT NOT NULL,
+                    index_id TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    seconds REAL NOT NULL,
+                    bytes INTEGER NOT NULL
+                )
+                """
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS timings_run ON timings (run_id, stage)"
+            )
+
+    def record(self, index, timings, num_bytes=None):
+        """
+        Records the durations of one object's stages.
+
+        Args:
+            index (str): The index identifier of the object.
+            timings (dict): stage name -> seconds.
+            num_bytes (dict, optional): stage name -> bytes processed by that stage.
+        """
+        num_bytes = num_bytes or {}
+        with self.connection as connection:
+            connection.executemany(
+                "INSERT INTO timings (run_id, index_id, stage, seconds, bytes) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [
+                    (self.run_id, index, stage, seconds, num_bytes.get(stage, 0))
+                    for stage, seconds in timings.items()
+                ],
+            )
+
+    def report(self, elapsed, slowest=10):
+        """
+        Summarizes the timings of this run.
+
+        Args:
+            elapsed (float): Wall-clock duration of the run in seconds.
+            slowest (int): Number of slowest objects to list.
+
+        Returns:
+            dict: A dictionary with the following key-value pairs:
+                - run_id: The run id.
+                - elapsed_seconds: The wall-clock duration.
+                - objects: Number of objects with at least one timed stage.
+                - bytes_downloaded: Total bytes of the "download" stage.
+                - download_mb_per_second: Download throughput over the whole run.
+                - stages: stage -> {count, total, p50, p95, max (seconds), per_second}.
+                - slowest_objects: [{index_id, seconds, stages}], summed over the
+                  stages that are not validator checks, slowest first.
+        """
+        import numpy as np
+
+        rows = self.connection.execute(
+            "SELECT index_id, stage, seconds, bytes FROM timings WHERE run_id = ?",
+            (self.run_id,),
+        ).fetchall()
+
+        durations = {}
+        per_object = {}
+        bytes_downloaded = 0
+        for index, stage, seconds, num_bytes in rows:
+            durations.setdefault(stage, []).append(seconds)
+            if stage == "download":
+                bytes_downloaded += num_bytes
+            if not stage.startswith("check:"):
+                stages = per_object.setdefault(index, {})
+                stages[stage] = stages.get(stage, 0.0) + seconds
+
+        stages = {}
+        for stage, values in sorted(durations.items()):
+            values = np.asarray(values)
+            p50, p95 = np.percentile(values, [50, 95])
+            stages[stage] = {
+                "count": len(values),
+                "total": float(values.sum()),
+                "p50": float(p50),
+                "p95": float(p95),
+                "max": float(values.max()),
+                "per_second": len(values) / elapsed if elapsed else 0.0,
+            }
+
+        totals = sorted(
+            ((sum(times.values()), index) for index, times in per_object.items()),
+            reverse=True,
+        )
+        return {
+            "run_id": self.run_id,
+            "elapsed_seconds": elapsed,
+            "objects": len(per_object),
+            "bytes_downloaded": bytes_downloaded,
+            "download_mb_per_second": (
+                bytes_downloaded / 1e6 / elapsed if elapsed else 0.0
+            ),
+            "stages": stages,
+            "slowest_objects": [
+                {"index_id": index, "seconds": seconds, "stages": per_object[index]}
+                for seconds, index in totals[:slowest]
+            ],
+        }
+
+
+def start_worker_profiling(profile_dir, trace_memory=False):
+    """
+    Profiles the calling worker process until it exits.
+
+    Meant as a `multiprocessing.Pool` initializer. Writes `worker-<pid>.prof` (cProfile,
+    readable with `pstats`) and, with `trace_memory`, `worker-<pid>.tracemalloc.txt` with
+    the top allocation sites. The files are written when the worker exits normally, so
+    the pool must be closed and joined rather than terminated.
+
+    Args:
+        profile_dir (str or Path): The directory the profiles are written to.
+        trace_memory (bool): Also trace memory allocations with tracemalloc.
+    """
+    profile_dir = Path(profile_dir)
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    if trace_memory:
+        tracemalloc.start()
+
+    def write_profiles():
+        profiler.disable()
+        profiler.dump_stats(profile_dir / f"worker-{os.getpid()}.prof")
+        if trace_memory:
+            snapshot = tracemalloc.take_snapshot()
+            path = profile_dir / f"worker-{os.getpid()}.tracemalloc.txt"
+            with open(path, "w") as file:
+                for stat in snapshot.statistics("lineno")[:50]:
+                    file.write(f"{stat}\n")
+            tracemalloc.stop()
+
+    util.Finalize(None, write_profiles, exitpriority=10)
+    profiler.enable()
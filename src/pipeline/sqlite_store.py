@@ -0,0 +1,43 @@
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class SQLiteStore:
+    """
+    Base of the on-disk SQLite stores shared by pipeline processes and threads.
+
+    Connections are opened lazily per process and thread, in WAL mode so readers do not
+    block the writer, so the same store object can be used by download threads and
+    passed to worker processes, forked or not. A pickled store keeps its attributes but
+    not its connections, and reconnects on first use.
+
+    Args:
+        path (str or Path): The SQLite database file, created if missing.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @property
+    def connection(self):
+        """sqlite3.Connection: The connection of the calling process and thread."""
+        if getattr(self._local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return self._local.connection
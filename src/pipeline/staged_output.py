@@ -0,0 +1,67 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+STAGING_PREFIX = ".staging-"
+
+
+class StagedOutput:
+    """
+    An output directory that appears complete or not at all.
+
+    Outputs are written to a hidden staging directory next to `output_dir`, which is
+    renamed into place by `commit()`. Leaving the `with` block without committing, e.g.
+    after a failed stage, removes the staging directory, so a failure leaves neither
+    partial outputs nor outputs of an earlier attempt that would have to be cleaned up.
+    The rename is atomic because the staging directory is on the same filesystem.
+
+    Staging directories left by a killed worker are removed when the same object is
+    staged again. Every object is processed by one worker at a time, so they never
+    belong to a running task.
+
+    Args:
+        output_dir (str or Path): The final output directory.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = Path(output_dir)
+        self.output_dir.parent.mkdir(parents=True, exist_ok=True)
+        self._prefix = f"{STAGING_PREFIX}{self.output_dir.name}-"
+        for stale in self.output_dir.parent.glob(f"{self._prefix}*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        self.path = self._temporary_dir()
+        self.committed = False
+
+    def _temporary_dir(self):
+        return Path(tempfile.mkdtemp(prefix=self._prefix, dir=self.output_dir.parent))
+
+    def commit(self):
+        """
+        Moves the staged outputs into place, replacing an existing output directory.
+
+        Returns:
+            Path: The output directory.
+        """
+        # rename() does not replace a non-empty directory; the earlier outputs are
+        # renamed aside first, so `output_dir` is only missing between two renames
+        previous = None
+        if self.output_dir.exists():
+            previous = self._temporary_dir()
+            os.replace(self.output_dir, previous)
+        os.replace(self.path, self.output_dir)
+        self.committed = True
+        if previous is not None:
+            shutil.rmtree(previous, ignore_errors=True)
+        return self.output_dir
+
+    def discard(self):
+        """Removes the staged outputs, unless they were committed."""
+        if not self.committed:
+            shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.discard()
@@ -0,0 +1,145 @@
+import multiprocessing
+import os
+import resource
+import signal
+import time
+
+# Set in every worker by `init_worker`
+_started = None
+
+
+class TaskTimeout(Exception):
+    """Raised inside a worker when a task runs longer than its timeout."""
+
+
+def _raise_timeout(signum, frame):
+    raise TaskTimeout("Task timed out")
+
+
+def init_worker(memory_limit=None, started=None, initializer=None, initargs=()):
+    """
+    Applies per-worker limits; meant as a `multiprocessing.Pool` initializer.
+
+    Workers run one task at a time, so capping the address space of the worker caps
+    every task: an allocation past the limit raises MemoryError inside the task instead
+    of waking the kernel OOM killer.
+
+    Args:
+        memory_limit (int, optional): Maximum address space of the worker in bytes.
+        started (multiprocessing.SimpleQueue, optional): Where `run_limited` reports
+            task starts, see `WorkerWatchdog`.
+        initializer (callable, optional): Another initializer to run afterwards.
+        initargs (tuple): The arguments of `initializer`.
+    """
+    global _started
+    _started = started
+    if memory_limit:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def run_limited(function, task_id, args, timeout=None):
+    """
+    Runs `function(*args)` in a worker, raising TaskTimeout after `timeout` seconds.
+
+    The timeout is delivered by SIGALRM, so it interrupts Python code; a task stuck in
+    native code is killed by the parent's `WorkerWatchdog` instead.
+
+    Args:
+        function (callable): The task function.
+        task_id (str): Identifies the task to the watchdog.
+        args (tuple): The arguments of `function`.
+        timeout (float, optional): Seconds before the task is interrupted.
+    """
+    if _started is not None:
+        _started.put((task_id, os.getpid(), time.time()))
+    if timeout:
+        signal.signal(signal.SIGALRM, _raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        return function(*args)
+    except MemoryError as e:
+        raise MemoryError(f"Task exceeded the worker memory limit: {e}") from e
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+
+def _is_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class WorkerWatchdog:
+    """
+    Parent-side tracker of the tasks running in a pool of limited workers.
+
+    A `multiprocessing.Pool` replaces a worker that dies, but never delivers a result
+    for the task it was running, so anyone waiting on that task would block forever.
+    Workers report every task start through `started`; `lost_tasks()` returns the
+    tasks whose worker died, e.g. from a native crash, and kills workers whose task
+    ran past `hard_timeout`, so the caller can count those tasks as failed and carry
+    on with the rest.
+
+    Args:
+        hard_timeout (float, optional): Seconds after which a worker is killed.
+        grace (float): Seconds a dead worker's task is kept, so a result sent right
+            before the worker exited (e.g. when recycled) still arrives first.
+        context (multiprocessing context, optional): The context the pool is created
+            from; the default context if None.
+    """
+
+    def __init__(self, hard_timeout=None, grace=5.0, context=None):
+        self.hard_timeout = hard_timeout
+        self.grace = grace
+        self.started = (context or multiprocessing).SimpleQueue()
+        self.running = {}
+        self._dead_since = {}
+
+    def pool_options(self, memory_limit=None, initializer=None, initargs=()):
+        """Returns the `initializer` and `initargs` of a pool of limited workers."""
+        return {
+            "initializer": init_worker,
+            "initargs": (memory_limit, self.started, initializer, initargs),
+        }
+
+    def done(self, task_id):
+        """Stops tracking a task whose result was received."""
+        self.running.pop(task_id, None)
+        self._dead_since.pop(task_id, None)
+
+    def _drain(self):
+        while not self.started.empty():
+            task_id, pid, start = self.started.get()
+            # A worker runs one task at a time, so its previous task has finished
+            for other, (other_pid, _) in list(self.running.items()):
+                if other_pid == pid:
+                    self.done(other)
+            self.running[task_id] = (pid, start)
+
+    def lost_tasks(self):
+        """
+        Returns the ids of the running tasks whose worker died or was killed.
+
+        Returns:
+            list: The lost task ids, which are no longer tracked.
+        """
+        self._drain()
+        now = time.time()
+        lost = []
+        for task_id, (pid, start) in list(self.running.items()):
+            if self.hard_timeout and now - start > self.hard_timeout and _is_alive(pid):
+                os.kill(pid, signal.SIGKILL)
+            if _is_alive(pid):
+                continue
+            dead_since = self._dead_since.setdefault(task_id, now)
+            if now - dead_since >= self.grace:
+                self.done(task_id)
+                lost.append(task_id)
+        return lost
@@ -0,0 +1,21 @@
+"""Mesh and GLB asset factories shared by the test modules."""
+import numpy as np
+import trimesh
+
+from glb_checker.glb_asset import GLBAsset
+
+
+def glb_asset(mesh, name="mesh.glb"):
+    data = trimesh.Scene([mesh]).export(file_type="glb")
+    return GLBAsset(name, data=data)
+
+
+def box_asset():
+    return glb_asset(trimesh.creation.box(), "box.glb")
+
+
+def degenerate_box():
+    box = trimesh.creation.box()
+    vertices = np.vstack([box.vertices, [[0, 0, 0], [0, 0, 0], [1, 1, 1]]])
+    faces = np.vstack([box.faces, [[8, 9, 10]]])
+    return trimesh.Trimesh(vertices, faces, process=False)
@@ -0,0 +1,103 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from pbr_extraction.batch_extractor import (
+    done_ids_path,
+    existing_object_ids,
+    extract_pbr_textures_batch,
+    load_pbr_records,
+)
+from test_glb_extractor import textured_glb
+
+
+class TestBatchExtractor(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.paths = {}
+        for object_id in ["0/1", "0/2"]:
+            path = self.root / f"{object_id.replace('/', '_')}.glb"
+            path.write_bytes(textured_glb())
+            self.paths[object_id] = path
+        untextured = self.root / "plain.glb"
+        untextured.write_bytes(
+            trimesh.Scene([trimesh.creation.box()]).export(file_type="glb")
+        )
+        self.paths["0/3"] = untextured
+        self.records = self.root / "pbr_records.jsonl"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_batch_extraction(self):
+        summary = extract_pbr_textures_batch(
+            self.paths, self.records, processes=2, image_root=self.root / "images"
+        )
+        self.assertEqual(summary, {"objects": 3, "records": 4, "errors": {}})
+
+        columns = load_pbr_records(self.records)
+        self.assertEqual(sorted(columns["object_id"]), ["0/1", "0/1", "0/2", "0/2"])
+        self.assertEqual(sorted(columns["material_index"]), [0, 0, 1, 1])
+        self.assertTrue((self.root / "images" / "0_2" / "image_1.jpg").exists())
+
+    def test_incremental_append(self):
+        extract_pbr_textures_batch({"0/1": self.paths["0/1"]}, self.records, processes=1)
+        summary = extract_pbr_textures_batch(
+            {**self.paths, "0/4": self.root / "missing.glb"}, self.records, processes=2
+        )
+        self.assertEqual(summary["objects"], 2)
+        self.assertIn("0/4", summary["errors"])
+
+        columns = load_pbr_records(self.records, columns=["object_id"])
+        self.assertEqual(sorted(columns["object_id"]), ["0/1", "0/1", "0/2", "0/2"])
+
+    def test_objects_without_materials_are_done(self):
+        extract_pbr_textures_batch(self.paths, self.records, processes=1)
+        summary = extract_pbr_textures_batch(self.paths, self.records, processes=1)
+        self.assertEqual(summary, {"objects": 0, "records": 0, "errors": {}})
+        self.assertEqual(existing_object_ids(self.records), {"0/1", "0/2", "0/3"})
+
+    def test_partial_last_line_is_repaired(self):
+        extract_pbr_textures_batch({"0/1": self.paths["0/1"]}, self.records, processes=1)
+        # An append interrupted in the middle of a record of 0/2
+        with open(self.records, "a") as file:
+            file.write('{"object_id": "0/2", "materi')
+
+        self.assertEqual(existing_object_ids(self.records), {"0/1"})
+        summary = extract_pbr_textures_batch(self.paths, self.records, processes=1)
+        self.assertEqual(summary["objects"], 2)
+
+        columns = load_pbr_records(self.records, columns=["object_id"])
+        self.assertEqual(sorted(columns["object_id"]), ["0/1", "0/1", "0/2", "0/2"])
+
+    def test_records_of_unfinished_object_are_dropped(self):
+        extract_pbr_textures_batch({"0/1": self.paths["0/1"]}, self.records, processes=1)
+        lines = self.records.read_text()
+        # Records of 0/2 written, but the run stopped before marking it done
+        self.records.write_text(lines + lines.replace('"0/1"', '"0/2"'))
+
+        summary = extract_pbr_textures_batch(self.paths, self.records, processes=1)
+        self.assertEqual(summary["objects"], 2)
+        columns = load_pbr_records(self.records, columns=["object_id"])
+        self.assertEqual(sorted(columns["object_id"]), ["0/1", "0/1", "0/2", "0/2"])
+
+    def test_shard_without_done_file(self):
+        extract_pbr_textures_batch({"0/1": self.paths["0/1"]}, self.records, processes=1)
+        done_ids_path(self.records).unlink()
+
+        # Objects with records count as done
+        summary = extract_pbr_textures_batch(self.paths, self.records, processes=1)
+        self.assertEqual(summary["objects"], 2)
+        self.assertEqual(existing_object_ids(self.records), {"0/1", "0/2", "0/3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
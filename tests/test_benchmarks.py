@@ -0,0 +1,29 @@
+import unittest
+import sys
+from pathlib import Path
+
+# Ensure the benchmarks directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+from benchmark_pipeline import CASES, run_benchmarks
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_small_run(self):
+        report = run_benchmarks(face_counts=[1000], repeat=1, image_bytes=1024)
+        results = {result["case"]: result for result in report["results"]}
+        self.assertEqual(set(results), set(CASES))
+        for result in results.values():
+            self.assertLessEqual(result["faces"], 1000)
+            self.assertEqual(result["materials"], 1)
+
+        self.assertTrue(results["clean"]["converted"])
+        self.assertIn("detect_severe_self_intersections", results["clean"]["checks"])
+        self.assertIn("Severe", results["self_intersecting"]["errors"][0])
+        self.assertEqual(results["degenerate"]["errors"], ["Mesh has degenerate faces."])
+        self.assertIn("multiple objects", results["multi_mesh"]["errors"][0])
+
+
+if __name__ == "__main__":
+    unittest.main()
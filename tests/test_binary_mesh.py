@@ -0,0 +1,68 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from mesh_export.binary_mesh import (
+    export_binary_mesh,
+    mesh_arrays,
+    read_binary_mesh,
+    write_binary_mesh,
+)
+
+
+class TestBinaryMesh(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "mesh.mesh"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        mesh = trimesh.creation.icosphere(2)
+        mesh.visual = trimesh.visual.TextureVisuals(
+            uv=np.random.default_rng(0).random((len(mesh.vertices), 2))
+        )
+        expected = mesh_arrays(mesh)
+        export_binary_mesh(mesh, self.path)
+
+        arrays = read_binary_mesh(self.path)
+        self.assertEqual(set(arrays), {"vertices", "faces", "normals", "uvs"})
+        for name, array in expected.items():
+            self.assertIsInstance(arrays[name], np.memmap)
+            self.assertEqual(arrays[name].dtype, array.dtype)
+            np.testing.assert_array_equal(arrays[name], array)
+
+    def test_scene_applies_transforms(self):
+        scene = trimesh.Scene()
+        scene.add_geometry(
+            trimesh.creation.box(),
+            transform=trimesh.transformations.translation_matrix([5, 0, 0]),
+        )
+        export_binary_mesh(scene, self.path)
+        vertices = read_binary_mesh(self.path)["vertices"]
+        np.testing.assert_allclose(vertices.mean(axis=0), [5, 0, 0], atol=1e-6)
+
+    def test_arbitrary_and_empty_arrays(self):
+        arrays = {
+            "a": np.arange(7, dtype=np.int16),
+            "empty": np.zeros((0, 3), dtype=np.float32),
+            "b": np.eye(3),
+        }
+        write_binary_mesh(self.path, arrays)
+        loaded = read_binary_mesh(self.path)
+        for name, array in arrays.items():
+            self.assertEqual(loaded[name].shape, array.shape)
+            np.testing.assert_array_equal(loaded[name], array)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import main
+from glb_checker.glb_asset import GLBAsset
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.validation_cache import ValidationCache
+from glb_checker.scene_merge import merge_scene
+from pipeline.dedup import DedupIndex, geometric_fingerprint
+
+
+def shuffled(mesh, seed=0):
+    """Returns the same mesh with its vertices and faces in a random order."""
+    rng = np.random.default_rng(seed)
+    order = rng.permutation(len(mesh.vertices))
+    faces = np.argsort(order)[mesh.faces][rng.permutation(len(mesh.faces))]
+    return trimesh.Trimesh(mesh.vertices[order], faces, process=False)
+
+
+def two_spheres():
+    scene = trimesh.Scene()
+    for i in range(2):
+        scene.add_geometry(
+            trimesh.creation.icosphere(2),
+            node_name=f"sphere_{i}",
+            transform=trimesh.transformations.translation_matrix([3.0 * i, 0, 0]),
+        )
+    return scene
+
+
+class TestDedup(unittest.TestCase):
+
+    def test_geometric_fingerprint(self):
+        sphere = trimesh.creation.icosphere(2)
+        fingerprint = geometric_fingerprint(sphere)
+        self.assertEqual(geometric_fingerprint(shuffled(sphere)), fingerprint)
+        self.assertEqual(geometric_fingerprint(trimesh.Scene([sphere])), fingerprint)
+
+        noisy = sphere.copy()
+        noisy.vertices += 1e-9
+        self.assertEqual(geometric_fingerprint(noisy), fingerprint)
+
+        moved = sphere.copy()
+        moved.apply_translation([0.5, 0, 0])
+        self.assertNotEqual(geometric_fingerprint(moved), fingerprint)
+        self.assertNotEqual(
+            geometric_fingerprint(trimesh.creation.icosphere(3)), fingerprint
+        )
+
+        scene = two_spheres()
+        self.assertEqual(
+            geometric_fingerprint(scene), geometric_fingerprint(merge_scene(scene))
+        )
+        self.assertIsNone(geometric_fingerprint(trimesh.Scene()))
+
+    def test_dedup_index(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            index = DedupIndex(Path(tmp) / "dedup.sqlite")
+            self.assertIsNone(index.get("abc", "settings"))
+            index.put("abc", "settings", "0/1", False, ["Mesh is empty."])
+            index.put("abc", "settings", "0/2", True, [])
+            self.assertEqual(
+                index.get("abc", "settings"), ("0/1", False, ["Mesh is empty."])
+            )
+            self.assertIsNone(index.get("abc", "other settings"))
+            self.assertEqual(len(index), 1)
+
+    def test_fingerprint_skips_rejected_and_cached_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ValidationCache(Path(tmp) / "cache.sqlite")
+            scene_data = two_spheres().export(file_type="glb")
+            sphere = trimesh.Scene([trimesh.creation.icosphere(2)])
+            sphere_data = sphere.export(file_type="glb")
+
+            # A multi-object scene is rejected from its header
+            asset = GLBAsset("scene.glb", data=scene_data)
+            validator = GLBMeshValidator(asset, cache=cache)
+            self.assertIsNone(main.mesh_fingerprint(asset, validator))
+            self.assertFalse(validator.validate()[0])
+            self.assertIsNone(asset._scene)
+
+            # A file whose result is cached is not decoded either
+            GLBMeshValidator(GLBAsset("a.glb", data=sphere_data), cache=cache).validate()
+            asset = GLBAsset("b.glb", data=sphere_data)
+            validator = GLBMeshValidator(asset, cache=cache)
+            self.assertIsNone(main.mesh_fingerprint(asset, validator))
+            self.assertTrue(validator.validate()[0])
+            self.assertIsNone(asset._scene)
+
+            asset = GLBAsset("c.glb", data=sphere_data)
+            self.assertIsNotNone(main.mesh_fingerprint(asset, GLBMeshValidator(asset)))
+
+    def test_duplicate_reuses_result(self):
+        data = trimesh.Scene([trimesh.creation.icosphere(2)]).export(file_type="glb")
+        duplicate = shuffled(trimesh.creation.icosphere(2))
+        # Same geometry, other material
+        duplicate.visual = trimesh.visual.TextureVisuals(
+            material=trimesh.visual.material.PBRMaterial(
+                baseColorFactor=[255, 0, 0, 255]
+            )
+        )
+        duplicate_data = trimesh.Scene([duplicate]).export(file_type="glb")
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for index, glb in (("0/1", data), ("0/2", duplicate_data)):
+                path = Path(tmp) / "downloads" / f"{index[-1]}.glb"
+                path.parent.mkdir(exist_ok=True)
+                path.write_bytes(glb)
+                paths.append(path)
+
+            dedup_index = DedupIndex(Path(tmp) / "dedup.sqlite")
+            validate = patch.object(
+                GLBMeshValidator,
+                "validate",
+                autospec=True,
+                side_effect=GLBMeshValidator.validate,
+            )
+            with patch.object(main, "dedup_index", dedup_index), validate as mock_validate:
+                first = main.validate_and_convert_glb(("0/1", "1.glb", paths[0], tmp))
+                second = main.validate_and_convert_glb(("0/2", "2.glb", paths[1], tmp))
+
+            self.assertEqual(first, ("0/1", "1.glb", True, ""))
+            self.assertEqual(second, ("0/2", "2.glb", True, ""))
+            self.assertEqual(mock_validate.call_count, 1)
+            # Only the verdict is reused; the outputs come from the object's own file
+            self.assertEqual(
+                sorted(p.name for p in (Path(tmp) / "0_2").iterdir()),
+                ["2.obj", "material.mtl", "mesh_quality.json", "pbr_textures.json"],
+            )
+            materials = [
+                (Path(tmp) / name / "pbr_textures.json").read_text()
+                for name in ("0_1", "0_2")
+            ]
+            self.assertNotEqual(materials[0], materials[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
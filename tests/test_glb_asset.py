@@ -0,0 +1,50 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_validator import GLBMeshValidator
+from pbr_extraction.texture_extractor import extract_pbr_textures
+from helpers import box_asset
+
+
+class TestGLBAsset(unittest.TestCase):
+
+    def test_chunks_are_views(self):
+        asset = box_asset()
+        self.assertIn("meshes", asset.header)
+        self.assertIsInstance(asset.binary, memoryview)
+        self.assertIs(asset.binary.obj, asset.data.obj)
+        self.assertIs(asset.buffer_view(0).obj, asset.data.obj)
+
+    def test_scene_matches_trimesh_load(self):
+        asset = box_asset()
+        expected = trimesh.load(
+            trimesh.util.wrap_as_stream(bytes(asset.data)), file_type="glb"
+        )
+        mesh = next(iter(asset.scene.geometry.values()))
+        np.testing.assert_allclose(
+            mesh.vertices, next(iter(expected.geometry.values())).vertices
+        )
+        self.assertIs(asset.scene, asset.scene)
+
+    def test_stages_share_asset(self):
+        asset = box_asset()
+        with patch(
+            "glb_checker.glb_validator.trimesh.load", wraps=trimesh.load
+        ) as mock_load:
+            is_valid, errors = GLBMeshValidator(asset).validate()
+            extract_pbr_textures(asset)
+        # The scene is decoded once and shared by both stages
+        mock_load.assert_called_once()
+        self.assertTrue(is_valid, errors)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,12 +1,59 @@
 import unittest
 import sys
+import json
+import struct
+import tempfile
 from pathlib import Path
 
 # Ensure src directory is in sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
+from glb_checker.glb_asset import GLBAsset
 from pbr_extraction.texture_extractor import extract_pbr_textures
 
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(24))
+JPEG_BYTES = b"\xff\xd8\xff\xe0" + bytes(range(12))
+
+
+def textured_glb():
+    """Builds a GLB whose materials share embedded images, without any geometry."""
+    binary = PNG_BYTES + JPEG_BYTES
+    header = {
+        "asset": {"version": "2.0"},
+        "buffers": [{"byteLength": len(binary)}],
+        "bufferViews": [
+            {"buffer": 0, "byteOffset": 0, "byteLength": len(PNG_BYTES)},
+            {"buffer": 0, "byteOffset": len(PNG_BYTES), "byteLength": len(JPEG_BYTES)},
+        ],
+        "images": [
+            {"bufferView": 0, "mimeType": "image/png"},
+            {"bufferView": 1, "mimeType": "image/jpeg"},
+        ],
+        "textures": [{"source": 0}, {"source": 1}, {"source": 0}],
+        "materials": [
+            {
+                "pbrMetallicRoughness": {
+                    "baseColorTexture": {"index": 0},
+                    "baseColorFactor": [0.5, 0.5, 0.5, 1.0],
+                },
+                "emissiveTexture": {"index": 1},
+                "emissiveFactor": [1.0, 0.0, 0.0],
+            },
+            {"normalTexture": {"index": 2}, "occlusionTexture": {"index": 1}},
+        ],
+    }
+    json_chunk = json.dumps(header).encode()
+    json_chunk += b" " * (-len(json_chunk) % 4)
+    binary += b"\x00" * (-len(binary) % 4)
+    length = 12 + 8 + len(json_chunk) + 8 + len(binary)
+    return (
+        struct.pack("<III", 0x46546C67, 2, length)
+        + struct.pack("<II", len(json_chunk), 0x4E4F534A)
+        + json_chunk
+        + struct.pack("<II", len(binary), 0x004E4942)
+        + binary
+    )
+
 
 class TestTextureExtractor(unittest.TestCase):
 
@@ -15,6 +62,33 @@ class TestTextureExtractor(unittest.TestCase):
         self.assertIsInstance(textures, list)
         self.assertGreater(len(textures), 0)
 
+    def test_factors_and_texture_slots(self):
+        textures = extract_pbr_textures(GLBAsset("textured.glb", data=textured_glb()))
+        self.assertEqual(textures[0]["base_color_texture"], 0)
+        self.assertEqual(textures[0]["base_color_factor"], [0.5, 0.5, 0.5, 1.0])
+        self.assertEqual(textures[0]["emissive_texture"], 1)
+        self.assertEqual(textures[0]["emissive_factor"], [1.0, 0.0, 0.0])
+        self.assertEqual(textures[0]["occlusion_texture"], "No Texture")
+        self.assertEqual(textures[1]["normal_texture"], 0)
+        self.assertEqual(textures[1]["occlusion_texture"], 1)
+        self.assertEqual(textures[1]["emissive_factor"], [0.0, 0.0, 0.0])
+
+    def test_image_extraction(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            image_dir = Path(tmp) / "textures"
+            textures = extract_pbr_textures(
+                GLBAsset("textured.glb", data=textured_glb()), image_dir=image_dir
+            )
+            self.assertEqual(
+                sorted(path.name for path in image_dir.iterdir()),
+                ["image_0.png", "image_1.jpg"],
+            )
+            self.assertEqual((image_dir / "image_0.png").read_bytes(), PNG_BYTES)
+            self.assertEqual((image_dir / "image_1.jpg").read_bytes(), JPEG_BYTES)
+            self.assertEqual(textures[0]["base_color_image"], "image_0.png")
+            self.assertEqual(textures[1]["normal_image"], "image_0.png")
+            self.assertEqual(textures[1]["occlusion_image"], "image_1.jpg")
+
 
 if __name__ == "__main__":
     unittest.main()
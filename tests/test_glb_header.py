@@ -0,0 +1,69 @@
+import unittest
+import sys
+import struct
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_header import PREAMBLE_SIZE, prescreen_glb
+from glb_checker.glb_validator import GLBMeshValidator
+
+
+def write_json_only_glb(path, meshes):
+    """Writes the GLB header and JSON chunk of a scene, dropping the BIN chunk."""
+    data = trimesh.Scene(meshes).export(file_type="glb")
+    json_length = struct.unpack_from("<I", data, 12)[0]
+    Path(path).write_bytes(data[: PREAMBLE_SIZE + json_length])
+
+
+class TestGLBHeader(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmp.name) / "scene.glb"
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_prescreen_reads_json_chunk_only(self):
+        write_json_only_glb(
+            self.path,
+            [
+                trimesh.creation.box(),
+                trimesh.creation.icosphere(1).apply_translation([3, 0, 0]),
+            ],
+        )
+        summary = prescreen_glb(self.path)
+        self.assertEqual(summary["mesh_count"], 2)
+        self.assertEqual(summary["primitive_count"], 2)
+        self.assertEqual(summary["index_counts"], [36, 240])
+        self.assertEqual(summary["triangle_counts"], [12, 80])
+        self.assertEqual(summary["face_count"], 92)
+        self.assertFalse(summary["has_textures"])
+
+    def test_validator_rejects_before_decoding(self):
+        write_json_only_glb(self.path, [trimesh.creation.box(), trimesh.creation.box()])
+        validator = GLBMeshValidator(str(self.path))
+        with patch("glb_checker.glb_validator.trimesh.load") as mock_load:
+            is_valid, errors = validator.validate()
+        mock_load.assert_not_called()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["Scene contains multiple objects: 2 objects found."])
+
+    def test_require_textures(self):
+        write_json_only_glb(self.path, [trimesh.creation.box()])
+        validator = GLBMeshValidator(str(self.path))
+        validator.REQUIRE_TEXTURES = True
+        with patch("glb_checker.glb_validator.trimesh.load") as mock_load:
+            is_valid, errors = validator.validate()
+        mock_load.assert_not_called()
+        self.assertEqual(errors, ["Mesh has no textures."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,15 @@
 import unittest
 import sys
 from pathlib import Path
+from unittest.mock import patch
+
+import trimesh
 
 # Ensure src directory is in sys.path
 sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 
 from glb_checker.glb_validator import GLBMeshValidator
+from helpers import degenerate_box, glb_asset
 
 
 class TestGLBValidator(unittest.TestCase):
@@ -21,6 +25,43 @@ class TestGLBValidator(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertGreater(len(errors), 0)
 
+    def test_header_face_count_skips_decoding(self):
+        validator = GLBMeshValidator(glb_asset(trimesh.creation.icosphere(2)))
+        validator.MAX_FACES = 100
+        with patch.object(GLBMeshValidator, "load_mesh") as mock_load:
+            is_valid, errors = validator.validate()
+        mock_load.assert_not_called()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["Too many faces (320)."])
+
+    def test_fail_fast_stops_at_first_failure(self):
+        validator = GLBMeshValidator(glb_asset(degenerate_box()))
+        with patch.object(
+            GLBMeshValidator, "detect_severe_self_intersections"
+        ) as mock_check:
+            is_valid, errors = validator.validate()
+        mock_check.assert_not_called()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["Mesh has degenerate faces."])
+
+    def test_collect_all_errors(self):
+        validator = GLBMeshValidator(glb_asset(degenerate_box()), fail_fast=False)
+        validator.MAX_FACES = 10
+        is_valid, errors = validator.validate()
+        self.assertFalse(is_valid)
+        self.assertIn("Too many faces (13).", errors)
+        self.assertIn("Mesh has degenerate faces.", errors)
+
+    def test_check_timings(self):
+        validator = GLBMeshValidator(glb_asset(trimesh.creation.icosphere(1)))
+        is_valid, _ = validator.validate()
+        self.assertTrue(is_valid)
+        self.assertEqual(
+            set(validator.timings),
+            {"header_summary", "check_header_contents", "load_mesh", *validator.CHECKS},
+        )
+        self.assertTrue(all(seconds >= 0 for seconds in validator.timings.values()))
+
 
 if __name__ == "__main__":
     unittest.main()
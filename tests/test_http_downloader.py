@@ -0,0 +1,185 @@
+import unittest
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing.pool import ThreadPool
+from pathlib import Path
+from unittest.mock import patch
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_download.http_downloader import HTTPDownloader
+import main
+
+PAYLOAD = bytes(range(256)) * 64
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("Range")))
+        server.connections.add(self.client_address)
+        if server.failures > 0:
+            server.failures -= 1
+            self.send_error(503)
+            return
+        if self.path.endswith("missing.glb"):
+            self.send_error(404)
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(PAYLOAD):
+                self.send_response(416)
+                if server.content_range:
+                    self.send_header("Content-Range", f"bytes */{len(PAYLOAD)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        body = PAYLOAD[start:]
+        self.send_response(206 if range_header else 200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.server.requests.append((self.path, "HEAD"))
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestHTTPDownloader(unittest.TestCase):
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.requests = []
+        self.server.connections = set()
+        self.server.failures = 0
+        self.server.content_range = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/glbs/{{objaverse_id}}"
+        self.tmp = tempfile.TemporaryDirectory()
+        self.downloader = HTTPDownloader(retry_attempts=3, timeout=5, backoff=0)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp.cleanup()
+
+    def test_connections_are_reused(self):
+        for i in range(3):
+            path = Path(self.tmp.name) / f"{i}.glb"
+            self.downloader.download(self.url.format(objaverse_id=f"{i}.glb"), path)
+            self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_resume_partial_file(self):
+        path = Path(self.tmp.name) / "partial.glb"
+        path.write_bytes(PAYLOAD[:1000])
+        self.downloader.download(self.url.format(objaverse_id="partial.glb"), path)
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertEqual(self.server.requests[-1][1], "bytes=1000-")
+
+        self.downloader.download(self.url.format(objaverse_id="partial.glb"), path)
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+
+    def test_complete_partial_file_is_verified(self):
+        url = self.url.format(objaverse_id="complete.glb")
+        for content_range in (True, False):
+            with self.subTest(content_range=content_range):
+                self.server.content_range = content_range
+                self.server.requests.clear()
+                path = Path(self.tmp.name) / "complete.glb"
+                # A 416 for a file of the right size accepts it
+                path.write_bytes(PAYLOAD)
+                self.downloader.download(url, path)
+                self.assertEqual(path.read_bytes(), PAYLOAD)
+
+                # A larger file, e.g. of an older resource, is downloaded again
+                path.write_bytes(PAYLOAD + b"stale")
+                self.downloader.download(url, path)
+                self.assertEqual(path.read_bytes(), PAYLOAD)
+                self.assertEqual(self.server.requests[-1], ("/glbs/complete.glb", None))
+                heads = [r for r in self.server.requests if r[1] == "HEAD"]
+                self.assertEqual(len(heads), 0 if content_range else 2)
+
+    def test_retry_attempts(self):
+        self.server.failures = 2
+        path = Path(self.tmp.name) / "retry.glb"
+        self.downloader.download(self.url.format(objaverse_id="retry.glb"), path)
+        self.assertEqual(path.read_bytes(), PAYLOAD)
+        self.assertEqual(len(self.server.requests), 3)
+
+    @patch("main.download_cache_dir", None)
+    def test_download_glb_file_result(self):
+        with patch("main.OBJAVERSE_GLB_URL", self.url), patch(
+            "main.downloader", self.downloader
+        ):
+            index, objaverse_id, path, success, error = main.download_glb_file(
+                ("0/1", "000-1/good.glb", self.tmp.name)
+            )
+            self.assertTrue(success, error)
+            self.assertEqual(path, Path(self.tmp.name) / "downloads" / "good.glb")
+            self.assertEqual(path.read_bytes(), PAYLOAD)
+
+            # A cached file is not downloaded again
+            requests = len(self.server.requests)
+            result = main.download_glb_file(("0/1", "000-1/good.glb", self.tmp.name))
+            self.assertEqual(result, ("0/1", "000-1/good.glb", path, True, ""))
+            self.assertEqual(len(self.server.requests), requests)
+
+            _, _, path, success, error = main.download_glb_file(
+                ("0/2", "000-1/missing.glb", self.tmp.name)
+            )
+            self.assertFalse(success)
+            self.assertIsNone(path)
+            self.assertIn("404", error)
+            self.assertFalse(Path(self.tmp.name, "downloads", "missing.glb").exists())
+
+    @patch("main.download_cache_dir", None)
+    def test_concurrent_writers_download_once(self):
+        args = ("0/1", "000-1/good.glb", self.tmp.name)
+        with patch("main.OBJAVERSE_GLB_URL", self.url), patch(
+            "main.downloader", self.downloader
+        ), ThreadPool(4) as pool:
+            results = pool.map(main.download_glb_file, [args] * 4)
+
+        self.assertTrue(all(success for _, _, _, success, _ in results))
+        self.assertEqual(len(self.server.requests), 1)
+        downloads = Path(self.tmp.name) / "downloads"
+        self.assertEqual([p.name for p in downloads.iterdir()], ["good.glb"])
+        self.assertEqual((downloads / "good.glb").read_bytes(), PAYLOAD)
+
+    @patch("main.download_cache_dir", None)
+    def test_download_glb_file_resumes_after_failure(self):
+        self.server.failures = 3
+        args = ("0/1", "000-1/good.glb", self.tmp.name)
+        with patch("main.OBJAVERSE_GLB_URL", self.url), patch(
+            "main.downloader", self.downloader
+        ):
+            partial_path = Path(self.tmp.name) / "downloads" / "good.glb.part"
+            partial_path.parent.mkdir()
+            partial_path.write_bytes(PAYLOAD[:1000])
+            self.assertFalse(main.download_glb_file(args)[3])
+            # The partial file is kept and resumed by the next attempt
+            self.assertTrue(partial_path.exists())
+
+            _, _, path, success, error = main.download_glb_file(args)
+            self.assertTrue(success, error)
+            self.assertEqual(path.read_bytes(), PAYLOAD)
+            self.assertEqual(self.server.requests[-1][1], "bytes=1000-")
+            self.assertFalse(partial_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
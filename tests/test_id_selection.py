@@ -0,0 +1,78 @@
+import json
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from pipeline.id_selection import (
+    iter_json_array,
+    iter_json_items,
+    select_work,
+    shard_of,
+)
+
+
+class TestIDSelection(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.mapping = {f"{i // 100}/{i}": f"obj{i}" for i in range(1000)}
+        self.selected = [index for i, index in enumerate(self.mapping) if i % 3]
+        self.mapping_path = self.write("mapping.json", self.mapping)
+        self.selected_path = self.write("selected.json", self.selected)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data, indent=4):
+        path = self.root / name
+        path.write_text(json.dumps(data, indent=indent))
+        return path
+
+    def test_streaming_matches_json_load(self):
+        data = {"a": [1, {"b": "x, y]"}], "n": 12345678, "s": "é", "e": {}}
+        path = self.write("nested.json", data, indent=None)
+        for chunk_size in (1, 3, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(dict(iter_json_items(path, chunk_size)), data)
+                self.assertEqual(
+                    list(iter_json_array(self.selected_path, chunk_size)),
+                    self.selected,
+                )
+        self.assertEqual(list(iter_json_array(self.write("empty.json", []))), [])
+
+    def test_truncated_file(self):
+        path = self.root / "truncated.json"
+        path.write_text('["0/1", "0/2"')
+        with self.assertRaises(ValueError):
+            list(iter_json_array(path))
+
+    def test_select_work(self):
+        skip = {self.selected[0]}
+        work = list(select_work(self.mapping_path, self.selected_path, skip_ids=skip))
+        expected = [
+            (index, self.mapping[index]) for index in self.selected if index not in skip
+        ]
+        self.assertEqual(work, expected)
+
+    def test_shards_partition_the_id_space(self):
+        shards = [
+            list(select_work(self.mapping_path, self.selected_path, shard_index=k, num_shards=4))
+            for k in range(4)
+        ]
+        self.assertTrue(all(shards))
+        indices = [index for shard in shards for index, _ in shard]
+        self.assertEqual(sorted(indices), sorted(self.selected))
+        for k, shard in enumerate(shards):
+            self.assertTrue(all(shard_of(index, 4) == k for index, _ in shard))
+
+        with self.assertRaises(ValueError):
+            list(select_work(self.mapping_path, self.selected_path, shard_index=4, num_shards=4))
+
+
+if __name__ == "__main__":
+    unittest.main()
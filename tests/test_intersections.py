@@ -0,0 +1,59 @@
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.intersections import colliding_faces, colliding_faces_fcl
+
+
+def sample_meshes():
+    rng = np.random.default_rng(0)
+    return {
+        "sphere": trimesh.creation.icosphere(2),
+        "offset_sphere": trimesh.creation.icosphere(2).apply_translation([2, 1, 0.5]),
+        "offset_box": trimesh.creation.box().apply_translation([3, 0, 0]),
+        "overlapping_boxes": trimesh.util.concatenate(
+            [
+                trimesh.creation.box(),
+                trimesh.creation.box().apply_translation([0.3, 0.2, 0.1]),
+            ]
+        ),
+        "torus": trimesh.creation.torus(1, 0.3).apply_translation([0.2, -0.4, 0.7]),
+        "triangle_soup": trimesh.Trimesh(
+            rng.random((300, 3)), np.arange(300).reshape(-1, 3)
+        ),
+    }
+
+
+class TestIntersections(unittest.TestCase):
+
+    def test_parity_with_fcl(self):
+        offset = GLBMeshValidator.OFFSET_SCALE_FACTOR
+        for name, mesh in sample_meshes().items():
+            with self.subTest(mesh=name):
+                expected = colliding_faces_fcl(mesh.vertices, mesh.faces, offset)
+                actual = colliding_faces(
+                    mesh.vertices, mesh.faces, offset, convex=mesh.is_convex
+                )
+                np.testing.assert_array_equal(actual, expected)
+
+    def test_severity_threshold(self):
+        mesh = sample_meshes()["triangle_soup"]
+
+        validator = GLBMeshValidator("unused.glb")
+        self.assertFalse(validator.detect_severe_self_intersections(mesh))
+        self.assertIn("Severe self-intersections", validator.errors[0])
+
+        validator = GLBMeshValidator("unused.glb")
+        validator.SEVERITY_THRESHOLD = 1.0
+        self.assertTrue(validator.detect_severe_self_intersections(mesh))
+
+
+if __name__ == "__main__":
+    unittest.main()
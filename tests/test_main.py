@@ -1,5 +1,8 @@
+import json
 import unittest
 import sys
+import tempfile
+from multiprocessing import Pool
 from unittest.mock import patch, MagicMock
 from pathlib import Path
 
@@ -9,26 +12,229 @@ sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
 import main
 
 
+def fake_download(args):
+    index, objaverse_id, save_dir = args
+    if index == "bad":
+        return index, objaverse_id, None, False, "404"
+    return index, objaverse_id, Path(save_dir) / objaverse_id, True, ""
+
+
+def fake_validate(args):
+    index, objaverse_id, file_path, save_dir = args
+    return index, objaverse_id, file_path.name == objaverse_id, ""
+
+
+class LocalObjaverse:
+    """Stand-in for the objaverse module serving UIDs and GLBs from a local directory."""
+
+    def __init__(self, root, count=10):
+        self.root = Path(root)
+        self.uids = [f"uid{i}" for i in range(count)]
+        self.annotation_calls = []
+        self.object_calls = []
+
+    def load_uids(self):
+        return list(self.uids)
+
+    def load_annotations(self, uids):
+        self.annotation_calls.append(list(uids))
+        # Every other model has textures
+        return {
+            uid: {"archives": {"glb": {"textureCount": int(uid[3:]) % 2}}}
+            for uid in uids
+        }
+
+    def load_objects(self, uids, download_processes=1):
+        self.object_calls.append(list(uids))
+        paths = {}
+        for uid in uids:
+            if uid == "uid5":
+                continue
+            path = self.root / "cache" / f"{uid}.glb"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"glTF")
+            paths[uid] = str(path)
+        return paths
+
+
+def fake_validate_objaverse(args):
+    uid, objaverse_id, file_path, save_dir = args
+    return uid, objaverse_id, file_path.exists() and uid != "uid3", ""
+
+
+def marking_validate(args):
+    # Runs in a validation worker; leaves a marker the test process can see
+    index, objaverse_id, file_path, save_dir = args
+    (Path(save_dir) / f"{index.replace('/', '_')}.validated").touch()
+    return index, objaverse_id, True, ""
+
+
 class TestMain(unittest.TestCase):
 
-    @patch("main.objaverse.load_uids", return_value=["uid1", "uid2", "uid3"])
-    @patch("main.download_glb_file")
-    @patch("main.validate_and_convert_glb")
-    def test_main_flow(self, mock_validate, mock_download, mock_load_uids):
-        mock_download.return_value = ("uid1", "obj1", "datasets/uid1.glb", True, "")
-        mock_validate.return_value = ("uid1", "obj1", True, "")
+    @patch("main.setup_logging")
+    @patch("main.download_glb_file", fake_download)
+    @patch("main.validate_and_convert_glb", marking_validate)
+    @patch.multiple(
+        "main",
+        manifest=None,
+        metrics=None,
+        validation_cache=None,
+        dedup_index=None,
+        download_cache_dir=None,
+    )
+    def test_main_flow(self, mock_setup_logging):
+        with tempfile.TemporaryDirectory() as tmp:
+            save_dir = str(Path(tmp) / "datasets")
+            config_path = Path(tmp) / "config.json"
+            config_path.write_text(
+                json.dumps(
+                    {
+                        "download_dir": save_dir,
+                        "max_models": 2,
+                        "validation_workers": 1,
+                        "download_workers": 1,
+                    }
+                )
+            )
+            stand_in = LocalObjaverse(tmp, count=4)
+            select_work = MagicMock(return_value=iter([("0/1", "obj1")]))
+            with patch("main.objaverse", stand_in), patch(
+                "main.select_work", select_work
+            ):
+                main.main(main.parse_args(["--config", str(config_path)]))
 
-        # Run main function
-        main.main()
+            # Both sources were processed, and every output stayed in the temp dir
+            self.assertEqual(stand_in.object_calls, [["uid1", "uid3"]])
+            self.assertEqual(
+                sorted(p.name for p in Path(save_dir).glob("*.validated")),
+                ["0_1.validated", "uid1.validated", "uid3.validated"],
+            )
+            self.assertTrue((Path(save_dir) / "manifest.sqlite").exists())
+            self.assertTrue((Path(save_dir) / "run_report.json").exists())
 
-        # Check if download was triggered
-        mock_download.assert_called_with(("uid1", "obj1", "datasets"))
+    @patch("main.download_glb_file", fake_download)
+    @patch("main.validate_and_convert_glb", fake_validate)
+    def test_stream_download_and_validate(self):
+        download_args = (
+            (index, f"obj{index}", "datasets") for index in ["bad", "1", "2", "3"]
+        )
+        results = main.stream_download_and_validate(
+            download_args,
+            "datasets",
+            download_workers=2,
+            validation_workers=2,
+            max_pending=2,
+        )
+        results = {index: (success, error) for index, _, success, error in results}
+
+        self.assertEqual(
+            results,
+            {"bad": (False, "404"), "1": (True, ""), "2": (True, ""), "3": (True, "")},
+        )
+
+    def test_select_textured_uids(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stand_in = LocalObjaverse(tmp, count=100)
+            cache_path = Path(tmp) / "textured.jsonl"
+            with patch("main.objaverse", stand_in):
+                selected = main.select_textured_uids(
+                    stand_in.uids, 3, cache_path, batch_size=4
+                )
+                self.assertEqual(selected, ["uid1", "uid3", "uid5"])
+                # Stops loading annotations once enough models are found
+                self.assertEqual(sum(map(len, stand_in.annotation_calls)), 8)
+                # One appended line per batch
+                self.assertEqual(len(cache_path.read_text().splitlines()), 2)
+
+                selected = main.select_textured_uids(
+                    stand_in.uids, 3, cache_path, batch_size=4
+                )
+                self.assertEqual(selected, ["uid1", "uid3", "uid5"])
+                self.assertEqual(len(stand_in.annotation_calls), 2)
+
+                # A line cut off by an interrupted run only costs its batch
+                with open(cache_path, "a") as file:
+                    file.write('{"uid9": tr')
+
+                self.assertEqual(
+                    len(main.select_textured_uids(stand_in.uids, None, cache_path)), 50
+                )
 
-        # Check if validation was triggered
-        mock_validate.assert_called_with(
-            ("uid1", "obj1", "datasets/uid1.glb", "datasets")
+    @patch("main.validate_and_convert_glb", fake_validate_objaverse)
+    @patch("main.download_cache_dir", None)
+    def test_stream_objaverse_models(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            stand_in = LocalObjaverse(tmp)
+            uids = ["uid1", "uid3", "uid5", "uid7", "uid9"]
+            with patch("main.objaverse", stand_in), Pool(processes=2) as pool:
+                results = main.stream_objaverse_models(
+                    uids, tmp, pool, batch_size=2, download_processes=1
+                )
+                results = {uid: success for uid, _, success, _ in results}
+
+            self.assertEqual(
+                results,
+                {"uid1": True, "uid3": False, "uid5": False, "uid7": True, "uid9": True},
+            )
+            self.assertEqual(stand_in.object_calls, [uids[0:2], uids[2:4], uids[4:]])
+            # Downloads are kept in the download cache, also for invalid models
+            self.assertTrue((Path(tmp) / "downloads" / "uid1.glb").exists())
+            self.assertTrue((Path(tmp) / "downloads" / "uid3.glb").exists())
+
+            # Cached models are not downloaded again
+            stand_in.object_calls.clear()
+            with patch("main.objaverse", stand_in), Pool(processes=2) as pool:
+                results = main.stream_objaverse_models(
+                    uids, tmp, pool, batch_size=2, download_processes=1
+                )
+                self.assertEqual(sum(success for _, _, success, _ in results), 3)
+            self.assertEqual(stand_in.object_calls, [["uid5"]])
+
+    def test_node_paths(self):
+        self.assertEqual(
+            main.node_path("datasets/manifest.sqlite", 2, 8),
+            Path("datasets/manifest.node-2-of-8.sqlite"),
+        )
+        self.assertEqual(
+            main.node_path("datasets/shards", 0, 1), Path("datasets/shards")
         )
 
+    @patch("main.setup_logging")
+    def test_merge_node_outputs(self, mock_setup_logging):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = {
+                "download_dir": tmp,
+                "manifest_path": f"{tmp}/manifest.sqlite",
+                "shard_dir": "",
+            }
+            config_path = Path(tmp) / "config.json"
+            config_path.write_text(json.dumps(config))
+            for node in range(2):
+                path = main.node_path(config["manifest_path"], node, 2)
+                node_manifest = main.JobManifest(path)
+                node_manifest.record(f"{node}/1", "a.glb", "exported", True)
+
+            main.main(
+                main.parse_args(
+                    ["--config", str(config_path), "--merge", "--num-shards", "2"]
+                )
+            )
+            merged = main.JobManifest(config["manifest_path"])
+            self.assertEqual(merged.exported_ids(), ["0/1", "1/1"])
+
+    def test_merge_needs_several_nodes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = {
+                "download_dir": tmp,
+                "manifest_path": f"{tmp}/manifest.sqlite",
+                "shard_dir": f"{tmp}/shards",
+            }
+            (Path(tmp) / "shards").mkdir()
+            (Path(tmp) / "shards" / "index.jsonl").write_text("")
+            with self.assertRaises(ValueError):
+                main.merge_node_outputs(config, 1)
+            self.assertTrue((Path(tmp) / "shards" / "index.jsonl").exists())
+
 
 if __name__ == "__main__":
     unittest.main()
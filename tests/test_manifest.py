@@ -0,0 +1,103 @@
+import unittest
+import sys
+import tempfile
+from multiprocessing import Pool
+from pathlib import Path
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from pipeline.manifest import ERRORED, JobManifest
+
+
+def record_export(args):
+    manifest, index = args
+    manifest.record(index, f"obj{index}", "exported", True)
+
+
+class TestJobManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.manifest = JobManifest(Path(self.tmp.name) / "manifest.sqlite")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_finished_ids(self):
+        manifest = self.manifest
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        manifest.record("0/1", "a.glb", "validated", True)
+        manifest.record("0/1", "a.glb", "textures_extracted", True)
+        manifest.record("0/1", "a.glb", "exported", True)
+        manifest.record("0/2", "b.glb", "downloaded", True, content_hash="h2")
+        manifest.record("0/2", "b.glb", "validated", False, ["Too many faces (70000)."])
+        manifest.record("0/3", "c.glb", "downloaded", False, "404 Client Error")
+        manifest.record("0/4", "d.glb", "downloaded", True, content_hash="h4")
+
+        self.assertEqual(manifest.finished_ids(), {"0/1", "0/2"})
+        self.assertEqual(manifest.get("0/2")["error"], "Too many faces (70000).")
+        self.assertEqual(manifest.get("0/3")["downloaded"], 0)
+        self.assertIsNone(manifest.get("0/5"))
+        self.assertEqual(
+            manifest.counts()["downloaded"], {"succeeded": 3, "failed": 1}
+        )
+
+    def test_errored_stages_are_retried(self):
+        manifest = self.manifest
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        manifest.record(
+            "0/1", "a.glb", "validated", False, "Error loading mesh: EOF", retry=True
+        )
+        manifest.record("0/2", "b.glb", "downloaded", True, content_hash="h2")
+        manifest.record("0/2", "b.glb", "validated", False, "Mesh is empty.")
+
+        self.assertEqual(manifest.finished_ids(), {"0/2"})
+        self.assertEqual(manifest.get("0/1")["validated"], ERRORED)
+        self.assertEqual([row[0] for row in manifest.validated_objects()], ["0/2"])
+        self.assertEqual(manifest.counts()["validated"], {"succeeded": 0, "failed": 2})
+
+    def test_new_content_resets_later_stages(self):
+        manifest = self.manifest
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        manifest.record("0/1", "a.glb", "exported", True)
+
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        self.assertEqual(manifest.get("0/1")["exported"], 1)
+
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h2")
+        self.assertIsNone(manifest.get("0/1")["exported"])
+        self.assertEqual(manifest.get("0/1")["content_hash"], "h2")
+
+    def test_record_many(self):
+        manifest = self.manifest
+        manifest.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        manifest.record_many("validated", [
+            ("0/1", "a.glb", False, ["Too many faces (320)."]),
+            ("0/2", "b.glb", True, ""),
+        ])
+        self.assertEqual(manifest.get("0/1")["content_hash"], "h1")
+        self.assertEqual(manifest.get("0/1")["error"], "Too many faces (320).")
+        self.assertEqual(manifest.counts()["validated"], {"succeeded": 1, "failed": 1})
+
+    def test_merge_keeps_latest_row(self):
+        other = JobManifest(Path(self.tmp.name) / "manifest.node-1-of-2.sqlite")
+        self.manifest.record("0/1", "a.glb", "downloaded", False, "timeout")
+        other.record("0/1", "a.glb", "downloaded", True, content_hash="h1")
+        other.record("0/2", "b.glb", "validated", False, "Too many faces (70000).")
+        self.manifest.record("0/2", "b.glb", "downloaded", False, "newer")
+
+        self.assertEqual(self.manifest.merge(other.path), 1)
+        self.assertEqual(self.manifest.get("0/1")["downloaded"], 1)
+        self.assertEqual(self.manifest.get("0/2")["error"], "newer")
+        self.assertEqual(self.manifest.counts()["downloaded"], {"succeeded": 1, "failed": 1})
+
+    def test_shared_with_worker_processes(self):
+        self.manifest.finished_ids()
+        with Pool(processes=2) as pool:
+            pool.map(record_export, [(self.manifest, str(i)) for i in range(8)])
+        self.assertEqual(self.manifest.finished_ids(), {str(i) for i in range(8)})
+
+
+if __name__ == "__main__":
+    unittest.main()
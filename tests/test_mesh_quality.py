@@ -0,0 +1,90 @@
+import json
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.mesh_quality import face_quality, quality_summary
+from helpers import glb_asset
+
+EQUILATERAL = [[0, 0, 0], [1, 0, 0], [0.5, np.sqrt(3) / 2, 0]]
+SLIVER = [[0, 0, 0], [1, 0, 0], [0.5, 0.01, 0]]
+DEGENERATE = [[0, 0, 0], [1, 0, 0], [2, 0, 0]]
+
+
+def sphere_with_slivers(count):
+    """Returns an icosphere with `count` of its faces flattened into slivers."""
+    sphere = trimesh.creation.icosphere(2)
+    triangles = sphere.triangles.copy()
+    triangles[:count, 2] = triangles[:count, :2].mean(axis=1) + 1e-4
+    return trimesh.Trimesh(**trimesh.triangles.to_kwargs(triangles), process=False)
+
+
+class TestMeshQuality(unittest.TestCase):
+
+    def test_face_quality(self):
+        quality = face_quality(np.array([EQUILATERAL, SLIVER, DEGENERATE]))
+        np.testing.assert_allclose(quality["edge_lengths"][0], [1, 1, 1])
+        np.testing.assert_allclose(quality["area"], [np.sqrt(3) / 4, 0.005, 0])
+        self.assertAlmostEqual(quality["aspect_ratio"][0], 1.0)
+        self.assertGreater(quality["aspect_ratio"][1], 50)
+        self.assertEqual(quality["aspect_ratio"][2], np.inf)
+        np.testing.assert_allclose(
+            quality["min_angle"], [60, np.degrees(np.arctan(0.02)), 0], atol=1e-9
+        )
+
+    def test_face_quality_matches_trimesh(self):
+        mesh = trimesh.creation.icosphere(2)
+        quality = face_quality(mesh.triangles)
+        np.testing.assert_allclose(quality["area"], mesh.area_faces)
+        np.testing.assert_allclose(
+            quality["min_angle"], np.degrees(mesh.face_angles.min(axis=1)), atol=1e-9
+        )
+
+    def test_quality_summary(self):
+        summary = quality_summary(face_quality(np.array([EQUILATERAL, DEGENERATE])))
+        self.assertEqual(summary["faces"], 2)
+        self.assertAlmostEqual(summary["aspect_ratio"]["min"], 1.0)
+        self.assertIsNone(summary["aspect_ratio"]["max"])
+        self.assertEqual(summary["min_angle"]["p1"], 0.0)
+        json.dumps(summary, allow_nan=False)
+
+        empty = quality_summary(face_quality(np.empty((0, 3, 3))))
+        self.assertEqual(empty, {"faces": 0, "total_area": 0.0})
+
+    def test_percentile_thresholds(self):
+        # 2% slivers fall outside the 95th percentile but not the 99th
+        mesh = sphere_with_slivers(len(trimesh.creation.icosphere(2).faces) // 50)
+
+        validator = GLBMeshValidator(glb_asset(mesh))
+        validator.MAX_ASPECT_RATIO = 3.0
+        validator.MIN_ANGLE_DEGREES = 20.0
+        is_valid, errors = validator.validate()
+        self.assertTrue(is_valid, errors)
+        self.assertGreater(validator.quality_summary()["aspect_ratio"]["max"], 100)
+
+        validator = GLBMeshValidator(glb_asset(mesh))
+        validator.QUALITY_PERCENTILE = 99
+        validator.MAX_ASPECT_RATIO = 3.0
+        is_valid, errors = validator.validate()
+        self.assertFalse(is_valid)
+        self.assertEqual(
+            errors, ["Mesh contains faces with high aspect ratios (thin or stretched)."]
+        )
+
+    def test_edge_length_range(self):
+        validator = GLBMeshValidator(glb_asset(trimesh.creation.icosphere(2)))
+        validator.EDGE_LENGTH_RANGE = (0.5, 10)
+        is_valid, errors = validator.validate()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["Mesh has extremely short edges."])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import sys
+import tempfile
+from multiprocessing import Pool
+from pathlib import Path
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from pipeline.metrics import RunMetrics, start_worker_profiling
+
+
+def record_object(args):
+    metrics, i = args
+    metrics.record(
+        f"0/{i}",
+        {"download": 0.1 * i, "validate": 1.0, "check:load_mesh": 0.5},
+        {"download": 1000},
+    )
+    return sum(range(1000))
+
+
+class TestRunMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.metrics = RunMetrics(self.root / "metrics.sqlite", run_id="run")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_report_aggregates_worker_processes(self):
+        with Pool(processes=2) as pool:
+            pool.map(record_object, [(self.metrics, i) for i in range(1, 11)])
+        RunMetrics(self.metrics.path, run_id="other").record("0/1", {"download": 99.0})
+
+        report = self.metrics.report(elapsed=2.0, slowest=3)
+        self.assertEqual(report["objects"], 10)
+        self.assertEqual(report["bytes_downloaded"], 10000)
+        self.assertAlmostEqual(report["download_mb_per_second"], 0.005)
+
+        download = report["stages"]["download"]
+        self.assertEqual(download["count"], 10)
+        self.assertAlmostEqual(download["p50"], 0.55)
+        self.assertAlmostEqual(download["max"], 1.0)
+        self.assertAlmostEqual(download["per_second"], 5.0)
+        self.assertIn("check:load_mesh", report["stages"])
+
+        # Validator checks are part of "validate" and not counted twice per object
+        slowest = report["slowest_objects"]
+        self.assertEqual([entry["index_id"] for entry in slowest], ["0/10", "0/9", "0/8"])
+        self.assertAlmostEqual(slowest[0]["seconds"], 2.0)
+
+    def test_worker_profiling(self):
+        profile_dir = self.root / "profiles"
+        pool = Pool(
+            processes=1,
+            initializer=start_worker_profiling,
+            initargs=(profile_dir, True),
+        )
+        pool.map(record_object, [(self.metrics, 1)])
+        pool.close()
+        pool.join()
+        self.assertEqual(len(list(profile_dir.glob("worker-*.prof"))), 1)
+        self.assertEqual(len(list(profile_dir.glob("worker-*.tracemalloc.txt"))), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,171 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import main
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.revalidation import measurement_arrays, redecide
+from glb_checker.validation_cache import ValidationCache
+from pipeline.manifest import JobManifest
+from helpers import degenerate_box, glb_asset
+
+
+def flipped_sphere():
+    sphere = trimesh.creation.icosphere(1)
+    faces = sphere.faces.copy()
+    faces[:10] = faces[:10, ::-1]
+    return trimesh.Trimesh(sphere.vertices, faces, process=False)
+
+
+MESHES = {
+    "sphere": lambda: trimesh.creation.icosphere(2),
+    "fine_sphere": lambda: trimesh.creation.icosphere(3),
+    "degenerate": degenerate_box,
+    "flipped": flipped_sphere,
+}
+
+
+def configure(validator, settings):
+    for name, value in settings.items():
+        setattr(validator, name, value)
+    return validator
+
+
+class TestRevalidation(unittest.TestCase):
+
+    def validate_all(self, cache, settings=None, fail_fast=True):
+        assets = [glb_asset(build(), f"{name}.glb") for name, build in MESHES.items()]
+        for asset in assets:
+            validator = GLBMeshValidator(asset, cache=cache, fail_fast=fail_fast)
+            configure(validator, settings or {}).validate()
+        return assets
+
+    def assert_matches_full_validation(self, cache, assets, settings, fail_fast=True):
+        validator = configure(GLBMeshValidator(None, fail_fast=fail_fast), settings)
+        hashes = [asset.content_hash for asset in assets]
+        values, present = measurement_arrays(validator, cache, hashes)
+        is_valid, needs_geometry, errors = redecide(validator, values, present)
+        self.assertFalse(needs_geometry.any())
+
+        for i, asset in enumerate(assets):
+            fresh = GLBMeshValidator(asset, fail_fast=fail_fast)
+            expected = configure(fresh, settings).validate()
+            self.assertEqual((bool(is_valid[i]), errors[i]), expected, asset.path)
+
+    def test_validation_stores_measurements(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ValidationCache(Path(tmp) / "cache.sqlite")
+            asset = glb_asset(trimesh.creation.icosphere(2))
+            validator = GLBMeshValidator(asset, cache=cache)
+            self.assertTrue(validator.validate()[0])
+
+            logic = validator.measurement_logic("face_count")
+            self.assertEqual(cache.get_measurements("face_count", logic), {
+                asset.content_hash: 320.0
+            })
+            self.assertEqual(validator.measurements["winding_consistent"], 1.0)
+            self.assertEqual(validator.measurements["colliding_faces"], 0.0)
+
+    def test_redecide_matches_full_validation(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for fail_fast in (True, False):
+                cache = ValidationCache(Path(tmp) / f"cache_{fail_fast}.sqlite")
+                assets = self.validate_all(cache, fail_fast=fail_fast)
+                for settings in (
+                    {},
+                    {"MAX_FACES": 1000},
+                    {"MAX_FACES": 100, "SEVERITY_THRESHOLD": 0.0},
+                    {"MAX_ASPECT_RATIO": 1.1, "EDGE_LENGTH_RANGE": (0.0, 0.3)},
+                ):
+                    with self.subTest(fail_fast=fail_fast, settings=settings):
+                        self.assert_matches_full_validation(
+                            cache, assets, settings, fail_fast
+                        )
+
+    def test_changed_measuring_settings_need_geometry(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ValidationCache(Path(tmp) / "cache.sqlite")
+            assets = self.validate_all(cache, {"MAX_FACES": 1000})
+
+            validator = GLBMeshValidator(None)
+            validator.OFFSET_SCALE_FACTOR = 1e-4
+            hashes = [asset.content_hash for asset in assets]
+            values, present = measurement_arrays(validator, cache, hashes)
+            _, needs_geometry, _ = redecide(validator, values, present)
+            # Only the meshes that reached the intersection check are measured again;
+            # the fine sphere was rejected for its face count from the header
+            self.assertEqual(
+                dict(zip(MESHES, needs_geometry.tolist())),
+                {"sphere": True, "fine_sphere": True, "degenerate": False, "flipped": False},
+            )
+
+    def test_version_bump_is_measured_again(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ValidationCache(Path(tmp) / "cache.sqlite")
+            asset = glb_asset(MESHES["sphere"]())
+            GLBMeshValidator(asset, cache=cache).validate()
+
+            versions = {"check_degenerate_faces": 2}
+            with patch.object(GLBMeshValidator, "MEASUREMENT_VERSIONS", versions):
+                validator = GLBMeshValidator(None)
+                values, present = measurement_arrays(
+                    validator, cache, [asset.content_hash]
+                )
+                _, needs_geometry, _ = redecide(validator, values, present)
+                self.assertEqual(needs_geometry.tolist(), [True])
+
+                # The rerun of a reset object measures instead of reusing the verdict
+                rerun = GLBMeshValidator(glb_asset(MESHES["sphere"]()), cache=cache)
+                self.assertEqual(rerun.validate(), (True, []))
+                self.assertIn("min_face_area", rerun.measurements)
+
+                values, present = measurement_arrays(
+                    validator, cache, [asset.content_hash]
+                )
+                _, needs_geometry, _ = redecide(validator, values, present)
+                self.assertEqual(needs_geometry.tolist(), [False])
+
+    def test_revalidate_command(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = ValidationCache(Path(tmp) / "cache.sqlite")
+            manifest = JobManifest(Path(tmp) / "manifest.sqlite")
+            for index, name in (("0/1", "sphere"), ("0/2", "degenerate")):
+                asset = glb_asset(MESHES[name](), f"{name}.glb")
+                is_valid, errors = GLBMeshValidator(asset, cache=cache).validate()
+                content_hash = asset.content_hash
+                manifest.record(index, name, "downloaded", True, content_hash=content_hash)
+                manifest.record(index, name, "validated", is_valid, errors)
+                if is_valid:
+                    manifest.record(index, name, "exported", True)
+                    (Path(tmp) / index.replace("/", "_")).mkdir()
+
+            with patch.object(main, "manifest", manifest), \
+                    patch.object(main, "validation_cache", cache), \
+                    patch.object(main, "validator_settings", {"MAX_FACES": 100}):
+                counts = main.revalidate(tmp)
+
+            self.assertEqual(
+                counts, {"redecided": 2, "pending": 0, "now_valid": 0, "now_invalid": 1}
+            )
+            row = manifest.get("0/1")
+            self.assertEqual((row["validated"], row["exported"]), (0, None))
+            self.assertEqual(row["error"], "Too many faces (320).")
+            self.assertFalse((Path(tmp) / "0_1").exists())
+
+            # The next run reuses the new decision without loading the mesh
+            validator = GLBMeshValidator(glb_asset(MESHES["sphere"]()), cache=cache)
+            validator.MAX_FACES = 100
+            with patch.object(GLBMeshValidator, "load_mesh") as load_mesh:
+                self.assertEqual(validator.validate(), (False, ["Too many faces (320)."]))
+            load_mesh.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+import unittest
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_asset import GLBAsset
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.scene_merge import merge_scene, scene_instances
+
+
+def box_scene(transforms):
+    """Builds a scene instancing one box per transform, plus an icosphere."""
+    scene = trimesh.Scene()
+    scene.geometry["box"] = trimesh.creation.box()
+    for i, transform in enumerate(transforms):
+        scene.graph.update(
+            frame_to=f"box_{i}",
+            frame_from=scene.graph.base_frame,
+            matrix=transform,
+            geometry="box",
+        )
+    scene.add_geometry(
+        trimesh.creation.icosphere(1),
+        node_name="sphere",
+        transform=trimesh.transformations.translation_matrix([0, 5, 0]),
+    )
+    return scene
+
+
+class TestSceneMerge(unittest.TestCase):
+
+    def test_matches_trimesh_dump(self):
+        transforms = [
+            trimesh.transformations.translation_matrix([3, 0, 0]),
+            trimesh.transformations.rotation_matrix(0.5, [0, 0, 1]),
+            np.diag([-1.0, 2.0, 1.0, 1.0]),  # mirrored and scaled
+        ]
+        scene = box_scene(transforms)
+        merged = merge_scene(scene)
+        expected = trimesh.util.concatenate(scene.dump())
+
+        self.assertEqual(merged.faces.shape, expected.faces.shape)
+        np.testing.assert_allclose(merged.bounds, expected.bounds)
+        self.assertAlmostEqual(merged.area, expected.area)
+        # Mirrored instances keep outward facing normals
+        self.assertAlmostEqual(merged.volume, expected.volume)
+        self.assertGreater(merged.volume, 0)
+        self.assertTrue(merged.is_winding_consistent)
+
+    def test_many_instances(self):
+        offsets = np.random.default_rng(0).random((5000, 3)) * 100
+        scene = box_scene(
+            [trimesh.transformations.translation_matrix(offset) for offset in offsets]
+        )
+        # The instances of one geometry are transformed together, not one by one
+        instances = scene_instances(scene)
+        self.assertEqual([len(t) for _, t in instances], [5000, 1])
+        with patch.object(trimesh.Trimesh, "apply_transform") as apply_transform:
+            merged = merge_scene(scene)
+        apply_transform.assert_not_called()
+
+        self.assertEqual(len(merged.faces), 5000 * 12 + 80)
+        box = instances[0][0]
+        placed = merged.vertices[: 5000 * len(box.vertices)].reshape(5000, -1, 3)
+        np.testing.assert_allclose(placed, box.vertices[None] + offsets[:, None])
+
+    def test_validator_merges_scenes(self):
+        scene = box_scene([trimesh.transformations.translation_matrix([3, 0, 0])])
+        data = scene.export(file_type="glb")
+
+        validator = GLBMeshValidator(GLBAsset("scene.glb", data=data))
+        self.assertFalse(validator.validate()[0])
+        self.assertIn("multiple objects", validator.errors[0])
+
+        asset = GLBAsset("scene.glb", data=data)
+        validator = GLBMeshValidator(asset)
+        validator.MERGE_SCENES = True
+        self.assertEqual(validator.validate(), (True, []))
+        self.assertEqual(len(asset.merged.faces), 12 + 80)
+        np.testing.assert_allclose(asset.merged.bounds, scene.bounds)
+
+
+if __name__ == "__main__":
+    unittest.main()
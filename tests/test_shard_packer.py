@@ -0,0 +1,122 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.utils import save_json
+from mesh_export.binary_mesh import export_binary_mesh, mesh_arrays
+from mesh_export.shard_packer import (
+    ShardReader,
+    ShardWriter,
+    merge_shards,
+    pack_dataset,
+)
+
+
+class TestShardPacker(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_across_shards(self):
+        meshes = {
+            f"0/{i}": trimesh.creation.icosphere(1).apply_scale(i + 1) for i in range(5)
+        }
+        # Small shards force every mesh into a shard of its own
+        with ShardWriter(self.root, max_shard_bytes=1024) as writer:
+            for index_id, mesh in meshes.items():
+                writer.add(index_id, mesh_arrays(mesh), {"scale": index_id})
+            writer.add("empty", {"faces": np.zeros((0, 3), dtype=np.uint32)})
+
+        self.assertEqual(len(list(self.root.glob("shard_*.bin"))), 5)
+        reader = ShardReader(self.root)
+        self.assertEqual(len(reader), 6)
+        for index_id in reversed(list(meshes)):
+            arrays = reader[index_id]
+            for name, array in mesh_arrays(meshes[index_id]).items():
+                np.testing.assert_array_equal(arrays[name], array)
+            self.assertEqual(reader.metadata(index_id), {"scale": index_id})
+        self.assertEqual(reader["empty"]["faces"].shape, (0, 3))
+
+    def test_pack_dataset_is_incremental(self):
+        save_dir = self.root / "datasets"
+        shard_dir = self.root / "shards"
+        mesh = trimesh.creation.box()
+        (save_dir / "0_1").mkdir(parents=True)
+        (save_dir / "0_2").mkdir()
+        export_binary_mesh(mesh, save_dir / "0_1" / "model.mesh")
+        mesh.export(save_dir / "0_2" / "model.obj")
+        save_json(save_dir / "0_2" / "pbr_textures.json", [{"metallic_factor": 0.5}])
+
+        self.assertEqual(pack_dataset(save_dir, shard_dir, ["0/1"]), 1)
+        self.assertEqual(pack_dataset(save_dir, shard_dir, ["0/1", "0/2", "0/3"]), 1)
+
+        reader = ShardReader(shard_dir)
+        self.assertEqual(set(reader.keys()), {"0/1", "0/2"})
+        self.assertIsNone(reader.metadata("0/1"))
+        self.assertEqual(reader.metadata("0/2"), [{"metallic_factor": 0.5}])
+        np.testing.assert_allclose(
+            np.sort(reader["0/2"]["vertices"], axis=0),
+            np.sort(mesh.vertices.astype(np.float32), axis=0),
+        )
+
+    def test_partial_index_entry_is_packed_again(self):
+        mesh = trimesh.creation.box()
+        save_dir = self.root / "datasets"
+        for index_id in ("0/1", "0/2"):
+            folder = save_dir / index_id.replace("/", "_")
+            folder.mkdir(parents=True)
+            export_binary_mesh(mesh, folder / "model.mesh")
+        self.assertEqual(pack_dataset(save_dir, self.root / "shards", ["0/1", "0/2"]), 2)
+
+        # A crash cut off the last entry mid-append
+        index_path = self.root / "shards" / "index.jsonl"
+        index_path.write_text(index_path.read_text()[:-20])
+        self.assertEqual(set(ShardReader(self.root / "shards").keys()), {"0/1"})
+
+        self.assertEqual(pack_dataset(save_dir, self.root / "shards", ["0/1", "0/2"]), 1)
+        reader = ShardReader(self.root / "shards")
+        self.assertEqual(set(reader.keys()), {"0/1", "0/2"})
+        np.testing.assert_array_equal(reader["0/2"]["faces"], mesh_arrays(mesh)["faces"])
+
+    def test_merge_shards(self):
+        arrays = {"faces": np.arange(9, dtype=np.uint32).reshape(3, 3)}
+        with ShardWriter(self.root / "merged") as writer:
+            writer.add("0/0", arrays)
+        for node in range(2):
+            with ShardWriter(self.root / f"node-{node}", max_shard_bytes=1) as writer:
+                for i in range(3):
+                    writer.add(f"{node}/{i}", {"faces": arrays["faces"] + 10 * node + i})
+
+        merged = merge_shards(
+            [self.root / "node-0", self.root / "node-1", self.root / "missing"],
+            self.root / "merged",
+        )
+        self.assertEqual(merged, 5)
+        self.assertFalse((self.root / "node-0").exists())
+
+        reader = ShardReader(self.root / "merged")
+        self.assertEqual(len(reader), 6)
+        np.testing.assert_array_equal(reader["0/0"]["faces"], arrays["faces"])
+        np.testing.assert_array_equal(reader["1/2"]["faces"], arrays["faces"] + 12)
+
+    def test_merge_into_itself_keeps_shards(self):
+        with ShardWriter(self.root / "merged") as writer:
+            writer.add("0/0", {"faces": np.zeros((1, 3), dtype=np.uint32)})
+
+        self.assertEqual(merge_shards([self.root / "merged"], self.root / "merged"), 0)
+        self.assertEqual(list(ShardReader(self.root / "merged").keys()), ["0/0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
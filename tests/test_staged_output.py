@@ -0,0 +1,94 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import trimesh
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import main
+from pipeline.staged_output import StagedOutput
+
+
+def write_glb(path, mesh):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(trimesh.Scene([mesh]).export(file_type="glb"))
+    return path
+
+
+class TestStagedOutput(unittest.TestCase):
+
+    def test_commit_replaces_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp) / "0_1"
+            output_dir.mkdir()
+            (output_dir / "old.json").write_text("{}")
+
+            with StagedOutput(output_dir) as staging:
+                (staging.path / "new.json").write_text("{}")
+                # Nothing is visible before the commit
+                self.assertEqual([p.name for p in output_dir.iterdir()], ["old.json"])
+                staging.commit()
+
+            self.assertEqual([p.name for p in output_dir.iterdir()], ["new.json"])
+            self.assertEqual([p.name for p in Path(tmp).iterdir()], ["0_1"])
+
+    def test_failure_leaves_no_output(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output_dir = Path(tmp) / "0_1"
+            with self.assertRaises(RuntimeError):
+                with StagedOutput(output_dir) as staging:
+                    (staging.path / "partial.json").write_text("{")
+                    raise RuntimeError("export failed")
+            self.assertEqual(list(Path(tmp).iterdir()), [])
+
+    def test_stale_staging_is_removed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # Left by a killed worker
+            stale = StagedOutput(Path(tmp) / "0_1").path
+            other = StagedOutput(Path(tmp) / "0_10").path
+            with StagedOutput(Path(tmp) / "0_1") as staging:
+                self.assertFalse(stale.exists())
+                self.assertTrue(other.exists())
+                self.assertTrue(staging.path.exists())
+
+    def test_failed_export_keeps_download(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            glb_path = write_glb(
+                Path(tmp) / "downloads" / "a.glb", trimesh.creation.icosphere(2)
+            )
+            args = ("0/1", "a.glb", glb_path, tmp)
+            failing_export = patch.object(
+                trimesh.Scene, "export", side_effect=OSError("disk full")
+            )
+            with failing_export:
+                result = main.validate_and_convert_glb(args)
+            self.assertEqual(result, ("0/1", "a.glb", False, "disk full"))
+            self.assertEqual(list(Path(tmp).iterdir()), [Path(tmp) / "downloads"])
+            self.assertTrue(glb_path.exists())
+
+            # A rerun reuses the download and writes every output at once
+            result = main.validate_and_convert_glb(args)
+            self.assertEqual(result, ("0/1", "a.glb", True, ""))
+            self.assertEqual(
+                sorted(p.name for p in (Path(tmp) / "0_1").iterdir()),
+                ["a.obj", "mesh_quality.json", "pbr_textures.json"],
+            )
+
+    def test_invalid_object_keeps_download(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            glb_path = write_glb(
+                Path(tmp) / "downloads" / "b.glb",
+                trimesh.Trimesh([[0, 0, 0], [1, 0, 0], [2, 0, 0]], [[0, 1, 2]]),
+            )
+            args = ("0/2", "b.glb", glb_path, tmp)
+            self.assertFalse(main.validate_and_convert_glb(args)[2])
+            self.assertFalse((Path(tmp) / "0_2").exists())
+            self.assertTrue(glb_path.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+from glb_checker.glb_asset import GLBAsset
+from glb_checker.glb_validator import GLBMeshValidator
+from glb_checker.validation_cache import ValidationCache
+from helpers import box_asset
+
+
+class TestValidationCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ValidationCache(Path(self.tmp.name) / "cache.sqlite", max_entries=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_hit_skips_mesh_loading(self):
+        expected = GLBMeshValidator(box_asset(), cache=self.cache).validate()
+
+        validator = GLBMeshValidator(box_asset(), cache=self.cache)
+        with patch.object(GLBMeshValidator, "load_mesh") as mock_load:
+            self.assertEqual(validator.validate(), expected)
+        mock_load.assert_not_called()
+        self.assertEqual(self.cache.stats(), {"hits": 1, "misses": 1, "entries": 1})
+
+    def test_errors_are_not_cached(self):
+        asset = box_asset()
+        with patch.object(GLBAsset, "scene", property(lambda self: 1 / 0)):
+            validator = GLBMeshValidator(asset, cache=self.cache)
+            is_valid, errors = validator.validate()
+        self.assertFalse(is_valid)
+        self.assertTrue(validator.errored)
+        self.assertEqual(errors, ["Error loading mesh: division by zero"])
+        self.assertEqual(len(self.cache), 0)
+
+        # The next attempt loads the mesh again
+        self.assertTrue(GLBMeshValidator(box_asset(), cache=self.cache).validate()[0])
+
+    def test_fingerprint_changes_with_configuration(self):
+        validator = GLBMeshValidator(box_asset(), cache=self.cache)
+        validator.validate()
+
+        strict = GLBMeshValidator(box_asset(), cache=self.cache)
+        strict.MAX_FACES = 10
+        self.assertNotEqual(strict.fingerprint(), validator.fingerprint())
+        is_valid, errors = strict.validate()
+        self.assertFalse(is_valid)
+        self.assertEqual(errors, ["Too many faces (12)."])
+        # Rejected from the header before the cache is consulted
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(len(self.cache), 2)
+
+    def test_header_rejection_reads_no_geometry(self):
+        path = Path(self.tmp.name) / "box.glb"
+        path.write_bytes(box_asset().data)
+        for content_hash in (None, "known"):
+            asset = GLBAsset(path, content_hash=content_hash)
+            validator = GLBMeshValidator(asset, cache=self.cache)
+            validator.MAX_FACES = 10
+            self.assertEqual(validator.validate(), (False, ["Too many faces (12)."]))
+            self.assertIsNone(asset._data)
+        # Only the result under the known hash is stored, with its measurements
+        self.assertEqual(len(self.cache), 1)
+        logic = validator.measurement_logic("declared_faces")
+        self.assertEqual(
+            self.cache.get_measurements("declared_faces", logic), {"known": 12.0}
+        )
+
+    def test_entry_count_is_kept(self):
+        statements = []
+        self.cache.connection.set_trace_callback(statements.append)
+        for content_hash in "abcab":
+            self.cache.put(content_hash, "f", True, [])
+        self.cache.connection.set_trace_callback(None)
+
+        self.assertFalse(any("COUNT(*)" in statement for statement in statements))
+        self.assertEqual(len(self.cache), 2)
+        count = self.cache.connection.execute("SELECT COUNT(*) FROM results")
+        self.assertEqual(count.fetchone()[0], 2)
+
+    def test_lru_eviction(self):
+        self.cache.put("a", "f", True, [])
+        self.cache.put("b", "f", False, ["Mesh has no faces."])
+        self.cache.get("a", "f")
+        self.cache.put("c", "f", True, [])
+
+        self.assertEqual(len(self.cache), 2)
+        self.assertIsNotNone(self.cache.get("a", "f"))
+        self.assertIsNone(self.cache.get("b", "f"))
+        self.assertEqual(self.cache.get("c", "f"), (True, []))
+
+    def test_lookups_are_written_in_batches(self):
+        self.cache.put("a", "f", True, [])
+        statements = []
+        self.cache.connection.set_trace_callback(statements.append)
+        for _ in range(3):
+            self.cache.get("a", "f")
+        self.cache.get("b", "f")
+        self.assertFalse(any(s.startswith(("UPDATE", "INSERT")) for s in statements))
+
+        self.cache.flush()
+        self.cache.connection.set_trace_callback(None)
+        self.assertEqual(sum(s.startswith("UPDATE results") for s in statements), 1)
+        self.assertEqual(self.cache.stats(), {"hits": 3, "misses": 1, "entries": 1})
+
+    def test_evicted_results_drop_their_measurements(self):
+        self.cache.put("a", "f", True, [])
+        self.cache.put("a", "g", True, [])
+        self.cache.put_measurements("a", {"volume": ("v1", 1.0)})
+        self.cache.put("b", "f", True, [])
+        self.assertEqual(self.cache.get_measurements("volume", "v1"), {"a": 1.0})
+
+        self.cache.put("c", "f", True, [])
+        self.assertEqual(self.cache.get_measurements("volume", "v1"), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,182 @@
+import os
+import signal
+import time
+import unittest
+import sys
+import tempfile
+from multiprocessing import Pool
+from pathlib import Path
+from unittest.mock import patch
+
+# Ensure src directory is in sys.path
+sys.path.append(str(Path(__file__).resolve().parents[1] / "src"))
+
+import main
+from pipeline.manifest import ERRORED, JobManifest
+from pipeline.worker_limits import TaskTimeout, WorkerWatchdog, run_limited
+
+
+def address_space():
+    """Returns the virtual memory size of the calling process in bytes."""
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[0]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def allocate(num_bytes):
+    return len(bytearray(num_bytes))
+
+
+def sleep(seconds):
+    time.sleep(seconds)
+    return seconds
+
+
+def crash():
+    os.kill(os.getpid(), signal.SIGKILL)
+
+
+def ignore_alarm_and_sleep(seconds):
+    signal.signal(signal.SIGALRM, signal.SIG_IGN)
+    time.sleep(seconds)
+
+
+def fake_download(args):
+    index, objaverse_id, save_dir = args
+    return index, objaverse_id, Path(save_dir) / objaverse_id, True, ""
+
+
+def crashing_validate(args):
+    index, objaverse_id, file_path, save_dir = args
+    if index == "2":
+        crash()
+    return index, objaverse_id, True, ""
+
+
+def oversized_validate(args):
+    index, objaverse_id, file_path, save_dir = args
+    if index == "2":
+        raise MemoryError("Task exceeded the worker memory limit")
+    return index, objaverse_id, True, ""
+
+
+def export_format():
+    return main.mesh_export_format
+
+
+class TestWorkerLimits(unittest.TestCase):
+
+    def wait_for_lost(self, watchdog, timeout=10):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            lost = watchdog.lost_tasks()
+            if lost:
+                return lost
+            time.sleep(0.05)
+        return []
+
+    def test_timeout(self):
+        with Pool(1) as pool:
+            result = pool.apply_async(run_limited, (sleep, "slow", (5,), 0.2))
+            with self.assertRaises(TaskTimeout):
+                result.get(timeout=4)
+            # The worker survives and takes the next task
+            self.assertEqual(pool.apply(run_limited, (sleep, "fast", (0,), 1)), 0)
+
+    def test_memory_limit(self):
+        memory_limit = address_space() + 2**30
+        watchdog = WorkerWatchdog()
+        with Pool(1, **watchdog.pool_options(memory_limit)) as pool:
+            with self.assertRaises(MemoryError):
+                pool.apply(run_limited, (allocate, "big", (2**31,)))
+            small = pool.apply(run_limited, (allocate, "small", (2**20,)))
+            self.assertEqual(small, 2**20)
+
+    def test_watchdog_reports_killed_worker(self):
+        watchdog = WorkerWatchdog(grace=0)
+        with Pool(1, **watchdog.pool_options()) as pool:
+            pool.apply_async(run_limited, (crash, "crash", ()))
+            self.assertEqual(self.wait_for_lost(watchdog), ["crash"])
+            # The pool replaced the worker
+            self.assertEqual(pool.apply(run_limited, (sleep, "next", (0,))), 0)
+
+    def test_watchdog_kills_stuck_worker(self):
+        watchdog = WorkerWatchdog(hard_timeout=0.5, grace=0)
+        with Pool(1, **watchdog.pool_options()) as pool:
+            result = pool.apply_async(
+                run_limited, (ignore_alarm_and_sleep, "stuck", (30,), 0.1)
+            )
+            self.assertEqual(self.wait_for_lost(watchdog), ["stuck"])
+            self.assertFalse(result.ready())
+
+    @patch("main.download_glb_file", fake_download)
+    @patch("main.validate_and_convert_glb", crashing_validate)
+    def test_stream_survives_killed_worker(self):
+        watchdog = WorkerWatchdog(grace=0)
+        download_args = ((index, f"obj{index}", "datasets") for index in "1234")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        manifest = JobManifest(Path(tmp.name) / "manifest.sqlite")
+        with patch("main.manifest", manifest), Pool(
+            2, **watchdog.pool_options()
+        ) as pool:
+            results = main.stream_download_and_validate(
+                download_args,
+                "datasets",
+                download_workers=2,
+                validation_workers=None,
+                max_pending=4,
+                validation_pool=pool,
+                watchdog=watchdog,
+            )
+            results = {index: (success, error) for index, _, success, error in results}
+
+        self.assertEqual(
+            results,
+            {
+                "1": (True, ""),
+                "2": (False, main.LOST_TASK_ERROR),
+                "3": (True, ""),
+                "4": (True, ""),
+            },
+        )
+        # The lost object is retried by the next run
+        self.assertEqual(manifest.get("2")["validated"], ERRORED)
+        self.assertNotIn("2", manifest.finished_ids())
+
+    @patch("main.download_glb_file", fake_download)
+    @patch("main.validate_and_convert_glb", oversized_validate)
+    def test_memory_cap_is_a_verdict(self):
+        download_args = ((index, f"obj{index}", "datasets") for index in "12")
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        manifest = JobManifest(Path(tmp.name) / "manifest.sqlite")
+        with patch("main.manifest", manifest), Pool(2) as pool:
+            results = list(
+                main.stream_download_and_validate(
+                    download_args,
+                    "datasets",
+                    download_workers=2,
+                    validation_workers=None,
+                    max_pending=2,
+                    validation_pool=pool,
+                )
+            )
+        self.assertEqual(len(results), 2)
+        # The object would exceed the cap again, so the next run skips it
+        self.assertEqual(manifest.get("2")["validated"], 0)
+        self.assertIn("2", manifest.finished_ids())
+
+    def test_validation_workers_get_settings(self):
+        context = main.validation_context()
+        watchdog = WorkerWatchdog(context=context)
+        settings = dict(main.worker_settings(), mesh_export_format="binary")
+        options = watchdog.pool_options(
+            initializer=main.init_validation_worker, initargs=(settings,)
+        )
+        with context.Pool(1, **options) as pool:
+            self.assertEqual(pool.apply(run_limited, (export_format, "a", ())), "binary")
+        self.assertEqual(watchdog.lost_tasks(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()